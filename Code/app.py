@@ -1,10 +1,34 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import mysql.connector
 from mysql.connector import Error
 import hashlib
-from datetime import datetime
+import json
+import bisect
+import random
+import re
+import sys
+from collections import OrderedDict, deque
+import copy
+from functools import lru_cache, wraps
+from datetime import datetime, date
+from decimal import Decimal, InvalidOperation
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from mysql.connector import FieldType, pooling
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+import os
+import csv
+import tempfile
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+
+# Start of this rerun; the whole script re-executes on every interaction outside a page panel
+_SCRIPT_STARTED = time.perf_counter()
 
 @st.cache_data
 def get_custom_css():
@@ -55,7 +79,185 @@ SESSION_DEFAULTS = {
     'add_to_watchlist_id': None,
     'selected_handler_user': None,
     'db_add_user': False,
-    'previous_page': 'Explore'
+    'previous_page': 'Explore',
+    'last_export': None,
+    'last_import': None
+}
+
+DATABASE_TABLES = ["Users", "Media", "genres", "Episodes", "Watchlists_item", "playlist", "Playlist_item",
+                   "Media_Genres", "Series_Progress_Table", "Reviews_Table", "Friends", "People",
+                   "Media_Cast", "Media_Crew", "Activity_Log"]
+
+EXPORT_CHUNK_SIZE = 5000
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), 'streamsync_exports')
+EXPORT_DOWNLOAD_LIMIT = 200 * 1024 * 1024
+# Export files older than this are deleted at the next export (too large to download ones stay this long)
+EXPORT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Queries at or above this many milliseconds go to the slow-query log
+SLOW_QUERY_MS = 200
+# Fraction of slow queries kept in the log (adjustable on the Performance page)
+SLOW_QUERY_SAMPLE_RATE = 1.0
+SLOW_QUERY_LOG_SIZE = 500
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+RERUN_PROFILE_HISTORY = 200
+# N+1 detection (dev mode): same query shape from the same line this many times in one rerun
+N_PLUS_ONE_MIN_REPEATS = 3
+N_PLUS_ONE_STACK_DEPTH = 6
+# Per-page query budgets checked in dev mode; keys are "page/nav" as shown in rerun profiles
+DEFAULT_QUERY_BUDGET = 25
+PAGE_QUERY_BUDGETS = {
+    'Landing': 2,
+    'Login': 2,
+    'User/Home': 8,
+    'User/Explore': 8,
+    'User/Watchlists': 6,
+    'User/Series': 6,
+    'User/Friends': 8,
+    'Admin/Home': 5,
+    'Admin/Changes': 3,
+    'Admin/Database Handlers': 6,
+    'Database Handler/Home': 8,
+}
+# Budgets for one partial rerun of a page panel (an st.fragment), by panel function name
+PANEL_QUERY_BUDGETS = {
+    'media_cast_crew_panel': 0,
+    'media_episodes_panel': 3,
+    'media_reviews_panel': 2,
+    'watchlist_items_panel': 1,
+    'watch_status_panel': 2,
+    'search_results_panel': 2,
+    'friends_list_panel': 2,
+    'find_friends_panel': 8,
+    'friend_requests_panel': 2,
+    'table_update_panel': 0,
+    'table_delete_panel': 0,
+    'table_batch_panel': 0,
+}
+
+# Watchlist page sort options: label -> (sort expression, direction); media_id breaks ties
+WATCHLIST_SORTS = {
+    'Playlist order': ('pi.position', 'ASC'),
+    'Recently added': ('pi.added_at', 'DESC'),
+    'Rating': ('COALESCE(m.average_rating, -1)', 'DESC'),
+    'Title': ('m.title', 'ASC'),
+}
+WATCHLIST_PAGE_SIZE = 50
+# Cast and crew cards shown on a details page before "Show full cast & crew"
+CAST_PREVIEW_SIZE = 8
+# Long lists (search results, reviews, friends, requests) render this many rows per "Load more"
+LIST_PAGE_SIZE = 24
+# Spacing between playlist positions; a move takes the midpoint of its new neighbours
+PLAYLIST_POSITION_GAP = 1024
+# Playlist IDs are PLS + a zero-padded id_sequence value; each process reserves this many at a time.
+# The S keeps them apart from the older PL<timestamp> and seeded PL<digits> IDs.
+PLAYLIST_ID_PREFIX = 'PLS'
+PLAYLIST_ID_BLOCK = 100
+
+# Per-user watch state kept in Watchlists_item; playlists add 'planned', series progress sets 'watching'
+WATCH_STATUSES = ['planned', 'watching', 'completed', 'dropped']
+WATCH_STATUS_LABELS = {'planned': '🗓️ Planned', 'watching': '▶️ Watching', 'completed': '✅ Completed', 'dropped': '⏹️ Dropped'}
+
+# Process-wide cache for read-mostly catalogue lookups
+CATALOGUE_CACHE_SIZE = 5000
+CATALOGUE_CACHE_TTL = 300
+# Cached kinds each table's writes make stale
+CATALOGUE_DEPENDENCIES = {
+    'genres': ('genres', 'media_details'),
+    'People': ('people', 'media_details'),
+    'Media': ('media_details', 'seasons', 'season_episodes', 'top_rated',
+              'home_recommendations', 'home_progress'),
+    'Media_Genres': ('media_details',),
+    'Media_Cast': ('media_details',),
+    'Media_Crew': ('media_details',),
+    'Episodes': ('seasons', 'season_episodes', 'home_progress'),
+    # Review triggers keep Media.average_rating current
+    'Reviews_Table': ('media_details', 'top_rated', 'home_recommendations'),
+    'playlist': ('home_stats', 'home_watchlists'),
+    'Playlist_item': ('home_watchlists',),
+    'Watchlists_item': ('home_recommendations',),
+    'Series_Progress_Table': ('home_stats', 'home_progress'),
+    'Friends': ('home_stats',),
+    'Users': ('home_stats',),
+}
+# Kinds keyed by media_id, so a write to one title only drops that title
+MEDIA_SCOPED_KINDS = ('media_details', 'seasons', 'season_episodes')
+# Kinds keyed by username, so a user's own writes only drop their entries
+USER_SCOPED_KINDS = ('home_stats', 'home_recommendations', 'home_progress', 'home_watchlists')
+
+# Home dashboard: per-user panels are cached briefly on top of write invalidation,
+# and cache misses run concurrently on a small process-wide connection pool
+DASHBOARD_CACHE_TTL = 60
+DASHBOARD_WORKERS = 4
+DASHBOARD_POOL_SIZE = 8
+
+IMPORT_CHUNK_SIZE = 5000
+IMPORT_INSERT_BATCH = 1000
+IMPORT_MAX_REJECTS = 10000
+
+# Column rules for bulk import: (kind, constraint, required)
+IMPORT_SCHEMAS = {
+    'Media': {
+        'key': ['media_id'],
+        'columns': {
+            'media_id': ('str', 10, True),
+            'title': ('str', 100, True),
+            'description': ('str', None, False),
+            'release_year': ('year', None, False),
+            'media_type': ('enum', ('Movie', 'Series'), False),
+            'age_rating': ('enum', ('G', 'PG', 'PG-13', 'NC-17', 'U', 'U/A 7+', 'U/A 13+', 'U/A 16+', 'A'), False),
+            'poster_image_url': ('str', 2083, False)
+        },
+        'foreign_keys': {}
+    },
+    'Episodes': {
+        'key': ['episode_id'],
+        'columns': {
+            'episode_id': ('str', 50, True),
+            'media_id': ('str', 10, True),
+            'season_number': ('int', None, False),
+            'episode_number': ('int', None, False),
+            'title': ('str', 100, False),
+            'air_date': ('date', None, False)
+        },
+        'foreign_keys': {'media_id': ('Media', 'media_id')}
+    },
+    'People': {
+        'key': ['person_id'],
+        'columns': {
+            'person_id': ('str', 20, True),
+            'name': ('str', 40, False),
+            'birthdate': ('date', None, False),
+            'photo_url': ('str', 2083, False)
+        },
+        'foreign_keys': {}
+    },
+    'Media_Cast': {
+        'key': ['media_id', 'person_id'],
+        'columns': {
+            'media_id': ('str', 10, True),
+            'person_id': ('str', 20, True),
+            'character_name': ('str', 100, False)
+        },
+        'foreign_keys': {'media_id': ('Media', 'media_id'), 'person_id': ('People', 'person_id')}
+    },
+    'Media_Crew': {
+        'key': ['media_id', 'person_id', 'role'],
+        'columns': {
+            'media_id': ('str', 10, True),
+            'person_id': ('str', 20, True),
+            'role': ('str', 50, True)
+        },
+        'foreign_keys': {'media_id': ('Media', 'media_id'), 'person_id': ('People', 'person_id')}
+    },
+    'Media_Genres': {
+        'key': ['media_id', 'genre_id'],
+        'columns': {
+            'media_id': ('str', 10, True),
+            'genre_id': ('str', 50, True)
+        },
+        'foreign_keys': {'media_id': ('Media', 'media_id'), 'genre_id': ('genres', 'genre_id')}
+    }
 }
 
 for key, default_value in SESSION_DEFAULTS.items():
@@ -64,20 +266,34 @@ for key, default_value in SESSION_DEFAULTS.items():
 
 
 
+def open_db_connection():
+    """Open a new database connection separate from the session connection"""
+    return mysql.connector.connect(
+        host='localhost',
+        user='root',
+        password=st.session_state.db_password,
+        database='Streamsync',
+        autocommit=False
+    )
+
+# Connection bound to the current thread by scripts that call the data layer outside Streamlit
+_bound_connection = threading.local()
+
+def bind_connection(conn):
+    """Route this thread's queries through conn (None to unbind); used by benchmark/load-test scripts"""
+    _bound_connection.conn = conn
+
 def get_db_connection():
     """Get database connection with connection pooling"""
+    bound = getattr(_bound_connection, 'conn', None)
+    if bound is not None:
+        return bound
     try:
         if 'db_password' not in st.session_state:
             st.error("Database password not set. Please enter it in the landing page.")
             return None
         if st.session_state.db_conn is None or not st.session_state.db_conn.is_connected():
-            st.session_state.db_conn = mysql.connector.connect(
-                host='localhost',
-                user='root',
-                password=st.session_state.db_password,
-                database='Streamsync',
-                autocommit=False
-            )
+            st.session_state.db_conn = open_db_connection()
         return st.session_state.db_conn
     except Error as e:
         st.error(f"Database connection error: {e}")
@@ -87,26 +303,401 @@ def hash_password(password):
     """Hash password using SHA256"""
     return hashlib.sha256(password.encode()).hexdigest()
 
+@st.cache_resource
+def get_query_stats():
+    """Process-wide query metrics shared by every session and rerun"""
+    return {
+        'lock': threading.Lock(),
+        'since': datetime.now(),
+        'entries': {},
+        'slow_log': deque(maxlen=SLOW_QUERY_LOG_SIZE),
+        'settings': {'slow_ms': SLOW_QUERY_MS, 'sample_rate': SLOW_QUERY_SAMPLE_RATE},
+    }
+
+_SQL_LITERALS = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"|\b\d+(?:\.\d+)?\b|%s")
+_SQL_VALUE_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+@lru_cache(maxsize=2048)
+def query_fingerprint(query):
+    """Normalize SQL so calls differing only in literals or IN-list length group together"""
+    sql = ' '.join(query.split())
+    sql = _SQL_LITERALS.sub('?', sql)
+    return _SQL_VALUE_LISTS.sub('(...)', sql)
+
+def redact_params(params):
+    """Replace parameter values with their type (and length for strings)"""
+    def redact(value):
+        if isinstance(value, str):
+            return f"<str:{len(value)}>"
+        return "<null>" if value is None else f"<{type(value).__name__}>"
+    if not params:
+        return []
+    if isinstance(params, dict):
+        return {key: redact(value) for key, value in params.items()}
+    return [redact(value) for value in params]
+
+def record_query(call_site, query, params, elapsed_ms, rows, failed):
+    """Add one execute_query call to the latency histograms and, if slow, the slow-query log"""
+    stats = get_query_stats()
+    fingerprint = query_fingerprint(query)
+    bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)
+    with stats['lock']:
+        entry = stats['entries'].get((call_site, fingerprint))
+        if entry is None:
+            entry = stats['entries'][(call_site, fingerprint)] = {
+                'calls': 0, 'errors': 0, 'rows': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            }
+        entry['calls'] += 1
+        entry['errors'] += failed
+        entry['rows'] += max(rows, 0)
+        entry['total_ms'] += elapsed_ms
+        entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+        entry['buckets'][bucket] += 1
+        settings = stats['settings']
+        if elapsed_ms >= settings['slow_ms'] and random.random() < settings['sample_rate']:
+            stats['slow_log'].append({
+                'at': datetime.now(),
+                'call_site': call_site,
+                'page': st.session_state.get('page'),
+                'ms': round(elapsed_ms, 1),
+                'rows': rows,
+                'error': failed,
+                'fingerprint': fingerprint,
+                'params': redact_params(params),
+            })
+    profile = active_profile()
+    if profile is not None:
+        profile['queries'] += 1
+        profile['query_ms'] += elapsed_ms
+        if profile['query_log'] is not None:
+            # Frame 2 is execute_query's caller
+            profile['query_log'].append((fingerprint, query_call_stack(sys._getframe(2)), elapsed_ms))
+
+def histogram_percentile(buckets, q):
+    """Upper bound of the latency bucket holding the q-th percentile"""
+    total = sum(buckets)
+    if not total:
+        return None
+    threshold = total * q / 100
+    seen = 0
+    for i, count in enumerate(buckets):
+        seen += count
+        if seen >= threshold:
+            return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else float('inf')
+    return float('inf')
+
+# Profile of the rerun in progress, or None when profiling is off
+_rerun_profile = None
+# A Home dashboard worker thread counts into its own profile, merged on the main thread afterwards
+_worker_profile = threading.local()
+
+def active_profile():
+    """Profile this thread's queries and cache lookups count towards"""
+    return getattr(_worker_profile, 'profile', _rerun_profile)
+
+def merge_rerun_profile(profile, part):
+    """Add a worker thread's query and cache counts to the rerun profile"""
+    for key in ('queries', 'query_ms', 'cache_hits', 'cache_misses'):
+        profile[key] += part[key]
+    for name, counts in part['caches'].items():
+        merged = profile['caches'].setdefault(name, {'hits': 0, 'misses': 0})
+        merged['hits'] += counts['hits']
+        merged['misses'] += counts['misses']
+    if profile['query_log'] is not None and part['query_log']:
+        profile['query_log'].extend(part['query_log'])
+
+@st.cache_resource
+def get_rerun_profiles():
+    """Process-wide history of recent rerun profiles"""
+    return {'lock': threading.Lock(), 'runs': deque(maxlen=RERUN_PROFILE_HISTORY)}
+
+def profiling_requested():
+    """Profiling forced for this session via ?profile=1 or STREAMSYNC_PROFILE=1"""
+    return (st.query_params.get('profile') == '1' or os.environ.get('STREAMSYNC_PROFILE') == '1'
+            or dev_mode())
+
+def dev_mode():
+    """Development mode (?dev=1 or STREAMSYNC_DEV=1): also capture call stacks for N+1 detection"""
+    return st.query_params.get('dev') == '1' or os.environ.get('STREAMSYNC_DEV') == '1'
+
+def new_rerun_profile(page, user='', capture_stacks=False, started=None):
+    """Empty profile; capture_stacks keeps every query with its call stack"""
+    return {
+        'page': page,
+        'started': started or time.perf_counter(),
+        'user': user,
+        'sections': [],
+        'depth': 0,
+        'queries': 0,
+        'query_ms': 0.0,
+        'cache_hits': 0,
+        'cache_misses': 0,
+        'caches': {},
+        'query_log': [] if capture_stacks else None,
+    }
+
+def start_rerun_profile(panel=None):
+    """Begin profiling this rerun, or one panel's partial rerun, if an admin enabled it or it was requested"""
+    global _rerun_profile
+    if not (get_query_stats()['settings'].get('profile_reruns') or profiling_requested()):
+        _rerun_profile = None
+        return
+    nav = {'User': 'selected_nav', 'Admin': 'admin_nav', 'Database Handler': 'db_nav'}
+    page = st.session_state.get('page', 'Landing')
+    nav_key = nav.get(page)
+    name = f"{page}/{st.session_state.get(nav_key)}" if nav_key else page
+    _rerun_profile = new_rerun_profile(
+        f"{name}#{panel}" if panel else name,
+        st.session_state.get('username') or '',
+        capture_stacks=dev_mode(),
+        started=None if panel else _SCRIPT_STARTED
+    )
+
+def query_call_stack(frame):
+    """app.py frames leading to a query, innermost last, as 'function:line'"""
+    # Skip the profiling decorators' wrapper frames
+    frames = [f for f in traceback.extract_stack(frame)
+              if f.filename == __file__ and f.name not in ('wrapper', 'fragment')]
+    return tuple(f"{f.name}:{f.lineno}" for f in frames[-N_PLUS_ONE_STACK_DEPTH:])
+
+def find_n_plus_one(query_log, min_repeats=None):
+    """Queries with the same shape issued repeatedly from the same line, i.e. inside a loop"""
+    min_repeats = min_repeats or N_PLUS_ONE_MIN_REPEATS
+    groups = {}
+    for fingerprint, stack, elapsed_ms in query_log:
+        group = groups.setdefault((fingerprint, stack), {'count': 0, 'total_ms': 0.0})
+        group['count'] += 1
+        group['total_ms'] += elapsed_ms
+    suspects = [
+        {'fingerprint': fingerprint, 'stack': list(stack), 'count': g['count'], 'total_ms': round(g['total_ms'], 1)}
+        for (fingerprint, stack), g in groups.items() if g['count'] >= min_repeats
+    ]
+    return sorted(suspects, key=lambda g: g['count'], reverse=True)
+
+def page_query_budget(page):
+    """Maximum queries one rerun of a page (or of one of its panels, "page#panel") should issue"""
+    if '#' in page:
+        return PANEL_QUERY_BUDGETS.get(page.split('#', 1)[1], DEFAULT_QUERY_BUDGET)
+    return PAGE_QUERY_BUDGETS.get(page, DEFAULT_QUERY_BUDGET)
+
+class QueryBudgetExceeded(AssertionError):
+    """A page or block issued more queries than its budget"""
+
+def budget_report(profile, budget, used):
+    """Message describing a budget overrun and its N+1 suspects"""
+    message = f"{profile['page']} issued {used} queries (budget {budget})"
+    for suspect in find_n_plus_one(profile['query_log'] or []):
+        message += (f"\n  {suspect['count']}x {suspect['fingerprint'][:100]}"
+                    f"\n     via {' > '.join(suspect['stack'])}")
+    return message
+
+@contextmanager
+def query_budget(max_queries, label='block'):
+    """Fail (raise QueryBudgetExceeded) if the block issues more than max_queries queries; for tests and scripts"""
+    global _rerun_profile
+    outer = _rerun_profile
+    if outer is not None and outer['query_log'] is not None:
+        profile = outer
+    else:
+        profile = new_rerun_profile(label, capture_stacks=True)
+    _rerun_profile = profile
+    queries, logged = profile['queries'], len(profile['query_log'])
+    try:
+        yield profile
+    finally:
+        _rerun_profile = outer
+        if outer is not None and outer is not profile:
+            outer['queries'] += profile['queries']
+            outer['query_ms'] += profile['query_ms']
+    used = profile['queries'] - queries
+    if used > max_queries:
+        block = dict(profile, page=label, query_log=profile['query_log'][logged:])
+        raise QueryBudgetExceeded(budget_report(block, max_queries, used))
+
+def enforce_query_budget():
+    """In strict dev mode, fail the rerun when the page went over its query budget"""
+    profile = _rerun_profile
+    if profile is None or profile['query_log'] is None or os.environ.get('STREAMSYNC_QUERY_BUDGET_STRICT') != '1':
+        return
+    budget = page_query_budget(profile['page'])
+    if profile['queries'] > budget:
+        raise QueryBudgetExceeded(budget_report(profile, budget, profile['queries']))
+
+def profiled(fn):
+    """Time a page function (and the queries it issues) in the rerun profile"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        profile = _rerun_profile
+        if profile is None:
+            return fn(*args, **kwargs)
+        section = {'function': fn.__name__, 'depth': profile['depth']}
+        profile['sections'].append(section)
+        profile['depth'] += 1
+        queries, query_ms, started = profile['queries'], profile['query_ms'], time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile['depth'] -= 1
+            section['ms'] = round((time.perf_counter() - started) * 1000, 1)
+            section['queries'] = profile['queries'] - queries
+            section['query_ms'] = round(profile['query_ms'] - query_ms, 1)
+    return wrapper
+
+def fragments_enabled():
+    """Page panels run as st.fragment partial reruns unless STREAMSYNC_FRAGMENTS=0"""
+    return os.environ.get('STREAMSYNC_FRAGMENTS') != '0'
+
+def fragment_rerun():
+    """True while Streamlit reruns only a panel's fragment instead of the whole script"""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return bool(ctx and ctx.fragment_ids_this_run and ctx.current_fragment_id)
+
+def rerun_panel():
+    """Rerun just the current panel during a partial rerun, otherwise the whole script"""
+    st.rerun(scope="fragment" if fragment_rerun() else "app")
+
+def page_panel(fn):
+    """Render part of a page as an st.fragment: its widgets rerun only the panel and its queries.
+    Writes that change what other panels show still call st.rerun() for a full rerun."""
+    timed = profiled(fn)
+
+    @st.fragment
+    @wraps(fn)
+    def fragment(*args, **kwargs):
+        if not fragment_rerun():
+            return timed(*args, **kwargs)
+        # A partial rerun is profiled and budgeted on its own, as "page#panel"
+        start_rerun_profile(panel=fn.__name__)
+        try:
+            result = timed(*args, **kwargs)
+            enforce_query_budget()
+            return result
+        finally:
+            finish_rerun_profile()
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        return (fragment if fragments_enabled() else timed)(*args, **kwargs)
+    return wrapper
+
+def note_cache_miss():
+    """Called from inside a cached function body, which only runs on a miss"""
+    profile = active_profile()
+    if profile is not None:
+        profile['cache_misses'] += 1
+
+def track_cache(cached_fn):
+    """Count hits and misses of an st.cache_data function in the rerun profile"""
+    @wraps(cached_fn)
+    def wrapper(*args, **kwargs):
+        profile = active_profile()
+        if profile is None:
+            return cached_fn(*args, **kwargs)
+        misses = profile['cache_misses']
+        result = cached_fn(*args, **kwargs)
+        counts = profile['caches'].setdefault(cached_fn.__name__, {'hits': 0, 'misses': 0})
+        if profile['cache_misses'] == misses:
+            profile['cache_hits'] += 1
+            counts['hits'] += 1
+        else:
+            counts['misses'] += 1
+        return result
+    wrapper.clear = cached_fn.clear
+    return wrapper
+
+def finish_rerun_profile():
+    """Close the rerun profile and add it to the shared history"""
+    profile = _rerun_profile
+    if profile is None or 'total_ms' in profile:
+        return
+    profile['total_ms'] = round((time.perf_counter() - profile['started']) * 1000, 1)
+    profile['query_ms'] = round(profile['query_ms'], 1)
+    if profile['query_log'] is not None:
+        profile['n_plus_one'] = find_n_plus_one(profile['query_log'])
+        profile['budget'] = page_query_budget(profile['page'])
+        # Stacks are only needed for the analysis; keep the history small
+        profile['query_log'] = None
+    profile['at'] = datetime.now()
+    history = get_rerun_profiles()
+    with history['lock']:
+        history['runs'].append(profile)
+
+def render_rerun_profile():
+    """Collapsible cost breakdown of this rerun, for admins or when requested"""
+    profile = _rerun_profile
+    if profile is None or not (st.session_state.get('user_role') == 'admin' or profiling_requested()):
+        return
+    total_ms = (time.perf_counter() - _SCRIPT_STARTED) * 1000
+    with st.expander(f"⏱️ Rerun profile: {total_ms:.0f} ms, {profile['queries']} queries"):
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Script Time", f"{total_ms:.0f} ms")
+        with col2:
+            st.metric("DB Queries", profile['queries'])
+        with col3:
+            st.metric("DB Time", f"{profile['query_ms']:.0f} ms")
+        with col4:
+            st.metric("Cache Hits / Misses", f"{profile['cache_hits']} / {profile['cache_misses']}")
+        if profile['sections']:
+            sections = pd.DataFrame(profile['sections'])
+            sections['function'] = ['↳ ' * d + f for d, f in zip(sections['depth'], sections['function'])]
+            st.dataframe(sections.drop(columns=['depth']), width='stretch', hide_index=True)
+        if profile['caches']:
+            st.caption(" • ".join(f"{name}: {c['hits']} hits, {c['misses']} misses"
+                                  for name, c in profile['caches'].items()))
+        if profile['query_log'] is not None:
+            render_query_diagnostics(profile['page'], profile['queries'], find_n_plus_one(profile['query_log']))
+
+def render_query_diagnostics(page, queries, suspects):
+    """Query budget status and N+1 suspects with their call stacks"""
+    budget = page_query_budget(page)
+    if queries > budget:
+        st.error(f"🚨 {queries} queries, over the {budget}-query budget for {page}")
+    else:
+        st.success(f"✅ {queries} of {budget} budgeted queries")
+    for suspect in suspects:
+        st.warning(f"🔁 Possible N+1: {suspect['count']}× ({suspect['total_ms']} ms)\n\n`{suspect['fingerprint']}`")
+        st.code(" → ".join(suspect['stack']), language=None)
+
+def reset_query_stats():
+    """Clear the histograms and slow-query log, keeping the settings"""
+    stats = get_query_stats()
+    with stats['lock']:
+        stats['entries'].clear()
+        stats['slow_log'].clear()
+        stats['since'] = datetime.now()
+
 def execute_query(query, params=None, fetch=True):
     """Execute database query safely"""
     conn = get_db_connection()
     if not conn:
         return None
+    started = time.perf_counter()
+    rows = 0
+    failed = False
     try:
         cursor = conn.cursor(dictionary=True)
         cursor.execute(query, params or ())
         if fetch:
             result = cursor.fetchall()
+            rows = len(result)
             cursor.close()
             return result
         else:
             conn.commit()
+            rows = cursor.rowcount
             cursor.close()
             return True
     except Error as e:
+        failed = True
         conn.rollback()
         st.error(f"Query error: {e}")
         return None
+    finally:
+        # The caller's function name is the call site
+        record_query(sys._getframe(1).f_code.co_name, query, params,
+                     (time.perf_counter() - started) * 1000, rows, failed)
 
 def log_activity(table_name, operation, record_id, details, username=None):
     """Log activity into Activity_Log table"""
@@ -119,6 +710,133 @@ def log_activity(table_name, operation, record_id, details, username=None):
         fetch=False
     )
 
+@st.cache_resource
+def get_id_blocks():
+    """Process-wide ranges of IDs reserved from the id_sequence table"""
+    return {'lock': threading.Lock(), 'ranges': {}}
+
+def reserve_id_block(sequence, size):
+    """Atomically claim the next size values of a sequence; returns the first one"""
+    conn = get_db_connection()
+    if not conn:
+        return None
+    try:
+        cursor = conn.cursor()
+        # LAST_INSERT_ID(expr) hands the pre-update value back to this connection only
+        cursor.execute("UPDATE id_sequence SET next_value = LAST_INSERT_ID(next_value) + %s WHERE name = %s",
+                       (size, sequence))
+        if cursor.rowcount != 1:
+            conn.rollback()
+            cursor.close()
+            st.error(f"ID sequence '{sequence}' is missing; run migrate.py")
+            return None
+        cursor.execute("SELECT LAST_INSERT_ID()")
+        first = cursor.fetchone()[0]
+        conn.commit()
+        cursor.close()
+        return first
+    except Error as e:
+        conn.rollback()
+        st.error(f"ID allocation error: {e}")
+        return None
+
+def next_id(sequence, block_size):
+    """Next value of a sequence, served from this process's reserved block"""
+    blocks = get_id_blocks()
+    with blocks['lock']:
+        current = blocks['ranges'].get(sequence)
+        if not current or current[0] >= current[1]:
+            first = reserve_id_block(sequence, block_size)
+            if first is None:
+                return None
+            current = blocks['ranges'][sequence] = [first, first + block_size]
+        value = current[0]
+        current[0] += 1
+        return value
+
+def generate_playlist_id():
+    """Generate a playlist ID that is unique across sessions and app processes"""
+    value = next_id('playlist', PLAYLIST_ID_BLOCK)
+    return f"{PLAYLIST_ID_PREFIX}{value:012d}" if value is not None else None
+
+@st.cache_resource
+def get_catalogue_cache():
+    """Process-wide LRU store for catalogue reads shared by every session"""
+    return {'lock': threading.Lock(), 'entries': OrderedDict(), 'stats': {}}
+
+def _catalogue_stat(cache, kind, field):
+    kind_stats = cache['stats'].setdefault(kind, {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0})
+    kind_stats[field] += 1
+
+def _catalogue_lookup(kind, args, copy_result):
+    """Return (True, value) for a live cache entry, counting the hit, else (False, None)"""
+    cache = get_catalogue_cache()
+    with cache['lock']:
+        entry = cache['entries'].get((kind,) + args)
+        if not entry or entry[0] <= time.monotonic():
+            return False, None
+        cache['entries'].move_to_end((kind,) + args)
+        _catalogue_stat(cache, kind, 'hits')
+    profile = active_profile()
+    if profile:
+        profile['cache_hits'] += 1
+        profile['caches'].setdefault(kind, {'hits': 0, 'misses': 0})['hits'] += 1
+    return True, copy_result(entry[1])
+
+def catalogue_cached(kind, ttl=CATALOGUE_CACHE_TTL, copy_result=copy.deepcopy, cache_empty=False):
+    """Cache a catalogue read by (kind, args) with a TTL; writes drop entries via invalidate_catalogue"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args):
+            hit, value = _catalogue_lookup(kind, args, copy_result)
+            if hit:
+                return value
+            cache = get_catalogue_cache()
+            key = (kind,) + args
+            with cache['lock']:
+                _catalogue_stat(cache, kind, 'misses')
+            profile = active_profile()
+            if profile:
+                profile['cache_misses'] += 1
+                profile['caches'].setdefault(kind, {'hits': 0, 'misses': 0})['misses'] += 1
+            value = fn(*args)
+            # Failed queries come back as None (or an empty list) and are not cached
+            if value or (cache_empty and value is not None):
+                with cache['lock']:
+                    cache['entries'][key] = (time.monotonic() + ttl, value)
+                    cache['entries'].move_to_end(key)
+                    while len(cache['entries']) > CATALOGUE_CACHE_SIZE:
+                        evicted, _ = cache['entries'].popitem(last=False)
+                        _catalogue_stat(cache, evicted[0], 'evictions')
+                value = copy_result(value)
+            return value
+        # Cache-only lookup, so callers can tell which reads would need the database
+        wrapper.peek = lambda *args: _catalogue_lookup(kind, args, copy_result)
+        return wrapper
+    return decorator
+
+def invalidate_catalogue(table_name, media_id=None, username=None):
+    """Drop cached reads that depend on a table, only for one title or one user when known"""
+    kinds = CATALOGUE_DEPENDENCIES.get(table_name)
+    if not kinds:
+        return
+    cache = get_catalogue_cache()
+    with cache['lock']:
+        stale = [key for key in cache['entries']
+                 if key[0] in kinds
+                 and (media_id is None or key[0] not in MEDIA_SCOPED_KINDS or key[1] == media_id)
+                 and (username is None or key[0] not in USER_SCOPED_KINDS or key[1] == username)]
+        for key in stale:
+            del cache['entries'][key]
+            _catalogue_stat(cache, key[0], 'invalidations')
+
+def clear_catalogue_cache():
+    """Empty the catalogue cache and its statistics"""
+    cache = get_catalogue_cache()
+    with cache['lock']:
+        cache['entries'].clear()
+        cache['stats'].clear()
+
 def authenticate_user(username, password):
     """Authenticate user login"""
     hashed = hash_password(password)
@@ -156,8 +874,10 @@ def get_user_watchlists(username):
     return execute_query(query, (username,))
 
 def create_watchlist(username, playlist_name):
-    """Create new watchlist"""
-    playlist_id = f"PL{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    """Create new watchlist; returns its playlist_id on success"""
+    playlist_id = generate_playlist_id()
+    if not playlist_id:
+        return None
     query = "INSERT INTO playlist (playlist_id, username, name) VALUES (%s, %s, %s)"
     success = execute_query(query, (playlist_id, username, playlist_name), fetch=False)
     if success:
@@ -168,60 +888,288 @@ def create_watchlist(username, playlist_name):
             f"Playlist '{playlist_name}' created by {username}",
             username
         )
-    return success
-
-def get_watchlist_items(playlist_id):
-    """Get items in a watchlist"""
-    query = """SELECT pi.playlist_id, pi.media_id, m.title, m.media_type, m.poster_image_url, m.average_rating
+        invalidate_catalogue("playlist", username=username)
+    return playlist_id if success else None
+
+def get_watchlist_items(playlist_id, sort='Playlist order', after=None, limit=WATCHLIST_PAGE_SIZE):
+    """Get one page of watchlist items with the media fields the page shows; after is the last item already shown"""
+    column, direction = WATCHLIST_SORTS[sort]
+    params = [playlist_id]
+    keyset = ""
+    if after:
+        # Keyset pagination: continue after (sort value, media_id) instead of scanning past an OFFSET
+        op = '>' if direction == 'ASC' else '<'
+        keyset = f"AND ({column} {op} %s OR ({column} = %s AND pi.media_id > %s))"
+        params += [after['sort_key'], after['sort_key'], after['media_id']]
+    query = f"""SELECT pi.playlist_id, pi.media_id, pi.position, pi.added_at, m.title, m.media_type, m.poster_image_url,
+                      m.average_rating, m.release_year, m.description, {column} as sort_key
                FROM Playlist_item pi
                JOIN Media m ON pi.media_id = m.media_id
-               WHERE pi.playlist_id = %s"""
-    return execute_query(query, (playlist_id,))
+               WHERE pi.playlist_id = %s {keyset}
+               ORDER BY {column} {direction}, pi.media_id
+               LIMIT %s"""
+    params.append(limit)
+    return execute_query(query, tuple(params))
+
+def _playlist_batch_log(cursor, actor, operation, playlist_id, media_ids, details):
+    """Write one Activity_Log entry for a playlist batch inside its transaction"""
+    record_id = f"{playlist_id}:{media_ids[0]}" if len(media_ids) == 1 else f"{playlist_id}:batch:{len(media_ids)}"
+    cursor.execute(
+        """INSERT INTO Activity_Log (username, table_name, operation, record_id, change_details)
+           VALUES (%s, %s, %s, %s, %s)""",
+        (actor, "Playlist_item", operation, record_id,
+         f"{details} ({', '.join(media_ids[:50])}{', ...' if len(media_ids) > 50 else ''})")
+    )
+
+def _drop_unsaved_planned(cursor, playlist_id, media_ids=None):
+    """Before items leave a playlist, clear the owner's 'planned' state for titles no other playlist of theirs holds"""
+    if media_ids:
+        media_filter = f"IN ({', '.join(['%s'] * len(media_ids))})"
+        params = (playlist_id, *media_ids, playlist_id)
+    else:
+        media_filter = "IN (SELECT media_id FROM Playlist_item WHERE playlist_id = %s)"
+        params = (playlist_id, playlist_id, playlist_id)
+    cursor.execute(
+        f"""DELETE wi FROM Watchlists_item wi
+            JOIN playlist owner ON owner.username = wi.username
+            WHERE owner.playlist_id = %s AND wi.media_id {media_filter}
+              AND wi.status = 'planned' AND wi.user_rating IS NULL
+              AND NOT EXISTS (SELECT 1 FROM Playlist_item pi JOIN playlist p ON pi.playlist_id = p.playlist_id
+                              WHERE p.username = wi.username AND pi.media_id = wi.media_id
+                                AND p.playlist_id != %s)""",
+        params
+    )
+
+def add_to_watchlist_bulk(playlist_id, media_ids, added_by=None):
+    """Append media to a watchlist in one statement and one transaction with one log entry"""
+    media_ids = list(dict.fromkeys(media_ids))
+    if not media_ids:
+        return True
+    conn = get_db_connection()
+    if not conn:
+        return False
+    actor = added_by or st.session_state.get('username') or 'system'
+    try:
+        cursor = conn.cursor()
+        # Locking the playlist row serializes concurrent appends to the same playlist
+        cursor.execute("SELECT username FROM playlist WHERE playlist_id = %s FOR UPDATE", (playlist_id,))
+        owner = cursor.fetchall()
+        # Locking read: a plain SELECT would use the snapshot this session's earlier reads opened and
+        # could miss items another session appended since, handing out a duplicate position
+        cursor.execute("SELECT COALESCE(MAX(position), 0) FROM Playlist_item WHERE playlist_id = %s FOR UPDATE",
+                       (playlist_id,))
+        last_position = cursor.fetchone()[0]
+        params = []
+        for i, media_id in enumerate(media_ids, 1):
+            params.extend([playlist_id, media_id, last_position + i * PLAYLIST_POSITION_GAP])
+        # Items already in the playlist keep their place
+        cursor.execute(
+            f"""INSERT INTO Playlist_item (playlist_id, media_id, position)
+                VALUES {', '.join(['(%s, %s, %s)'] * len(media_ids))}
+                ON DUPLICATE KEY UPDATE media_id = VALUES(media_id)""",
+            tuple(params)
+        )
+        # The owner's watch state records the titles as planned unless they already have a status
+        cursor.execute(
+            f"""INSERT INTO Watchlists_item (username, media_id, status)
+                SELECT p.username, m.media_id, 'planned'
+                FROM playlist p JOIN Media m ON m.media_id IN ({', '.join(['%s'] * len(media_ids))})
+                WHERE p.playlist_id = %s
+                ON DUPLICATE KEY UPDATE status = COALESCE(Watchlists_item.status, 'planned')""",
+            (*media_ids, playlist_id)
+        )
+        _playlist_batch_log(cursor, actor, "INSERT", playlist_id, media_ids,
+                            f"Added {len(media_ids)} media to playlist {playlist_id}")
+        conn.commit()
+        cursor.close()
+        _invalidate_playlist_owner("Playlist_item", owner)
+        return True
+    except Error as e:
+        conn.rollback()
+        st.error(f"Playlist error: {e}")
+        return False
+
+def remove_from_watchlist_bulk(playlist_id, media_ids, removed_by=None):
+    """Remove media from a watchlist in one statement and one transaction with one log entry"""
+    media_ids = list(dict.fromkeys(media_ids))
+    if not media_ids:
+        return True
+    conn = get_db_connection()
+    if not conn:
+        return False
+    actor = removed_by or st.session_state.get('username') or 'system'
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT username FROM playlist WHERE playlist_id = %s", (playlist_id,))
+        owner = cursor.fetchall()
+        _drop_unsaved_planned(cursor, playlist_id, media_ids)
+        cursor.execute(
+            f"DELETE FROM Playlist_item WHERE playlist_id = %s AND media_id IN ({', '.join(['%s'] * len(media_ids))})",
+            (playlist_id, *media_ids)
+        )
+        _playlist_batch_log(cursor, actor, "DELETE", playlist_id, media_ids,
+                            f"Removed {len(media_ids)} media from playlist {playlist_id}")
+        conn.commit()
+        cursor.close()
+        _invalidate_playlist_owner("Playlist_item", owner)
+        return True
+    except Error as e:
+        conn.rollback()
+        st.error(f"Playlist error: {e}")
+        return False
+
+def _invalidate_playlist_owner(table_name, owner_rows):
+    """Drop the playlist owner's cached dashboard panels after a committed playlist write"""
+    for (username,) in owner_rows:
+        invalidate_catalogue(table_name, username=username)
+        invalidate_catalogue("Watchlists_item", username=username)
 
 def add_to_watchlist(playlist_id, media_id, added_by=None):
     """Add media to watchlist"""
-    query = """INSERT INTO Playlist_item (playlist_id, media_id)
-               VALUES (%s, %s)
-               ON DUPLICATE KEY UPDATE media_id = VALUES(media_id)"""
-    success = execute_query(query, (playlist_id, media_id), fetch=False)
-    if success:
-        log_activity(
-            "Playlist_item",
-            "INSERT",
-            f"{playlist_id}:{media_id}",
-            f"Added media {media_id} to playlist {playlist_id}",
-            added_by
-        )
-    return success
+    return add_to_watchlist_bulk(playlist_id, [media_id], added_by)
 
 def remove_from_watchlist(playlist_id, media_id, removed_by=None):
     """Remove item from watchlist"""
-    query = "DELETE FROM Playlist_item WHERE playlist_id = %s AND media_id = %s"
-    success = execute_query(query, (playlist_id, media_id), fetch=False)
-    if success:
-        log_activity(
-            "Playlist_item",
-            "DELETE",
-            f"{playlist_id}:{media_id}",
-            f"Removed media {media_id} from playlist {playlist_id}",
-            removed_by
-        )
-    return success
+    return remove_from_watchlist_bulk(playlist_id, [media_id], removed_by)
+
+def _renumber_playlist(cursor, playlist_id):
+    """Respace a playlist's positions by PLAYLIST_POSITION_GAP, keeping the current order"""
+    cursor.execute(
+        f"""UPDATE Playlist_item pi
+            JOIN (SELECT media_id, ROW_NUMBER() OVER (ORDER BY position, media_id) * {PLAYLIST_POSITION_GAP}
+                             as new_position
+                  FROM Playlist_item WHERE playlist_id = %s) ordered
+              ON pi.media_id = ordered.media_id
+            SET pi.position = ordered.new_position
+            WHERE pi.playlist_id = %s""",
+        (playlist_id, playlist_id)
+    )
+
+def move_watchlist_item(playlist_id, media_id, up=True, moved_by=None):
+    """Move an item one place up or down by rewriting only its own position"""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    actor = moved_by or st.session_state.get('username') or 'system'
+    op, order = ('<', 'DESC') if up else ('>', 'ASC')
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT playlist_id FROM playlist WHERE playlist_id = %s FOR UPDATE", (playlist_id,))
+        cursor.fetchall()
+        # A second pass only happens after renumbering, which always opens a gap. The position reads
+        # are locking reads so they see other sessions' committed moves, not this session's old snapshot
+        for _ in range(2):
+            cursor.execute("SELECT position FROM Playlist_item WHERE playlist_id = %s AND media_id = %s FOR UPDATE",
+                           (playlist_id, media_id))
+            row = cursor.fetchone()
+            if not row:
+                conn.rollback()
+                return False
+            position = row[0]
+            # The neighbour to jump over and the one beyond it
+            cursor.execute(
+                f"""SELECT position FROM Playlist_item
+                    WHERE playlist_id = %s AND (position {op} %s OR (position = %s AND media_id {op} %s))
+                    ORDER BY position {order}, media_id {order} LIMIT 2 FOR UPDATE""",
+                (playlist_id, position, position, media_id)
+            )
+            neighbours = [r[0] for r in cursor.fetchall()]
+            if not neighbours:
+                conn.rollback()
+                return True
+            near = neighbours[0]
+            far = neighbours[1] if len(neighbours) > 1 else near + (-2 if up else 2) * PLAYLIST_POSITION_GAP
+            if abs(far - near) >= 2:
+                break
+            _renumber_playlist(cursor, playlist_id)
+        cursor.execute("UPDATE Playlist_item SET position = %s WHERE playlist_id = %s AND media_id = %s",
+                       ((near + far) // 2, playlist_id, media_id))
+        _playlist_batch_log(cursor, actor, "UPDATE", playlist_id, [media_id],
+                            f"Moved media {media_id} {'up' if up else 'down'} in playlist {playlist_id}")
+        conn.commit()
+        cursor.close()
+        return True
+    except Error as e:
+        conn.rollback()
+        st.error(f"Playlist error: {e}")
+        return False
 
 def delete_watchlist(playlist_id, deleted_by=None):
     """Delete a watchlist"""
-    query = "DELETE FROM playlist WHERE playlist_id = %s"
-    success = execute_query(query, (playlist_id,), fetch=False)
-    if success:
-        log_activity(
-            "playlist",
-            "DELETE",
-            playlist_id,
-            f"Playlist {playlist_id} deleted",
-            deleted_by
+    conn = get_db_connection()
+    if not conn:
+        return False
+    actor = deleted_by or st.session_state.get('username') or 'system'
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT username FROM playlist WHERE playlist_id = %s", (playlist_id,))
+        owner = cursor.fetchall()
+        _drop_unsaved_planned(cursor, playlist_id)
+        cursor.execute("DELETE FROM playlist WHERE playlist_id = %s", (playlist_id,))
+        cursor.execute(
+            """INSERT INTO Activity_Log (username, table_name, operation, record_id, change_details)
+               VALUES (%s, %s, %s, %s, %s)""",
+            (actor, "playlist", "DELETE", playlist_id, f"Playlist {playlist_id} deleted")
         )
+        conn.commit()
+        cursor.close()
+        _invalidate_playlist_owner("playlist", owner)
+        return True
+    except Error as e:
+        conn.rollback()
+        st.error(f"Playlist error: {e}")
+        return False
+
+def set_watch_status(username, media_id, status):
+    """Set the user's watch status for a title; None clears it"""
+    if status is None:
+        success = execute_query("DELETE FROM Watchlists_item WHERE username = %s AND media_id = %s",
+                                (username, media_id), fetch=False)
+    else:
+        query = """INSERT INTO Watchlists_item (username, media_id, status) VALUES (%s, %s, %s)
+                   ON DUPLICATE KEY UPDATE status = VALUES(status)"""
+        success = execute_query(query, (username, media_id, status), fetch=False)
+    if success:
+        invalidate_catalogue("Watchlists_item", username=username)
     return success
 
+def _mark_watching(cursor, username, media_ids):
+    """Series progress means watching, except for titles already completed or dropped; runs in the caller's transaction"""
+    if not media_ids:
+        return
+    params = []
+    for media_id in media_ids:
+        params.extend([username, media_id, 'watching'])
+    cursor.execute(
+        f"""INSERT INTO Watchlists_item (username, media_id, status)
+            VALUES {', '.join(['(%s, %s, %s)'] * len(media_ids))}
+            ON DUPLICATE KEY UPDATE status = IF(Watchlists_item.status IN ('completed', 'dropped'),
+                                                Watchlists_item.status, 'watching')""",
+        tuple(params)
+    )
+
+def get_watch_state(username, media_id):
+    """The user's watch state row for a title (primary key lookup)"""
+    result = execute_query("SELECT status, user_rating FROM Watchlists_item WHERE username = %s AND media_id = %s",
+                           (username, media_id))
+    return result[0] if result else None
+
+def get_titles_by_status(username, status, limit=50):
+    """Titles the user has in one watch status, from the (username, status) index"""
+    query = """SELECT wi.media_id, wi.status, wi.user_rating, m.title, m.media_type, m.average_rating
+               FROM Watchlists_item wi
+               JOIN Media m ON wi.media_id = m.media_id
+               WHERE wi.username = %s AND wi.status = %s
+               ORDER BY m.title
+               LIMIT %s"""
+    return execute_query(query, (username, status, limit))
+
+def get_watch_status_counts(username):
+    """Number of titles in each watch status"""
+    result = execute_query("""SELECT status, COUNT(*) as total FROM Watchlists_item
+                              WHERE username = %s GROUP BY status""", (username,))
+    return {row['status']: row['total'] for row in result or []}
+
 def remove_series_progress(username, media_id, removed_by=None):
     """Remove series from progress"""
     query = "DELETE FROM Series_Progress_Table WHERE username = %s AND media_id = %s"
@@ -234,6 +1182,7 @@ def remove_series_progress(username, media_id, removed_by=None):
             f"Removed series {media_id} from {username}'s progress",
             removed_by or username
         )
+        invalidate_catalogue("Series_Progress_Table", username=username)
     return success
 
 def generate_review_id():
@@ -247,15 +1196,32 @@ def generate_review_id():
         if not exists:
             return review_id
 
-def get_reviews_for_media(media_id):
-    """Fetch all reviews for a media item"""
-    query = """SELECT r.review_id, r.username, u.firstname, u.lastname, r.review_text,
-                      r.rating, r.created_at, r.updated_at
+def get_reviews_for_media(media_id, limit=None, viewer=None, after=None):
+    """Fetch a media item's reviews, newest first; the viewer's own review always comes first.
+    after is the last review already shown"""
+    params = [viewer, media_id]
+    keyset = ""
+    if after:
+        # Keyset pagination: the viewer's review can only have been on an earlier page
+        keyset = "AND NOT (r.username <=> %s)"
+        params.append(viewer)
+        if not after['own']:
+            keyset += " AND (r.updated_at < %s OR (r.updated_at = %s AND r.review_id < %s))"
+            params += [after['updated_at'], after['updated_at'], after['review_id']]
+    query = f"""SELECT r.review_id, r.username, u.firstname, u.lastname, r.review_text,
+                      r.rating, r.created_at, r.updated_at, r.username <=> %s as own
                FROM Reviews_Table r
                JOIN Users u ON r.username = u.username
-               WHERE r.media_id = %s
-               ORDER BY r.updated_at DESC, r.created_at DESC"""
-    return execute_query(query, (media_id,))
+               WHERE r.media_id = %s {keyset}
+               ORDER BY own DESC, r.updated_at DESC, r.review_id DESC
+               {'LIMIT %s' if limit else ''}"""
+    params += [limit] if limit else []
+    return execute_query(query, tuple(params))
+
+def count_reviews_for_media(media_id):
+    """Number of reviews of a media item, from the media_id index"""
+    result = execute_query("SELECT COUNT(*) as total FROM Reviews_Table WHERE media_id = %s", (media_id,))
+    return result[0]['total'] if result else None
 
 def get_user_review(username, media_id):
     """Fetch a specific user's review for a media item"""
@@ -276,6 +1242,7 @@ def save_user_review(username, media_id, rating, review_text):
                    WHERE review_id = %s"""
         success = execute_query(query, (review_text, rating, review_id), fetch=False)
         if success:
+            invalidate_catalogue("Reviews_Table", media_id)
             log_activity(
                 "Reviews_Table",
                 "UPDATE",
@@ -290,6 +1257,7 @@ def save_user_review(username, media_id, rating, review_text):
                    VALUES (%s, %s, %s, %s, %s)"""
         success = execute_query(query, (review_id, username, media_id, review_text, rating), fetch=False)
         if success:
+            invalidate_catalogue("Reviews_Table", media_id)
             log_activity(
                 "Reviews_Table",
                 "INSERT",
@@ -310,6 +1278,7 @@ def delete_review(review_id, requesting_user, remark=None, moderator=False):
             fetch=False
         )
         if success:
+            invalidate_catalogue("Reviews_Table")
             log_activity(
                 "Reviews_Table",
                 "DELETE",
@@ -325,6 +1294,7 @@ def delete_review(review_id, requesting_user, remark=None, moderator=False):
             fetch=False
         )
         if success:
+            invalidate_catalogue("Reviews_Table")
             log_activity(
                 "Reviews_Table",
                 "DELETE",
@@ -334,48 +1304,164 @@ def delete_review(review_id, requesting_user, remark=None, moderator=False):
             )
         return success
 
+# Episode after a progress row's current one (sp / e), crossing into the next season; the first
+# episode when nothing is watched yet. Walks the (media_id, season_number, episode_number) key.
+# A LATERAL derived table (MySQL 8.0.14+) runs it once per progress row as `nxt`, so Episodes can
+# then be joined on its primary key instead of on a dependent subquery.
+NEXT_EPISODE_SQL = """LATERAL (SELECT nx.episode_id FROM Episodes nx
+                       WHERE nx.media_id = sp.media_id
+                         AND (e.episode_id IS NULL
+                              OR nx.season_number > e.season_number
+                              OR (nx.season_number = e.season_number AND nx.episode_number > e.episode_number))
+                       ORDER BY nx.season_number, nx.episode_number
+                       LIMIT 1) nxt"""
+
 def get_series_progress(username):
-    """Get user's series progress"""
-    query = """SELECT sp.media_id, m.title, m.poster_image_url,
+    """Get user's series progress with the next episode of each series"""
+    query = f"""SELECT sp.media_id, m.title, m.poster_image_url,
                sp.last_watched_episode_id, e.season_number, e.episode_number,
-               e.title as episode_title, sp.last_watched_at
+               e.title as episode_title, sp.last_watched_at,
+               n.episode_id as next_episode_id, n.season_number as next_season_number,
+               n.episode_number as next_episode_number, n.title as next_episode_title
                FROM Series_Progress_Table sp
                JOIN Media m ON sp.media_id = m.media_id
                LEFT JOIN Episodes e ON sp.last_watched_episode_id = e.episode_id
+               LEFT JOIN {NEXT_EPISODE_SQL} ON TRUE
+               LEFT JOIN Episodes n ON n.episode_id = nxt.episode_id
                WHERE sp.username = %s AND m.media_type = 'Series'
                ORDER BY sp.last_watched_at DESC"""
     return execute_query(query, (username,))
 
+def _progress_transaction(username, write):
+    """Run write(cursor) and the watch-state updates it makes in one transaction, so progress never
+    advances without its watch history"""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    try:
+        cursor = conn.cursor()
+        write(cursor)
+        conn.commit()
+        cursor.close()
+    except Error as e:
+        conn.rollback()
+        st.error(f"Progress error: {e}")
+        return False
+    invalidate_catalogue("Series_Progress_Table", username=username)
+    invalidate_catalogue("Watchlists_item", username=username)
+    return True
+
+def mark_next_watched(username, media_ids):
+    """Advance each of the user's series to its next episode and record it as watched, in one transaction"""
+    if not media_ids:
+        return True
+    placeholders = ', '.join(['%s'] * len(media_ids))
+
+    def write(cursor):
+        # Finished series have no next episode, so the inner join leaves them as they are
+        cursor.execute(
+            f"""UPDATE Series_Progress_Table sp
+                LEFT JOIN Episodes e ON sp.last_watched_episode_id = e.episode_id
+                JOIN {NEXT_EPISODE_SQL} ON TRUE
+                SET sp.last_watched_episode_id = nxt.episode_id,
+                    sp.last_watched_at = CURRENT_TIMESTAMP
+                WHERE sp.username = %s AND sp.media_id IN ({placeholders})""",
+            (username, *media_ids)
+        )
+        _mark_watching(cursor, username, media_ids)
+        cursor.execute(
+            f"""SELECT last_watched_episode_id FROM Series_Progress_Table
+                WHERE username = %s AND media_id IN ({placeholders}) AND last_watched_episode_id IS NOT NULL""",
+            (username, *media_ids)
+        )
+        _record_watched_episodes(cursor, username, [row[0] for row in cursor.fetchall()])
+
+    return _progress_transaction(username, write)
+
 def update_series_progress(username, media_id, episode_id):
     """Update series progress"""
-    query = """INSERT INTO Series_Progress_Table (username, media_id, last_watched_episode_id)
+    def write(cursor):
+        cursor.execute(
+            """INSERT INTO Series_Progress_Table (username, media_id, last_watched_episode_id)
                VALUES (%s, %s, %s)
                ON DUPLICATE KEY UPDATE
-               last_watched_episode_id = %s, last_watched_at = CURRENT_TIMESTAMP"""
-    return execute_query(query, (username, media_id, episode_id, episode_id), fetch=False)
-
-def search_media(query=None, filters=None, scopes=None, genres=None, people=None, people_role='Any', page=1, page_size=50, min_rating=None):
-    """
-    Clean search implementation:
-    - With text query: Search in selected scopes (Title/Cast/Crew/Genre) and rank by relevance
-    - Without text query: Apply filters only (genres, people, type) and show all matching media
-    - Always respects filters regardless of query presence
-    """
-    scopes = scopes or ['Title']
+               last_watched_episode_id = %s, last_watched_at = CURRENT_TIMESTAMP""",
+            (username, media_id, episode_id, episode_id)
+        )
+        _mark_watching(cursor, username, [media_id])
+        _record_watched_episodes(cursor, username, [episode_id])
+
+    return _progress_transaction(username, write)
+
+def set_watched_bits(bitmap, watch_bits):
+    """Set the bits for episodes' watch_bit values in a watch-history bitmap, growing it as needed"""
+    bits = bytearray(bitmap or b'')
+    for watch_bit in watch_bits:
+        index, bit = divmod(watch_bit, 8)
+        if index >= len(bits):
+            bits.extend(bytes(index + 1 - len(bits)))
+        bits[index] |= 1 << bit
+    return bytes(bits)
+
+def is_watched(bitmap, watch_bit):
+    """Check one episode's watch_bit in a watch-history bitmap"""
+    if watch_bit is None:
+        return False
+    index, bit = divmod(watch_bit, 8)
+    return index < len(bitmap) and bool(bitmap[index] >> bit & 1)
+
+def _record_watched_episodes(cursor, username, episode_ids):
+    """Set the watch-history bits for a batch of episodes in two statements, in the caller's transaction"""
+    if not episode_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(episode_ids))
+    # watch_bit is fixed when an episode is added (migration 0009), so bits never shift
+    cursor.execute(
+        f"SELECT media_id, watch_bit FROM Episodes WHERE episode_id IN ({placeholders}) AND watch_bit IS NOT NULL",
+        tuple(episode_ids)
+    )
+    by_media = {}
+    for media_id, watch_bit in cursor.fetchall():
+        by_media.setdefault(media_id, []).append(watch_bit)
+    if not by_media:
+        return
+    params = []
+    for media_id, watch_bits in by_media.items():
+        params.extend([username, media_id, set_watched_bits(None, watch_bits)])
+    # The new bits are OR-ed into the stored bitmap by the server under the row lock, so two sessions
+    # marking episodes at once cannot overwrite each other's bits. Binary | needs equal lengths, so
+    # both sides are zero-padded to the longer one.
+    query = f"""INSERT INTO Watch_History (username, media_id, watched_bitmap)
+               VALUES {', '.join(['(%s, %s, %s)'] * len(by_media))}
+               ON DUPLICATE KEY UPDATE watched_bitmap =
+                   RPAD(watched_bitmap, GREATEST(LENGTH(watched_bitmap), LENGTH(VALUES(watched_bitmap))), 0x00)
+                   | RPAD(VALUES(watched_bitmap), GREATEST(LENGTH(watched_bitmap), LENGTH(VALUES(watched_bitmap))), 0x00)"""
+    cursor.execute(query, tuple(params))
+
+def get_watch_bitmap(username, media_id):
+    """Watch-history bitmap for one series (empty when nothing is recorded)"""
+    result = execute_query("SELECT watched_bitmap FROM Watch_History WHERE username = %s AND media_id = %s",
+                           (username, media_id))
+    return bytes(result[0]['watched_bitmap']) if result else b''
+
+def get_watch_completion(username):
+    """Watched and total episode counts for every series the user has history for"""
+    # BIT_COUNT is a popcount over the whole bitmap, so no episode rows are read for the watched side
+    query = """SELECT wh.media_id, BIT_COUNT(wh.watched_bitmap) as watched_episodes,
+                      (SELECT COUNT(*) FROM Episodes e WHERE e.media_id = wh.media_id) as total_episodes
+               FROM Watch_History wh
+               WHERE wh.username = %s"""
+    result = execute_query(query, (username,))
+    completion = {}
+    for row in result or []:
+        total = row['total_episodes'] or 0
+        row['percent'] = min(100.0, 100.0 * row['watched_episodes'] / total) if total else 0.0
+        completion[row['media_id']] = row
+    return completion
+
+def _search_media_filters(search_text, filters, scopes, genres, people, people_role, min_rating):
+    """WHERE clauses and their parameters shared by search_media and count_search_media"""
     params = []
-    
-    search_text = query.strip() if query else ""
-    has_search_text = bool(search_text)
-    has_filters = bool(filters or genres or people or min_rating)
-    
-    if not has_search_text and not has_filters:
-        sql = """SELECT media_id, title, description, release_year, media_type, 
-                 age_rating, poster_image_url, average_rating 
-                 FROM Media 
-                 ORDER BY average_rating DESC, title ASC 
-                 LIMIT %s"""
-        return execute_query(sql, (page_size,))
-    
     where_clauses = []
     
     if filters:
@@ -431,7 +1517,7 @@ def search_media(query=None, filters=None, scopes=None, genres=None, people=None
         where_clauses.append("m.average_rating >= %s")
         params.append(min_rating)
     
-    if has_search_text:
+    if search_text:
         search_conditions = []
         
         if 'Title' in scopes:
@@ -464,6 +1550,32 @@ def search_media(query=None, filters=None, scopes=None, genres=None, people=None
         
         if search_conditions:
             where_clauses.append(f"({' OR '.join(search_conditions)})")
+
+    return where_clauses, params
+
+def search_media(query=None, filters=None, scopes=None, genres=None, people=None, people_role='Any', offset=0, page_size=50, min_rating=None):
+    """
+    Clean search implementation:
+    - With text query: Search in selected scopes (Title/Cast/Crew/Genre) and rank by relevance
+    - Without text query: Apply filters only (genres, people, type) and show all matching media
+    - Always respects filters regardless of query presence
+    - Returns page_size matches starting at offset
+    """
+    scopes = scopes or ['Title']
+    
+    search_text = query.strip() if query else ""
+    has_search_text = bool(search_text)
+    has_filters = bool(filters or genres or people or min_rating)
+    
+    if not has_search_text and not has_filters:
+        sql = """SELECT media_id, title, description, release_year, media_type, 
+                 age_rating, poster_image_url, average_rating 
+                 FROM Media 
+                 ORDER BY average_rating DESC, title ASC 
+                 LIMIT %s OFFSET %s"""
+        return execute_query(sql, (page_size, int(offset)))
+    
+    where_clauses, params = _search_media_filters(search_text, filters, scopes, genres, people, people_role, min_rating)
     
     sql = """SELECT DISTINCT m.media_id, m.title, m.description, m.release_year, 
              m.media_type, m.age_rating, m.poster_image_url, m.average_rating 
@@ -478,13 +1590,26 @@ def search_media(query=None, filters=None, scopes=None, genres=None, people=None
     else:
         sql += " ORDER BY m.average_rating DESC, m.title ASC"
     
-    offset = (max(1, int(page)) - 1) * int(page_size)
     sql += " LIMIT %s OFFSET %s"
     params.append(page_size)
-    params.append(offset)
+    params.append(int(offset))
     
     return execute_query(sql, tuple(params) if params else None)
 
+def count_search_media(query=None, filters=None, scopes=None, genres=None, people=None, people_role='Any', min_rating=None):
+    """Number of titles a filtered search matches; None for an unfiltered search, which lists the whole catalogue"""
+    search_text = query.strip() if query else ""
+    if not search_text and not (filters or genres or people or min_rating):
+        return None
+    where_clauses, params = _search_media_filters(search_text, filters, scopes or ['Title'], genres, people,
+                                                  people_role, min_rating)
+    # Only IN subqueries filter Media, so every match is one Media row
+    sql = "SELECT COUNT(*) as total FROM Media m"
+    if where_clauses:
+        sql += " WHERE " + " AND ".join(where_clauses)
+    result = execute_query(sql, tuple(params) if params else None)
+    return result[0]['total'] if result else None
+
 def search_users(query):
     """Search users by username or name"""
     search_term = f"%{query}%"
@@ -519,61 +1644,126 @@ def get_mutual_friends(username1, username2):
                  AND u.username NOT IN (%s, %s)"""
     return execute_query(query, (username1, username1, username2, username2, username1, username2))
 
-def get_media_by_id(media_id):
-    """Get media details by ID"""
-    query = """SELECT * FROM Media WHERE media_id = %s"""
-    result = execute_query(query, (media_id,))
-    return result[0] if result else None
+def _json_list(value):
+    """Decode a JSON_ARRAYAGG column; NULL (no rows) becomes an empty list"""
+    if value is None:
+        return []
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode('utf-8')
+    return json.loads(value) if isinstance(value, str) else list(value)
 
+@catalogue_cached('media_details')
 def get_media_full_details(media_id):
-    """Get full media details with cast, crew, genres using optimized JOIN query"""
-    media = get_media_by_id(media_id)
-    if not media:
+    """Get media details with genres, cast and crew in one round trip"""
+    # Correlated JSON_ARRAYAGG subqueries avoid both the extra round trips and a cast x crew cartesian product
+    query = """SELECT m.*,
+                      (SELECT JSON_ARRAYAGG(g.name)
+                       FROM Media_Genres mg JOIN genres g ON mg.genre_id = g.genre_id
+                       WHERE mg.media_id = m.media_id) as genres_json,
+                      (SELECT JSON_ARRAYAGG(JSON_OBJECT('name', p.name, 'character_name', mc.character_name))
+                       FROM Media_Cast mc JOIN People p ON mc.person_id = p.person_id
+                       WHERE mc.media_id = m.media_id) as cast_json,
+                      (SELECT JSON_ARRAYAGG(JSON_OBJECT('name', p.name, 'role', mc.role))
+                       FROM Media_Crew mc JOIN People p ON mc.person_id = p.person_id
+                       WHERE mc.media_id = m.media_id) as crew_json
+               FROM Media m
+               WHERE m.media_id = %s"""
+    result = execute_query(query, (media_id,))
+    if not result:
         return None
-    
-    # Fetch genres, cast, and crew in parallel queries (more efficient than single complex JOIN)
-    # This approach is better than a single JOIN because it avoids cartesian products
-    genres = execute_query("""SELECT g.name FROM Media_Genres mg
-                             JOIN genres g ON mg.genre_id = g.genre_id
-                             WHERE mg.media_id = %s""", (media_id,))
-    
-    cast = execute_query("""SELECT p.name, mc.character_name FROM Media_Cast mc
-                           JOIN People p ON mc.person_id = p.person_id
-                           WHERE mc.media_id = %s""", (media_id,))
-    
-    crew = execute_query("""SELECT p.name, mc.role FROM Media_Crew mc
-                           JOIN People p ON mc.person_id = p.person_id
-                           WHERE mc.media_id = %s""", (media_id,))
-    
-    media['genres'] = [g['name'] for g in genres] if genres else []
-    media['cast'] = cast if cast else []
-    media['crew'] = crew if crew else []
-    
+    media = result[0]
+    media['genres'] = _json_list(media.pop('genres_json'))
+    media['cast'] = _json_list(media.pop('cast_json'))
+    media['crew'] = _json_list(media.pop('crew_json'))
     return media
 
-def get_episodes_for_series(media_id):
-    """Get all episodes for a series"""
-    query = """SELECT * FROM Episodes WHERE media_id = %s
-               ORDER BY season_number, episode_number"""
+@catalogue_cached('seasons')
+def get_season_index(media_id):
+    """Season numbers of a series with their episode counts"""
+    query = """SELECT season_number, COUNT(*) as episode_count
+               FROM Episodes WHERE media_id = %s
+               GROUP BY season_number
+               ORDER BY season_number"""
     return execute_query(query, (media_id,))
 
-def get_friends(username):
-    """Get user's friends"""
-    query = """SELECT u.username, u.firstname, u.lastname
+@catalogue_cached('season_episodes')
+def get_season_episodes(media_id, season_number):
+    """Episodes of one season, read from the idx_episodes_season_bits covering index"""
+    # <=> so episodes without a season number still form their own season
+    query = """SELECT episode_id, season_number, episode_number, title, air_date, watch_bit
+               FROM Episodes WHERE media_id = %s AND season_number <=> %s
+               ORDER BY episode_number"""
+    return execute_query(query, (media_id, season_number))
+
+def get_first_episode(media_id):
+    """First episode of a series, used when a series is added to progress"""
+    query = """SELECT episode_id, season_number, episode_number, title
+               FROM Episodes WHERE media_id = %s
+               ORDER BY season_number, episode_number
+               LIMIT 1"""
+    result = execute_query(query, (media_id,))
+    return result[0] if result else None
+
+def get_friends(username, limit=None, after=None):
+    """Get user's friends by name; after is the last friend already shown"""
+    params = [username, username, username]
+    keyset = ""
+    if after:
+        keyset = "AND (u.firstname, COALESCE(u.lastname, ''), u.username) > (%s, %s, %s)"
+        params += [after['firstname'], after['lastname'] or '', after['username']]
+    query = f"""SELECT u.username, u.firstname, u.lastname
                FROM Friends f
                JOIN Users u ON (f.username_1 = u.username OR f.username_2 = u.username)
                WHERE (f.username_1 = %s OR f.username_2 = %s)
                AND f.status = 'accepted'
-               AND u.username != %s"""
-    return execute_query(query, (username, username, username))
-
-def get_friend_requests(username):
-    """Get pending friend requests"""
-    query = """SELECT u.username, u.firstname, u.lastname, f.created_at
+               AND u.username != %s {keyset}
+               ORDER BY u.firstname, COALESCE(u.lastname, ''), u.username
+               {'LIMIT %s' if limit else ''}"""
+    params += [limit] if limit else []
+    return execute_query(query, tuple(params))
+
+def count_friends(username):
+    """Number of accepted friends; each side of the pair is read from its own index"""
+    query = """SELECT (SELECT COUNT(*) FROM Friends
+                       WHERE username_1 = %s AND username_2 != %s AND status = 'accepted')
+                    + (SELECT COUNT(*) FROM Friends
+                       WHERE username_2 = %s AND username_1 != %s AND status = 'accepted') as total"""
+    result = execute_query(query, (username, username, username, username))
+    return result[0]['total'] if result else None
+
+def get_friend_requests(username, limit=None, after=None):
+    """Get pending friend requests, newest first; after is the last request already shown"""
+    params = [username]
+    keyset = ""
+    if after:
+        keyset = "AND (f.created_at, u.username) < (%s, %s)"
+        params += [after['created_at'], after['username']]
+    query = f"""SELECT u.username, u.firstname, u.lastname, f.created_at
                FROM Friends f
                JOIN Users u ON f.username_1 = u.username
-               WHERE f.username_2 = %s AND f.status = 'pending'"""
-    return execute_query(query, (username,))
+               WHERE f.username_2 = %s AND f.status = 'pending' {keyset}
+               ORDER BY f.created_at DESC, u.username DESC
+               {'LIMIT %s' if limit else ''}"""
+    params += [limit] if limit else []
+    return execute_query(query, tuple(params))
+
+def count_friend_requests(username):
+    """Number of pending friend requests, from the username_2 index"""
+    result = execute_query("SELECT COUNT(*) as total FROM Friends WHERE username_2 = %s AND status = 'pending'",
+                           (username,))
+    return result[0]['total'] if result else None
+
+def get_suggested_users(username, limit=5):
+    """Users who are not the user's friends yet, without loading the friend list"""
+    query = """SELECT u.username, u.firstname, u.lastname
+               FROM Users u
+               WHERE u.username != %s
+                 AND NOT EXISTS (SELECT 1 FROM Friends f
+                                 WHERE f.status = 'accepted'
+                                   AND ((f.username_1 = %s AND f.username_2 = u.username)
+                                        OR (f.username_2 = %s AND f.username_1 = u.username)))
+               LIMIT %s"""
+    return execute_query(query, (username, username, username, limit))
 
 def send_friend_request(from_user, to_user):
     """Send friend request - validates user exists first"""
@@ -582,13 +1772,21 @@ def send_friend_request(from_user, to_user):
     query = """INSERT INTO Friends (username_1, username_2, status)
                VALUES (%s, %s, 'pending')
                ON DUPLICATE KEY UPDATE status = 'pending'"""
-    return execute_query(query, (from_user, to_user), fetch=False)
+    success = execute_query(query, (from_user, to_user), fetch=False)
+    if success:
+        invalidate_catalogue("Friends", username=from_user)
+        invalidate_catalogue("Friends", username=to_user)
+    return success
 
 def accept_friend_request(username1, username2):
     """Accept friend request"""
     query = """UPDATE Friends SET status = 'accepted'
                WHERE username_1 = %s AND username_2 = %s"""
-    return execute_query(query, (username2, username1), fetch=False)
+    success = execute_query(query, (username2, username1), fetch=False)
+    if success:
+        invalidate_catalogue("Friends", username=username1)
+        invalidate_catalogue("Friends", username=username2)
+    return success
 
 def get_activity_logs(limit=50):
     """Get activity logs for admin"""
@@ -600,29 +1798,540 @@ def get_table_data(table_name):
     query = f"SELECT * FROM {table_name} LIMIT 100"
     return execute_query(query)
 
+INTEGER_TYPES = ('tinyint', 'smallint', 'mediumint', 'int', 'bigint', 'year')
+DECIMAL_TYPES = ('decimal', 'float', 'double')
+
+@track_cache
+@st.cache_data(ttl=60, show_spinner=False)
+def current_schema_version():
+    """Latest applied migration version (re-checked every minute)"""
+    note_cache_miss()
+    exists = execute_query(
+        """SELECT COUNT(*) as count FROM information_schema.TABLES
+           WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'schema_version'"""
+    )
+    if not exists or not exists[0]['count']:
+        return 0
+    result = execute_query("SELECT MAX(version) as version FROM schema_version")
+    return result[0]['version'] if result else 0
+
+@track_cache
+@st.cache_data(show_spinner=False)
+def load_schema_metadata(schema_version=0):
+    """Load columns, keys and enum values for every table from information_schema (cached per schema version)"""
+    note_cache_miss()
+    columns = execute_query(
+        """SELECT TABLE_NAME as table_name, COLUMN_NAME as column_name, DATA_TYPE as data_type,
+                  COLUMN_TYPE as column_type, IS_NULLABLE as is_nullable, COLUMN_KEY as column_key,
+                  COLUMN_DEFAULT as column_default, EXTRA as extra,
+                  CHARACTER_MAXIMUM_LENGTH as max_length,
+                  NUMERIC_PRECISION as numeric_precision, NUMERIC_SCALE as numeric_scale
+           FROM information_schema.COLUMNS
+           WHERE TABLE_SCHEMA = DATABASE()
+           ORDER BY TABLE_NAME, ORDINAL_POSITION"""
+    )
+    keys = execute_query(
+        """SELECT TABLE_NAME as table_name, COLUMN_NAME as column_name, CONSTRAINT_NAME as constraint_name,
+                  REFERENCED_TABLE_NAME as ref_table, REFERENCED_COLUMN_NAME as ref_column
+           FROM information_schema.KEY_COLUMN_USAGE
+           WHERE TABLE_SCHEMA = DATABASE()
+             AND (CONSTRAINT_NAME = 'PRIMARY' OR REFERENCED_TABLE_NAME IS NOT NULL)
+           ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION"""
+    )
+    if columns is None or keys is None:
+        # Raising keeps a failed load out of the cache
+        raise RuntimeError("Unable to read schema metadata")
+
+    schema = {}
+    for col in columns:
+        table = schema.setdefault(col['table_name'], {'columns': [], 'primary_key': [], 'foreign_keys': {}})
+        enum_values = []
+        if col['data_type'] in ('enum', 'set'):
+            inner = col['column_type'][col['column_type'].index('(') + 1:-1]
+            enum_values = [v.strip("'").replace("''", "'") for v in inner.split("','")]
+        # Keep DESCRIBE-style keys so callers can use either shape
+        table['columns'].append({
+            'Field': col['column_name'],
+            'Type': col['column_type'],
+            'Null': col['is_nullable'],
+            'Key': col['column_key'],
+            'Default': col['column_default'],
+            'Extra': col['extra'],
+            'data_type': col['data_type'],
+            'max_length': col['max_length'],
+            'numeric_precision': col['numeric_precision'],
+            'numeric_scale': col['numeric_scale'],
+            'enum_values': enum_values
+        })
+    for key in keys:
+        table = schema.get(key['table_name'])
+        if not table:
+            continue
+        if key['constraint_name'] == 'PRIMARY':
+            table['primary_key'].append(key['column_name'])
+        else:
+            table['foreign_keys'][key['column_name']] = (key['ref_table'], key['ref_column'])
+    return schema
+
+def invalidate_schema_cache():
+    """Drop cached schema metadata; call after any DDL"""
+    current_schema_version.clear()
+    load_schema_metadata.clear()
+
+def get_table_schema(table_name):
+    """Get cached metadata (columns, primary key, foreign keys) for a table"""
+    try:
+        # Migrations applied by migrate.py bump the version and so miss the old cache entry
+        schema = load_schema_metadata(current_schema_version())
+    except RuntimeError:
+        return None
+    if table_name in schema:
+        return schema[table_name]
+    # information_schema keeps the case used at creation time
+    return next((t for name, t in schema.items() if name.lower() == table_name.lower()), None)
+
 def get_table_columns(table_name):
-    """Get column names for a table"""
-    query = f"DESCRIBE {table_name}"
-    return execute_query(query)
+    """Get column metadata for a table"""
+    table = get_table_schema(table_name)
+    return table['columns'] if table else None
+
+def coerce_record_values(table_name, data):
+    """Validate and convert form values to column types, returning (values, errors)"""
+    table = get_table_schema(table_name)
+    if not table:
+        return data, []
+    columns = {c['Field']: c for c in table['columns']}
+    values = {}
+    errors = []
+    for field, value in data.items():
+        col = columns.get(field)
+        if col is None:
+            errors.append(f"{field}: unknown column")
+            continue
+        if value is None or value == '':
+            if col['Null'] == 'NO' and col['Default'] is None and 'auto_increment' not in col['Extra']:
+                errors.append(f"{field}: value required")
+            values[field] = None
+            continue
+        data_type = col['data_type']
+        try:
+            if data_type in INTEGER_TYPES:
+                # Decimal, not float: BIGINT values above 2**53 must not be rounded
+                try:
+                    number = Decimal(str(value).strip())
+                except InvalidOperation:
+                    number = None
+                if number is None or not number.is_finite() or number != number.to_integral_value():
+                    raise ValueError("not a whole number")
+                value = int(number)
+            elif data_type in DECIMAL_TYPES:
+                value = Decimal(str(value))
+            elif data_type == 'date' and isinstance(value, str):
+                value = date.fromisoformat(value.strip())
+            elif data_type in ('datetime', 'timestamp') and isinstance(value, str):
+                value = datetime.fromisoformat(value.strip())
+            elif data_type in ('enum', 'set') and value not in col['enum_values']:
+                raise ValueError(f"must be one of {', '.join(col['enum_values'])}")
+            elif col['max_length'] and isinstance(value, str) and len(value) > col['max_length']:
+                raise ValueError(f"longer than {col['max_length']} characters")
+        except (ValueError, InvalidOperation) as e:
+            errors.append(f"{field}: {e}")
+            continue
+        values[field] = value
+    return values, errors
 
 def insert_table_record(table_name, data):
     """Insert record into table"""
+    data, errors = coerce_record_values(table_name, data)
+    if errors:
+        st.error("Invalid values: " + "; ".join(errors))
+        return None
     columns = ", ".join(data.keys())
     placeholders = ", ".join(["%s"] * len(data))
     query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-    return execute_query(query, tuple(data.values()), fetch=False)
+    success = execute_query(query, tuple(data.values()), fetch=False)
+    if success:
+        invalidate_catalogue(table_name, data.get('media_id'))
+    return success
 
 def update_table_record(table_name, id_column, record_id, updates):
     """Update record in table"""
+    updates, errors = coerce_record_values(table_name, updates)
+    if errors:
+        st.error("Invalid values: " + "; ".join(errors))
+        return None
     set_clause = ", ".join([f"{k} = %s" for k in updates.keys()])
     query = f"UPDATE {table_name} SET {set_clause} WHERE {id_column} = %s"
     params = list(updates.values()) + [record_id]
-    return execute_query(query, tuple(params), fetch=False)
+    success = execute_query(query, tuple(params), fetch=False)
+    if success:
+        # Changing media_id itself moves the row, so drop every title's entries
+        scoped = id_column == 'media_id' and 'media_id' not in updates
+        invalidate_catalogue(table_name, record_id if scoped else None)
+    return success
 
 def delete_table_record(table_name, id_column, record_id):
     """Delete record from table"""
     query = f"DELETE FROM {table_name} WHERE {id_column} = %s"
-    return execute_query(query, (record_id,), fetch=False)
+    success = execute_query(query, (record_id,), fetch=False)
+    if success:
+        invalidate_catalogue(table_name, record_id if id_column == 'media_id' else None)
+    return success
+
+def apply_table_batch(table_name, key_columns, updates, deletes, username=None):
+    """Apply a batch of row updates and deletes in one transaction with one log entry"""
+    conn = get_db_connection()
+    if not conn:
+        return False
+    where_clause = " AND ".join(f"{c} = %s" for c in key_columns)
+
+    # executemany needs one statement per distinct set of changed columns
+    grouped_updates = {}
+    for key_values, changes in updates:
+        changes, errors = coerce_record_values(table_name, changes)
+        if errors:
+            st.error("Invalid values: " + "; ".join(errors))
+            return False
+        changed_columns = tuple(sorted(changes))
+        grouped_updates.setdefault(changed_columns, []).append(
+            tuple(changes[c] for c in changed_columns) + tuple(key_values)
+        )
+
+    actor = username or st.session_state.get('username') or 'system'
+    touched = [":".join(str(v) for v in key_values) for key_values, _ in updates]
+    touched += [":".join(str(v) for v in key_values) for key_values in deletes]
+    details = f"Batch edit in {table_name}: updated {len(updates)} rows, deleted {len(deletes)} rows"
+    if touched:
+        details += f" ({', '.join(touched[:50])}{', ...' if len(touched) > 50 else ''})"
+
+    try:
+        cursor = conn.cursor()
+        for changed_columns, params in grouped_updates.items():
+            set_clause = ", ".join(f"{c} = %s" for c in changed_columns)
+            cursor.executemany(f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}", params)
+        if deletes:
+            cursor.executemany(f"DELETE FROM {table_name} WHERE {where_clause}", [tuple(k) for k in deletes])
+        cursor.execute(
+            """INSERT INTO Activity_Log (username, table_name, operation, record_id, change_details)
+               VALUES (%s, %s, %s, %s, %s)""",
+            (actor, table_name, "UPDATE" if updates else "DELETE", f"batch:{len(touched)}", details)
+        )
+        conn.commit()
+        cursor.close()
+        invalidate_catalogue(table_name)
+        return True
+    except Error as e:
+        conn.rollback()
+        st.error(f"Batch error: {e}")
+        return False
+
+def get_table_row_estimate(table_name):
+    """Get approximate row count from table statistics (cheap, used for progress)"""
+    result = execute_query(
+        """SELECT TABLE_ROWS as row_estimate FROM information_schema.TABLES
+           WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s""",
+        (table_name,)
+    )
+    return int(result[0]['row_estimate'] or 0) if result else 0
+
+def stream_table_rows(table_name, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield (description, rows) chunks of a table from an unbuffered cursor"""
+    if table_name not in DATABASE_TABLES:
+        raise ValueError(f"Unknown table: {table_name}")
+    # A dedicated connection keeps the streaming result from blocking the session connection
+    conn = open_db_connection()
+    cursor = conn.cursor(buffered=False)
+    try:
+        cursor.execute(f"SELECT * FROM {table_name}")
+        # The first chunk is yielded even when empty, so an empty table still gets its header/schema
+        rows = cursor.fetchmany(chunk_size)
+        yield cursor.description, rows
+        while rows:
+            rows = cursor.fetchmany(chunk_size)
+            if rows:
+                yield cursor.description, rows
+    finally:
+        cursor.close()
+        conn.close()
+
+def arrow_type_for_field(type_code, precision=None, scale=None):
+    """Map a MySQL field type to an Arrow type for Parquet export"""
+    if type_code in (FieldType.TINY, FieldType.SHORT, FieldType.LONG, FieldType.LONGLONG,
+                     FieldType.INT24, FieldType.YEAR):
+        return pa.int64()
+    if type_code in (FieldType.DECIMAL, FieldType.NEWDECIMAL):
+        if precision is None:
+            # Exact text rather than a rounded float when the precision is unknown
+            return pa.string()
+        # DECIMAL allows 65 digits; decimal128 holds up to 38
+        return (pa.decimal128 if precision <= 38 else pa.decimal256)(int(precision), int(scale or 0))
+    if type_code in (FieldType.FLOAT, FieldType.DOUBLE):
+        return pa.float64()
+    if type_code in (FieldType.DATE, FieldType.NEWDATE):
+        return pa.date32()
+    if type_code in (FieldType.DATETIME, FieldType.TIMESTAMP):
+        return pa.timestamp('us')
+    return pa.string()
+
+def export_schema(table_name, description):
+    """Arrow schema for a table export; DECIMAL precision and scale come from the cursor description, or from
+    information_schema when the driver leaves them out"""
+    columns = {c['Field']: c for c in get_table_columns(table_name) or []}
+    fields = []
+    for d in description:
+        precision, scale = d[4], d[5]
+        if precision is None and d[0] in columns:
+            precision, scale = columns[d[0]]['numeric_precision'], columns[d[0]]['numeric_scale']
+        fields.append((d[0], arrow_type_for_field(d[1], precision, scale)))
+    return pa.schema(fields)
+
+def export_value(value, arrow_type):
+    """Coerce a fetched value to something the Arrow type accepts"""
+    if value is None:
+        return None
+    if pa.types.is_floating(arrow_type):
+        return float(value)
+    if pa.types.is_string(arrow_type):
+        if isinstance(value, (bytes, bytearray)):
+            return value.decode('utf-8', errors='replace')
+        return str(value)
+    return value
+
+def remove_export_file(path):
+    """Delete an export file, ignoring one that is already gone"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def prune_exports(max_age=EXPORT_MAX_AGE_SECONDS):
+    """Delete export files older than max_age seconds"""
+    cutoff = time.time() - max_age
+    with os.scandir(EXPORT_DIR) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                remove_export_file(entry.path)
+
+def export_table(table_name, file_format='csv', chunk_size=EXPORT_CHUNK_SIZE, progress_callback=None):
+    """Stream a table to a CSV or Parquet file chunk by chunk, returning (path, rows_written)"""
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    prune_exports()
+    timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+    # The random suffix keeps two exports of a table in the same second apart
+    path = os.path.join(EXPORT_DIR, f"{table_name}_{timestamp}_{uuid.uuid4().hex[:8]}.{file_format}")
+    total_estimate = get_table_row_estimate(table_name)
+    rows_written = 0
+
+    if file_format == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            for description, rows in stream_table_rows(table_name, chunk_size):
+                if rows_written == 0:
+                    writer.writerow([d[0] for d in description])
+                if not rows:
+                    continue
+                writer.writerows(rows)
+                rows_written += len(rows)
+                if progress_callback:
+                    progress_callback(rows_written, total_estimate)
+    elif file_format == 'parquet':
+        writer = None
+        try:
+            for description, rows in stream_table_rows(table_name, chunk_size):
+                if writer is None:
+                    schema = export_schema(table_name, description)
+                    writer = pq.ParquetWriter(path, schema)
+                if not rows:
+                    continue
+                columns = list(zip(*rows))
+                arrays = [
+                    pa.array([export_value(v, field.type) for v in columns[i]], type=field.type)
+                    for i, field in enumerate(schema)
+                ]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                rows_written += len(rows)
+                if progress_callback:
+                    progress_callback(rows_written, total_estimate)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        raise ValueError(f"Unsupported export format: {file_format}")
+
+    return path, rows_written
+
+def read_import_chunks(source, file_format, chunk_size=IMPORT_CHUNK_SIZE):
+    """Yield DataFrame chunks from a CSV, JSONL or Parquet file"""
+    if file_format == 'csv':
+        yield from pd.read_csv(source, dtype=str, chunksize=chunk_size, skipinitialspace=True)
+    elif file_format == 'jsonl':
+        yield from pd.read_json(source, lines=True, dtype=False, chunksize=chunk_size)
+    elif file_format == 'parquet':
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported import format: {file_format}")
+
+def import_columns(table_name, present):
+    """Columns an import writes: the key and the schema columns the file has, so absent ones keep their values"""
+    schema = IMPORT_SCHEMAS[table_name]
+    return [c for c in schema['columns'] if c in schema['key'] or c in present]
+
+def validate_import_chunk(table_name, df, row_offset=0):
+    """Validate a chunk column-wise, returning (valid rows as tuples over import_columns, rejects)"""
+    schema = IMPORT_SCHEMAS[table_name]
+    columns = import_columns(table_name, df.columns)
+    missing = [c for c, (_, _, required) in schema['columns'].items() if required and c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns for {table_name}: {', '.join(missing)}")
+
+    df = df.reset_index(drop=True)
+    reasons = pd.Series('', index=df.index, dtype=object)
+    values = {}
+
+    def flag(mask, reason):
+        mask = mask.fillna(False).astype(bool)
+        reasons[mask & (reasons == '')] = reason
+
+    for col in columns:
+        kind, constraint, required = schema['columns'][col]
+        raw = df[col] if col in df.columns else pd.Series(None, index=df.index, dtype=object)
+        text = raw.astype('string').str.strip()
+        is_null = text.isna() | (text == '')
+        if required:
+            flag(is_null, f"{col} is required")
+
+        if kind == 'str':
+            if constraint:
+                flag(~is_null & (text.str.len() > constraint), f"{col} longer than {constraint} characters")
+            values[col] = text.where(~is_null, None)
+        elif kind == 'enum':
+            flag(~is_null & ~text.isin(constraint), f"{col} must be one of {', '.join(constraint)}")
+            values[col] = text.where(~is_null, None)
+        elif kind in ('int', 'year', 'decimal'):
+            number = pd.to_numeric(text, errors='coerce')
+            flag(~is_null & number.isna(), f"{col} is not a number")
+            if kind in ('int', 'year'):
+                flag(~is_null & number.notna() & (number % 1 != 0), f"{col} is not a whole number")
+            if kind == 'year':
+                flag(~is_null & number.notna() & ~number.between(1901, 2155), f"{col} outside 1901-2155")
+            if kind == 'decimal':
+                low, high = constraint
+                flag(~is_null & number.notna() & ~number.between(low, high), f"{col} outside {low}-{high}")
+                values[col] = number.round(1)
+            else:
+                values[col] = number.where(number % 1 == 0).astype('Int64')
+        elif kind == 'date':
+            parsed = pd.to_datetime(text, errors='coerce', format='mixed')
+            flag(~is_null & parsed.isna(), f"{col} is not a valid date")
+            values[col] = parsed.dt.date
+
+    key = schema['key']
+    key_frame = pd.DataFrame({c: values[c] for c in key})
+    flag(key_frame.duplicated(keep='last'), "duplicate key within file")
+
+    valid = reasons == ''
+    rejects = [
+        {'row': row_offset + int(i) + 1, 'reason': reasons[i]}
+        for i in reasons.index[~valid]
+    ]
+    frame = pd.DataFrame({c: values[c] for c in columns})[valid]
+    frame = frame.astype(object).where(frame.notna(), None)
+    rows = list(frame.itertuples(index=False, name=None))
+    row_numbers = [row_offset + int(i) + 1 for i in frame.index]
+    return rows, row_numbers, rejects
+
+def find_missing_parents(cursor, table_name, columns, rows):
+    """Return the set of row positions whose foreign keys have no parent row"""
+    schema = IMPORT_SCHEMAS[table_name]
+    missing_rows = {}
+    for col, (parent_table, parent_col) in schema['foreign_keys'].items():
+        if col not in columns:
+            continue
+        idx = columns.index(col)
+        wanted = list({row[idx] for row in rows if row[idx] is not None})
+        found = set()
+        for start in range(0, len(wanted), IMPORT_INSERT_BATCH):
+            batch = wanted[start:start + IMPORT_INSERT_BATCH]
+            placeholders = ", ".join(["%s"] * len(batch))
+            cursor.execute(
+                f"SELECT {parent_col} FROM {parent_table} WHERE {parent_col} IN ({placeholders})",
+                tuple(batch)
+            )
+            found.update(r[0] for r in cursor.fetchall())
+        for pos, row in enumerate(rows):
+            if row[idx] is not None and row[idx] not in found and pos not in missing_rows:
+                missing_rows[pos] = f"{col} '{row[idx]}' not found in {parent_table}"
+    return missing_rows
+
+def insert_import_rows(cursor, table_name, columns, rows):
+    """Upsert rows with multi-row INSERT statements; only the given columns are written or updated"""
+    schema = IMPORT_SCHEMAS[table_name]
+    non_key = [c for c in columns if c not in schema['key']] or schema['key'][:1]
+    update_clause = ", ".join(f"{c} = VALUES({c})" for c in non_key)
+    row_placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    for start in range(0, len(rows), IMPORT_INSERT_BATCH):
+        batch = rows[start:start + IMPORT_INSERT_BATCH]
+        query = (f"INSERT INTO {table_name} ({', '.join(columns)}) "
+                 f"VALUES {', '.join([row_placeholder] * len(batch))} "
+                 f"ON DUPLICATE KEY UPDATE {update_clause}")
+        cursor.execute(query, tuple(v for row in batch for v in row))
+
+def bulk_import(table_name, source, file_format, chunk_size=IMPORT_CHUNK_SIZE, progress_callback=None):
+    """Validate and load a file into a catalogue table in chunked transactions"""
+    if table_name not in IMPORT_SCHEMAS:
+        raise ValueError(f"Bulk import is not supported for {table_name}")
+    result = {'table': table_name, 'rows': 0, 'loaded': 0, 'rejected': 0, 'rejects': [], 'seconds': 0.0}
+    started = time.perf_counter()
+
+    def reject(entries):
+        result['rejected'] += len(entries)
+        room = IMPORT_MAX_REJECTS - len(result['rejects'])
+        if room > 0:
+            result['rejects'].extend(entries[:room])
+
+    conn = open_db_connection()
+    cursor = conn.cursor()
+    try:
+        for df in read_import_chunks(source, file_format, chunk_size):
+            columns = import_columns(table_name, df.columns)
+            rows, row_numbers, rejects = validate_import_chunk(table_name, df, result['rows'])
+            result['rows'] += len(df)
+            reject(rejects)
+
+            missing = find_missing_parents(cursor, table_name, columns, rows)
+            if missing:
+                reject([{'row': row_numbers[pos], 'reason': reason} for pos, reason in missing.items()])
+                keep = [pos for pos in range(len(rows)) if pos not in missing]
+                rows = [rows[pos] for pos in keep]
+                row_numbers = [row_numbers[pos] for pos in keep]
+
+            try:
+                insert_import_rows(cursor, table_name, columns, rows)
+                conn.commit()
+                result['loaded'] += len(rows)
+            except Error:
+                # Retry the failed chunk row by row so only the offending rows are rejected
+                conn.rollback()
+                for row, row_number in zip(rows, row_numbers):
+                    try:
+                        insert_import_rows(cursor, table_name, columns, [row])
+                        result['loaded'] += 1
+                    except Error as e:
+                        reject([{'row': row_number, 'reason': e.msg}])
+                conn.commit()
+
+            if progress_callback:
+                progress_callback(result['rows'], result['loaded'], time.perf_counter() - started)
+    finally:
+        cursor.close()
+        conn.close()
+        if result['loaded']:
+            invalidate_catalogue(table_name)
+
+    result['seconds'] = time.perf_counter() - started
+    result['rows_per_sec'] = result['loaded'] / result['seconds'] if result['seconds'] else 0.0
+    return result
 
 def get_user_stats(username):
     """Get user statistics with single query"""
@@ -637,11 +2346,12 @@ def get_user_stats(username):
     return result[0] if result else {'watchlists': 0, 'series': 0, 'friends': 0}
 
 def get_recommendations(username, limit=10):
-    """Get media recommendations for user"""
-    query = """SELECT DISTINCT m.media_id, m.title, m.poster_image_url, m.average_rating, m.media_type
+    """Get media recommendations for user, skipping anything in their watch state (saved, watching, ...)"""
+    # One primary-key probe per candidate, walking Media in rating order until the limit is filled
+    query = """SELECT m.media_id, m.title, m.poster_image_url, m.average_rating, m.media_type
                FROM Media m
-               LEFT JOIN Watchlists_item wi ON m.media_id = wi.media_id AND wi.username = %s
-               WHERE wi.media_id IS NULL
+               WHERE NOT EXISTS (SELECT 1 FROM Watchlists_item wi
+                                 WHERE wi.username = %s AND wi.media_id = m.media_id)
                ORDER BY m.average_rating DESC
                LIMIT %s"""
     return execute_query(query, (username, limit))
@@ -655,6 +2365,95 @@ def get_top_rated_media(limit=5):
                LIMIT %s"""
     return execute_query(query, (limit,))
 
+@st.cache_resource
+def get_dashboard_pool(password):
+    """Process-wide connection pool for loading dashboard panels concurrently"""
+    return pooling.MySQLConnectionPool(
+        pool_name='streamsync_dashboard',
+        pool_size=DASHBOARD_POOL_SIZE,
+        host='localhost',
+        user='root',
+        password=password,
+        database='Streamsync',
+        autocommit=False
+    )
+
+def _home_panel(kind, fn, ttl=DASHBOARD_CACHE_TTL):
+    """Cached Home tab panel; empty panels are cached too"""
+    return catalogue_cached(kind, ttl, cache_empty=True)(fn)
+
+# Home tab panels -> (cached loader, keyed per user); top rated is shared by everyone
+HOME_PANELS = {
+    'stats': (_home_panel('home_stats', get_user_stats), True),
+    'recommendations': (_home_panel('home_recommendations', lambda username: get_recommendations(username, 5)), True),
+    'progress': (_home_panel('home_progress', get_series_progress), True),
+    'top_rated': (_home_panel('top_rated', get_top_rated_media, CATALOGUE_CACHE_TTL), False),
+    'watchlists': (_home_panel('home_watchlists', get_user_watchlists), True),
+}
+
+def _load_panel(panel, username):
+    """Load one Home tab panel through its cache"""
+    load, per_user = HOME_PANELS[panel]
+    return load(username) if per_user else load()
+
+def _load_panel_pooled(pool, panel, username, ctx, profile):
+    """Load one Home tab panel on a pooled connection in a worker thread; returns (value, worker profile)"""
+    # The session's context lets st.error, session_state and the resource caches work on this thread
+    add_script_run_ctx(threading.current_thread(), ctx)
+    part = None
+    if profile is not None:
+        # Counted separately and merged by the main thread; the rerun's profile is not thread-safe
+        part = _worker_profile.profile = new_rerun_profile(profile['page'], capture_stacks=profile['query_log'] is not None)
+    try:
+        conn = pool.get_connection()
+        bind_connection(conn)
+        try:
+            return _load_panel(panel, username), part
+        finally:
+            bind_connection(None)
+            conn.close()
+    finally:
+        if part is not None:
+            del _worker_profile.profile
+
+def get_home_dashboard(username):
+    """Every Home tab panel in one structure: cache hits first, then the misses concurrently"""
+    dashboard, missing = {}, []
+    for panel, (load, per_user) in HOME_PANELS.items():
+        hit, value = load.peek(username) if per_user else load.peek()
+        if hit:
+            dashboard[panel] = value
+        else:
+            missing.append(panel)
+
+    pool = None
+    if len(missing) > 1 and getattr(_bound_connection, 'conn', None) is None and 'db_password' in st.session_state:
+        try:
+            pool = get_dashboard_pool(st.session_state.db_password)
+        except Error:
+            pool = None
+    if pool:
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(max_workers=min(DASHBOARD_WORKERS, len(missing))) as executor:
+            futures = {panel: executor.submit(_load_panel_pooled, pool, panel, username, ctx, _rerun_profile)
+                       for panel in missing}
+        for panel, future in futures.items():
+            try:
+                dashboard[panel], part = future.result()
+            except Exception:
+                # Pool exhausted by other sessions, or the worker failed: load it on this session's connection below
+                continue
+            if part is not None and _rerun_profile is not None:
+                merge_rerun_profile(_rerun_profile, part)
+    for panel in missing:
+        if panel not in dashboard:
+            dashboard[panel] = _load_panel(panel, username)
+
+    if not dashboard['stats']:
+        dashboard['stats'] = {'watchlists': 0, 'series': 0, 'friends': 0}
+    return dashboard
+
+@catalogue_cached('genres', copy_result=list)
 def get_all_genres():
     """Fetch list of all genres"""
     query = "SELECT name FROM genres ORDER BY name"
@@ -662,6 +2461,7 @@ def get_all_genres():
     return [g['name'] for g in genres] if genres else []
 
 
+@catalogue_cached('people', copy_result=list)
 def get_all_people():
     """Fetch list of all people names for search filters"""
     query = "SELECT name FROM People ORDER BY name"
@@ -727,7 +2527,45 @@ def handle_logout():
         st.session_state.db_password = keep
     set_page('Landing')
 
+def paged_rows(key, load_page, total=None, page_size=LIST_PAGE_SIZE, reset_on=None):
+    """Rows of a long list loaded so far; draw them, then call load_more_button.
+    load_page(loaded, limit) returns up to limit rows following the loaded ones. Loaded rows stay in session
+    state, so each "Load more" fetches only the next page. total is the list's size from its own COUNT query;
+    when it changes the list is reloaded, and reset_on changing starts it again from one page"""
+    state = st.session_state.get(f"{key}_pages")
+    if state is None or state['for'] != reset_on:
+        state = st.session_state[f"{key}_pages"] = {'for': reset_on, 'want': page_size, 'rows': None}
+    if state['rows'] is None or state['total'] != total:
+        # Rows were added or removed since they were loaded: reload as many as were shown, in one query
+        state.update(rows=[], more=True, total=total)
+    if state['more'] and len(state['rows']) < state['want']:
+        limit = state['want'] - len(state['rows'])
+        # One extra row tells whether there is another page
+        page = load_page(state['rows'], limit + 1)
+        if page is not None:
+            state['more'] = len(page) > limit
+            state['rows'] = state['rows'] + page[:limit]
+    return state['rows']
+
+def reset_paged_rows(key):
+    """Reload a paged_rows list on its next draw, after a write the row count does not show"""
+    state = st.session_state.get(f"{key}_pages")
+    if state:
+        state['rows'] = None
+
+def load_more_button(key, page_size=LIST_PAGE_SIZE, noun="items"):
+    """"Showing x of y" and a button that loads one more page of a paged_rows list"""
+    state = st.session_state[f"{key}_pages"]
+    if not state['more']:
+        return
+    shown, total = len(state['rows']), state['total']
+    st.caption(f"Showing {shown} of {total} {noun}" if total is not None else f"Showing {shown} {noun}")
+    remaining = total - shown if total is not None and total > shown else page_size
+    st.button(f"⬇️ Load {min(page_size, remaining)} more",
+              key=f"{key}_more", width='stretch', on_click=lambda: state.update(want=shown + page_size))
+
 
+@profiled
 def landing_page():
     st.set_page_config(page_title="StreamSync", page_icon="🎥", layout="wide")
 
@@ -826,6 +2664,7 @@ def landing_page():
             set_page('Login')
             st.rerun()
 
+@profiled
 def login_page():
     st.set_page_config(page_title="Login - StreamSync", page_icon="🔑", layout="centered")
     
@@ -878,6 +2717,7 @@ def login_page():
             set_page('Register')
             st.rerun()
 
+@profiled
 def register_page():
     st.set_page_config(page_title="Register - StreamSync", page_icon="📝", layout="centered")
     
@@ -969,6 +2809,7 @@ def register_page():
 
 
 
+@profiled
 def user_page(username):
     st.set_page_config(page_title="StreamSync - User Dashboard", page_icon="🎥", layout="wide")
     # If a media item has been selected from anywhere, show its details immediately
@@ -1025,7 +2866,8 @@ def user_page(username):
         st.markdown(f"# 👋 Welcome, {st.session_state.username}!")
         st.markdown("---")
 
-        stats = get_user_stats(username)
+        dashboard = get_home_dashboard(username)
+        stats = dashboard['stats']
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("📋 Watchlists", stats['watchlists'])
@@ -1040,7 +2882,7 @@ def user_page(username):
         with col1:
             with st.container(border=True):
                 st.markdown("### 💡 Recommendations for You")
-                recommendations = get_recommendations(username, 5)
+                recommendations = dashboard['recommendations']
                 if recommendations:
                     for rec in recommendations:
                         rating_text = f"⭐ {rec['average_rating']}" if rec.get('average_rating') is not None else "⭐ N/A"
@@ -1050,18 +2892,23 @@ def user_page(username):
         with col2:
             with st.container(border=True):
                 st.markdown("### ▶️ Continue Watching")
-                progress = get_series_progress(username)
+                progress = dashboard['progress']
                 if progress:
                     for p in progress[:3]:
                         st.markdown(f"**{p['title']}**")
-                        if p['episode_title']:
-                            st.caption(f"S{p['season_number']}E{p['episode_number']}: {p['episode_title']}")
+                        if p['next_episode_id']:
+                            st.caption(f"Next: S{p['next_season_number']}E{p['next_episode_number']}: {p['next_episode_title']}")
+                            if st.button("✅ Watched", key=f"home_next_{p['media_id']}"):
+                                if mark_next_watched(username, [p['media_id']]):
+                                    st.rerun()
+                        elif p['episode_title']:
+                            st.caption(f"Finished at S{p['season_number']}E{p['episode_number']}: {p['episode_title']}")
                 else:
                     st.info("No series in progress")
 
         st.markdown("---")
         st.markdown("### ⭐ Top Rated on StreamSync")
-        top_rated = get_top_rated_media()
+        top_rated = dashboard['top_rated']
         if top_rated:
             cols = st.columns(5)
             for i, media in enumerate(top_rated):
@@ -1075,7 +2922,7 @@ def user_page(username):
         st.markdown("---")
         
         st.markdown("### 📋 Your Recent Watchlists")
-        watchlists = get_user_watchlists(username)
+        watchlists = dashboard['watchlists']
         if watchlists:
             cols = st.columns(min(len(watchlists), 2))
             for i, wl in enumerate(watchlists[:2]):
@@ -1113,30 +2960,8 @@ def user_page(username):
             st.markdown("---")
             
             if query or genre_filters or type_filters or people_filters:
-                results = search_media(
-                    query=query if query else None,
-                    filters=type_filters,
-                    scopes=search_scopes,
-                    genres=genre_filters,
-                    people=people_filters if people_filters else None,
-                    people_role=people_role
-                )
-                if results:
-                    st.markdown(f"### 📊 Search Results ({len(results)} found)")
-                    cols = st.columns(3)
-                    for i, media in enumerate(results):
-                        with cols[i % 3]:
-                            with st.container(border=True):
-                                st.markdown(f"**{media['title']}**")
-                                st.caption(f"{media['media_type']} • {media['release_year']} • ⭐ {media['average_rating']}")
-                                if media['description']:
-                                    st.caption(media['description'][:100] + "...")
-                                if st.button("View Details", key=f"explore_{media['media_id']}", width='stretch'):
-                                    st.session_state.previous_page = st.session_state.get('selected_nav', 'Explore')
-                                    st.session_state.selected_media_id = media['media_id']
-                                    st.rerun()
-                else:
-                    st.info("No results found")
+                search_results_panel((query or None, tuple(type_filters), tuple(search_scopes), tuple(genre_filters),
+                                      tuple(people_filters) or None, people_role))
             else:
                 st.info("Enter a search query or select filters to explore content")
 
@@ -1176,6 +3001,9 @@ def user_page(username):
             else:
                 st.info("No watchlists yet. Create one to get started!")
 
+            st.markdown("---")
+            watch_status_panel(username)
+
     elif selected == "Series Progress":
         if st.session_state.selected_media_id and st.session_state.get('update_series_mode'):
             media_details_page(st.session_state.selected_media_id, username)
@@ -1193,6 +3021,12 @@ def user_page(username):
 
             progress_list = get_series_progress(username)
             if progress_list:
+                completion = get_watch_completion(username)
+                pending = [s['media_id'] for s in progress_list if s['next_episode_id']]
+                if len(pending) > 1 and st.button(f"✅ Mark next episode watched for all ({len(pending)})"):
+                    if mark_next_watched(username, pending):
+                        st.success(f"Advanced {len(pending)} series!")
+                        st.rerun()
                 cols = st.columns(2)
                 for i, series in enumerate(progress_list):
                     with cols[i % 2]:
@@ -1203,13 +3037,27 @@ def user_page(username):
                                 st.caption(f"{series['episode_title']}")
                             else:
                                 st.caption("Not started")
+                            done = completion.get(series['media_id'])
+                            if done and done['total_episodes']:
+                                st.progress(done['percent'] / 100,
+                                            text=f"{done['watched_episodes']}/{done['total_episodes']} episodes watched")
+                            if series['next_episode_id']:
+                                st.caption(f"⏭️ Up next: S{series['next_season_number']}E{series['next_episode_number']}: "
+                                           f"{series['next_episode_title']}")
+                            else:
+                                st.caption("🏁 All caught up")
                             st.caption(f"Last watched: {series['last_watched_at']}")
+                            if series['next_episode_id'] and st.button("✅ Mark Next Watched", key=f"next_{i}", width='stretch'):
+                                if mark_next_watched(username, [series['media_id']]):
+                                    st.rerun()
                             col1, col2 = st.columns(2)
                             with col1:
                                 if st.button("Update Progress", key=f"series_{i}", width='stretch'):
                                     st.session_state.previous_page = st.session_state.get('selected_nav', 'Series Progress')
                                     st.session_state.selected_media_id = series['media_id']
                                     st.session_state.update_series_mode = True
+                                    # Open the episode picker on the season being watched
+                                    st.session_state[f"season_select_{series['media_id']}"] = series['season_number']
                                     st.rerun()
                             with col2:
                                 if st.button("🗑️ Remove", key=f"remove_series_{i}", width='stretch'):
@@ -1236,48 +3084,117 @@ def user_page(username):
 
             col1, col2 = st.columns(2, gap="large")
             with col1:
-                with st.container(border=True):
-                    st.markdown("### 👫 Your Friends")
-                    friends = get_friends(username)
-                    if friends:
-                        for friend in friends:
-                            if st.button(f"👤 {friend['firstname']} {friend['lastname']} (@{friend['username']})", 
-                                       key=f"friend_{friend['username']}", width='stretch'):
-                                st.session_state.selected_friend = friend['username']
-                                st.rerun()
-                    else:
-                        st.info("No friends yet")
+                friends_list_panel(username)
             with col2:
+                find_friends_panel(username)
+
+@page_panel
+def friends_list_panel(username):
+    """The user's friends a page at a time"""
+    with st.container(border=True):
+        st.markdown("### 👫 Your Friends")
+        friends = paged_rows("friends_list",
+                             lambda loaded, limit: get_friends(username, limit, loaded[-1] if loaded else None),
+                             count_friends(username), reset_on=username)
+        if friends:
+            for friend in friends:
+                if st.button(f"👤 {friend['firstname']} {friend['lastname']} (@{friend['username']})", 
+                           key=f"friend_{friend['username']}", width='stretch'):
+                    st.session_state.selected_friend = friend['username']
+                    st.rerun()
+            load_more_button("friends_list", noun="friends")
+        else:
+            st.info("No friends yet")
+
+@page_panel
+def search_results_panel(search):
+    """Explore results a page at a time; search is (query, types, scopes, genres, people, people role)"""
+    query, types, scopes, genres, people, people_role = search
+    people = list(people) if people else None
+    total = count_search_media(query=query, filters=list(types), scopes=list(scopes), genres=list(genres),
+                               people=people, people_role=people_role)
+    # Search order has no unique key to continue from, so later pages use an OFFSET
+    results = paged_rows(
+        "explore_results",
+        lambda loaded, limit: search_media(query=query, filters=list(types), scopes=list(scopes), genres=list(genres),
+                                           people=people, people_role=people_role, offset=len(loaded), page_size=limit),
+        total, reset_on=search
+    )
+    if results:
+        st.markdown(f"### 📊 Search Results ({total} found)" if total is not None else "### 📊 Search Results")
+        cols = st.columns(3)
+        for i, media in enumerate(results):
+            with cols[i % 3]:
                 with st.container(border=True):
-                    st.markdown("### 🔍 Find Friends")
-                    search_query = st.text_input("Search users", placeholder="Enter username or name...", key="friend_search")
-                    if st.button("🔍 Search & Send Request", width='stretch'):
-                        if search_query and search_query != username:
-                            if user_exists(search_query):
-                                if send_friend_request(username, search_query):
-                                    st.success(f"Friend request sent to {search_query}!")
-                                else:
-                                    st.error("Failed to send request. You may already be friends or have a pending request.")
-                            else:
-                                st.error("User not found. Please check the username.")
-                        else:
-                            st.warning("Enter a valid username")
-                    
-                    st.markdown("---")
-                    st.markdown("### 👥 Suggested Users")
-                    all_users = execute_query("SELECT username, firstname, lastname FROM Users WHERE username != %s LIMIT 10", (username,))
-                    if all_users:
-                        for user in all_users[:5]:
-                            is_friend = any(f['username'] == user['username'] for f in (friends or []))
-                            if not is_friend:
-                                mutual = get_mutual_friends(username, user['username'])
-                                mutual_text = f" ({len(mutual)} mutual)" if mutual else ""
-                                if st.button(f"➕ {user['firstname']} {user['lastname']}{mutual_text}", 
-                                           key=f"suggest_{user['username']}", width='stretch'):
-                                    if send_friend_request(username, user['username']):
-                                        st.success(f"Request sent to {user['username']}!")
-                                        st.rerun()
+                    st.markdown(f"**{media['title']}**")
+                    st.caption(f"{media['media_type']} • {media['release_year']} • ⭐ {media['average_rating']}")
+                    if media['description']:
+                        st.caption(media['description'][:100] + "...")
+                    if st.button("View Details", key=f"explore_{media['media_id']}", width='stretch'):
+                        st.session_state.previous_page = st.session_state.get('selected_nav', 'Explore')
+                        st.session_state.selected_media_id = media['media_id']
+                        st.rerun()
+        load_more_button("explore_results", noun="titles")
+    else:
+        st.info("No results found")
+
+@page_panel
+def watch_status_panel(username):
+    """The user's saved titles filtered by watch status"""
+    st.markdown("### 📌 My Titles")
+    counts = get_watch_status_counts(username)
+    status = st.radio(
+        "Status",
+        WATCH_STATUSES,
+        format_func=lambda s: f"{WATCH_STATUS_LABELS[s]} ({counts.get(s, 0)})",
+        horizontal=True,
+        key="watch_status_filter"
+    )
+    titles = get_titles_by_status(username, status) if counts.get(status) else []
+    if titles:
+        for title in titles:
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.markdown(f"**{title['title']}** ({title['media_type']}) • ⭐ {title['average_rating']}")
+            with col2:
+                if st.button("View", key=f"status_view_{title['media_id']}", width='stretch'):
+                    st.session_state.previous_page = 'Watchlist'
+                    st.session_state.selected_media_id = title['media_id']
+                    st.session_state.update_series_mode = False
+                    st.rerun()
+    else:
+        st.info(f"Nothing marked as {status} yet")
 
+@page_panel
+def find_friends_panel(username):
+    """User search and suggestions"""
+    with st.container(border=True):
+        st.markdown("### 🔍 Find Friends")
+        search_query = st.text_input("Search users", placeholder="Enter username or name...", key="friend_search")
+        if st.button("🔍 Search & Send Request", width='stretch'):
+            if search_query and search_query != username:
+                if user_exists(search_query):
+                    if send_friend_request(username, search_query):
+                        st.success(f"Friend request sent to {search_query}!")
+                    else:
+                        st.error("Failed to send request. You may already be friends or have a pending request.")
+                else:
+                    st.error("User not found. Please check the username.")
+            else:
+                st.warning("Enter a valid username")
+
+        st.markdown("---")
+        st.markdown("### 👥 Suggested Users")
+        for user in get_suggested_users(username) or []:
+            mutual = get_mutual_friends(username, user['username'])
+            mutual_text = f" ({len(mutual)} mutual)" if mutual else ""
+            if st.button(f"➕ {user['firstname']} {user['lastname']}{mutual_text}", 
+                       key=f"suggest_{user['username']}", width='stretch'):
+                if send_friend_request(username, user['username']):
+                    st.success(f"Request sent to {user['username']}!")
+                    rerun_panel()
+
+@profiled
 def media_details_page(media_id, username):
     """Display detailed media information"""
     st.markdown("# 🎬 Media Details")
@@ -1310,6 +3227,19 @@ def media_details_page(media_id, username):
         release_year = media.get('release_year') or "Unknown"
         st.markdown(f"**Type:** {media['media_type']} | **Year:** {release_year} | **Average Rating:** ⭐ {rating_display}")
         st.markdown(f"**Age Rating:** {media.get('age_rating') or 'Not rated'}")
+
+        if username:
+            state = get_watch_state(username, media_id)
+            status_key = f"watch_status_{media_id}"
+            # Follow the stored state, which playlists and series progress also change
+            st.session_state[status_key] = state['status'] if state else None
+            st.selectbox(
+                "📌 Your status",
+                [None] + WATCH_STATUSES,
+                format_func=lambda status: WATCH_STATUS_LABELS.get(status, "Not saved"),
+                key=status_key,
+                on_change=lambda: set_watch_status(username, media_id, st.session_state[status_key])
+            )
         
         if media.get('genres'):
             genres_str = ", ".join(media['genres'])
@@ -1323,10 +3253,24 @@ def media_details_page(media_id, username):
     
     st.markdown("---")
     
+    media_cast_crew_panel(media)
+    if media['media_type'] == 'Series':
+        media_episodes_panel(media_id, username)
+    media_reviews_panel(media_id, username)
+
+@page_panel
+def media_cast_crew_panel(media):
+    """Cast and crew cards; the longer lists open with a toggle"""
+    show_all = False
+    if max(len(media.get('cast') or []), len(media.get('crew') or [])) > CAST_PREVIEW_SIZE:
+        show_all = st.toggle("Show full cast & crew", key=f"show_all_cast_{media['media_id']}")
+    limit = None if show_all else CAST_PREVIEW_SIZE
+
     if media.get('cast'):
         st.markdown("### 🎭 Cast")
-        cols = st.columns(min(len(media['cast']), 4))
-        for i, actor in enumerate(media['cast']):
+        cast = media['cast'][:limit]
+        cols = st.columns(min(len(cast), 4))
+        for i, actor in enumerate(cast):
             with cols[i % 4]:
                 with st.container(border=True):
                     st.markdown(f"**{actor['name']}**")
@@ -1335,42 +3279,69 @@ def media_details_page(media_id, username):
     
     if media.get('crew'):
         st.markdown("### 👥 Crew")
-        cols = st.columns(min(len(media['crew']), 4))
-        for i, member in enumerate(media['crew']):
+        crew = media['crew'][:limit]
+        cols = st.columns(min(len(crew), 4))
+        for i, member in enumerate(crew):
             with cols[i % 4]:
                 with st.container(border=True):
                     st.markdown(f"**{member['name']}**")
                     st.caption(f"{member['role']}")
-    
-    if media['media_type'] == 'Series':
-        st.markdown("---")
-        st.markdown("### 📺 Episodes")
-        episodes = get_episodes_for_series(media_id)
-        if episodes:
-            if st.session_state.get('update_series_mode'):
-                st.info("Select an episode to update your progress")
-                for ep in episodes:
-                    if st.button(
-                        f"S{ep['season_number']}E{ep['episode_number']}: {ep['title']}",
-                        key=f"ep_{ep['episode_id']}",
-                        width='stretch'
-                    ):
-                        if update_series_progress(username, media_id, ep['episode_id']):
-                            st.success(f"Progress updated to {ep['title']}!")
-                            st.session_state.update_series_mode = False
-                            st.rerun()
-            else:
-                for ep in episodes[:10]:
-                    st.markdown(f"**S{ep['season_number']}E{ep['episode_number']}:** {ep['title']}")
-                    st.caption(f"Aired: {ep['air_date']}")
+
+@page_panel
+def media_episodes_panel(media_id, username):
+    """Season picker and the selected season's episodes"""
+    st.markdown("---")
+    st.markdown("### 📺 Episodes")
+    seasons = get_season_index(media_id)
+    if seasons:
+        # Only the selected season is fetched and rendered, however long the series runs
+        season_numbers = [s['season_number'] for s in seasons]
+        episode_counts = {s['season_number']: s['episode_count'] for s in seasons}
+        season_key = f"season_select_{media_id}"
+        if st.session_state.get(season_key) not in season_numbers:
+            st.session_state[season_key] = season_numbers[0]
+        season_number = st.selectbox(
+            "Season",
+            season_numbers,
+            format_func=lambda n: f"Season {n if n is not None else '?'} ({episode_counts[n]} episodes)",
+            key=season_key
+        )
+        episodes = get_season_episodes(media_id, season_number) or []
+        watched = get_watch_bitmap(username, media_id) if username else b''
+        if st.session_state.get('update_series_mode'):
+            st.info("Select an episode to update your progress")
+            for ep in episodes:
+                mark = "✅ " if is_watched(watched, ep['watch_bit']) else ""
+                if st.button(
+                    f"{mark}S{ep['season_number']}E{ep['episode_number']}: {ep['title']}",
+                    key=f"ep_{ep['episode_id']}",
+                    width='stretch'
+                ):
+                    if update_series_progress(username, media_id, ep['episode_id']):
+                        st.success(f"Progress updated to {ep['title']}!")
+                        st.session_state.update_series_mode = False
+                        st.rerun()
         else:
-            st.info("No episodes available")
+            for ep in episodes:
+                mark = "✅ " if is_watched(watched, ep['watch_bit']) else ""
+                st.markdown(f"{mark}**S{ep['season_number']}E{ep['episode_number']}:** {ep['title']}")
+                st.caption(f"Aired: {ep['air_date']}")
+    else:
+        st.info("No episodes available")
 
+@page_panel
+def media_reviews_panel(media_id, username):
+    """The viewer's review form and the community reviews"""
     st.markdown("---")
     st.markdown("### ⭐ Reviews & Ratings")
 
+    # One query serves both the community list and the viewer's own review, which always sorts first
+    reviews_key = f"reviews_{media_id}"
+    reviews = paged_rows(reviews_key,
+                         lambda loaded, limit: get_reviews_for_media(media_id, limit, username, loaded[-1] if loaded else None),
+                         count_reviews_for_media(media_id), reset_on=username)
     if username:
-        user_review = get_user_review(username, media_id)
+        user_review = reviews[0] if reviews and reviews[0]['own'] else None
         existing_rating = int(user_review['rating']) if user_review and user_review.get('rating') else 5
         existing_text = user_review['review_text'] if user_review and user_review.get('review_text') else ""
 
@@ -1393,6 +3364,8 @@ def media_details_page(media_id, username):
                 if st.button("Save Review", key=f"save_review_{media_id}"):
                     if save_user_review(username, media_id, rating_value, review_text):
                         st.success("Review saved successfully!")
+                        reset_paged_rows(reviews_key)
+                        # Full rerun: the average rating in the page header changes too
                         st.rerun()
                     else:
                         st.error("Failed to save review. Please try again.")
@@ -1406,7 +3379,6 @@ def media_details_page(media_id, username):
     else:
         st.info("Login to leave a rating and review.")
 
-    reviews = get_reviews_for_media(media_id)
     st.markdown("#### Community Reviews")
     if reviews:
         for review in reviews:
@@ -1442,9 +3414,11 @@ def media_details_page(media_id, username):
                                 st.error("Failed to remove review.")
                         else:
                             st.warning("Please provide a remark before removing the review.")
+        load_more_button(reviews_key, noun="reviews")
     else:
         st.info("No reviews yet. Be the first to add one!")
 
+@profiled
 def add_series_page(username):
     st.set_page_config(page_title="Add Series - StreamSync", page_icon="📺", layout="wide")
     
@@ -1487,9 +3461,9 @@ def add_series_page(username):
                             st.caption(media['description'][:200] + "...")
                     with col2:
                         if st.button("Add to Progress", key=f"add_{media['media_id']}", width='stretch'):
-                            episodes = get_episodes_for_series(media['media_id'])
-                            if episodes:
-                                if update_series_progress(username, media['media_id'], episodes[0]['episode_id']):
+                            first_episode = get_first_episode(media['media_id'])
+                            if first_episode:
+                                if update_series_progress(username, media['media_id'], first_episode['episode_id']):
                                     st.success(f"Added {media['title']} to your series progress!")
                                     st.rerun()
                             else:
@@ -1499,6 +3473,7 @@ def add_series_page(username):
     else:
         st.info("Enter a search query or select genres to find series")
 
+@profiled
 def watchlist_details_page(playlist_id, username):
     """Display watchlist details with items"""
     st.markdown("# 📋 Watchlist Details")
@@ -1517,13 +3492,15 @@ def watchlist_details_page(playlist_id, username):
     
     st.markdown("---")
     
-    items = get_watchlist_items(playlist_id) or []
-    playlist_info = execute_query("SELECT name, created_at FROM playlist WHERE playlist_id = %s", (playlist_id,))
+    playlist_info = execute_query("""SELECT p.name, p.created_at,
+                                            (SELECT COUNT(*) FROM Playlist_item pi
+                                             WHERE pi.playlist_id = p.playlist_id) as item_count
+                                     FROM playlist p WHERE p.playlist_id = %s""", (playlist_id,))
     playlist_meta = playlist_info[0] if playlist_info else None
     
     if playlist_meta:
         st.markdown(f"### {playlist_meta.get('name') or 'Untitled Playlist'}")
-        st.caption(f"Created: {playlist_meta.get('created_at')} • {len(items)} items")
+        st.caption(f"Created: {playlist_meta.get('created_at')} • {playlist_meta['item_count']} items")
     else:
         st.warning("Playlist not found.")
     
@@ -1538,34 +3515,45 @@ def watchlist_details_page(playlist_id, username):
                 scopes=["Title", "Cast", "Crew"]
                 )
         else:
-            results = search_media(query=None, scopes=["Title"], filters=None)
-            if results:
-                for media in results[:5]:
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.markdown(f"**{media['title']}** ({media['media_type']})")
-                    with col2:
-                        if st.button("➕ Add", key=f"add_{playlist_id}_{media['media_id']}", width='stretch'):
-                            if add_to_watchlist(playlist_id, media['media_id'], added_by=st.session_state.get('username')):
-                                st.success(f"Added {media['title']} to watchlist!")
-                                st.session_state.add_to_watchlist_mode = False
-                                st.rerun()
+            results = search_media(query=None, scopes=["Title"], filters=None, page_size=5)
+        if results:
+            titles = {media['media_id']: f"{media['title']} ({media['media_type']})" for media in results}
+            to_add = st.multiselect("Select media to add", list(titles), format_func=titles.get,
+                                    key=f"add_select_{playlist_id}")
+            if to_add and st.button(f"➕ Add {len(to_add)} selected", key=f"add_selected_{playlist_id}", type="primary"):
+                if add_to_watchlist_bulk(playlist_id, to_add, added_by=st.session_state.get('username')):
+                    st.success(f"Added {len(to_add)} items to watchlist!")
+                    st.session_state.add_to_watchlist_mode = False
+                    st.rerun()
         if st.button("Cancel", key="cancel_add_watchlist"):
             st.session_state.add_to_watchlist_mode = False
             st.rerun()
         st.markdown("---")
     
+    watchlist_items_panel(playlist_id, playlist_meta['item_count'] if playlist_meta else 0)
+
+@page_panel
+def watchlist_items_panel(playlist_id, item_count):
+    """A watchlist's items a page at a time, with reordering and removal; item_count is from the page header"""
+    sort = st.selectbox("Sort by", list(WATCHLIST_SORTS), key=f"watchlist_sort_{playlist_id}")
+    list_key = f"watchlist_items_{playlist_id}"
+    items = paged_rows(list_key,
+                       lambda loaded, limit: get_watchlist_items(playlist_id, sort, loaded[-1] if loaded else None, limit),
+                       item_count, WATCHLIST_PAGE_SIZE, reset_on=sort)
+
     if items:
+        reorderable = sort == 'Playlist order'
+        selected_items = []
         for item in items:
             with st.container(border=True):
                 col1, col2, col3 = st.columns([3, 1, 1])
                 with col1:
-                    media = get_media_by_id(item['media_id'])
-                    if media:
-                        st.markdown(f"**{media['title']}** ({media['media_type']})")
-                        st.caption(f"⭐ {media['average_rating']} • {media['release_year']}")
-                        if media.get('description'):
-                            st.caption(media['description'][:150] + "...")
+                    if st.checkbox("Select", key=f"select_{item['playlist_id']}_{item['media_id']}", label_visibility="collapsed"):
+                        selected_items.append(item['media_id'])
+                    st.markdown(f"**{item['title']}** ({item['media_type']})")
+                    st.caption(f"⭐ {item['average_rating']} • {item['release_year']}")
+                    if item.get('description'):
+                        st.caption(item['description'][:150] + "...")
                 with col2:
                         if st.button("View Details", key=f"view_{item['playlist_id']}_{item['media_id']}", width='stretch'):
                             st.session_state.previous_page = 'Watchlist'
@@ -1577,9 +3565,29 @@ def watchlist_details_page(playlist_id, username):
                         if remove_from_watchlist(item['playlist_id'], item['media_id'], removed_by=st.session_state.get('username')):
                             st.success("Removed from watchlist!")
                             st.rerun()
+                    if reorderable:
+                        col_up, col_down = st.columns(2)
+                        with col_up:
+                            if st.button("⬆️", key=f"up_{item['playlist_id']}_{item['media_id']}", width='stretch'):
+                                if move_watchlist_item(playlist_id, item['media_id'], up=True):
+                                    reset_paged_rows(list_key)
+                                    rerun_panel()
+                        with col_down:
+                            if st.button("⬇️", key=f"down_{item['playlist_id']}_{item['media_id']}", width='stretch'):
+                                if move_watchlist_item(playlist_id, item['media_id'], up=False):
+                                    reset_paged_rows(list_key)
+                                    rerun_panel()
+        if selected_items and st.button(f"🗑️ Remove {len(selected_items)} selected", key=f"remove_selected_{playlist_id}"):
+            if remove_from_watchlist_bulk(playlist_id, selected_items, removed_by=st.session_state.get('username')):
+                for media_id in selected_items:
+                    st.session_state.pop(f"select_{playlist_id}_{media_id}", None)
+                st.success(f"Removed {len(selected_items)} items from watchlist!")
+                st.rerun()
+        load_more_button(list_key, WATCHLIST_PAGE_SIZE, noun="items")
     else:
         st.info("This watchlist is empty")
 
+@profiled
 def friend_profile_page(friend_username, current_username):
     """Display friend profile in read-only mode"""
     st.markdown("# 👤 Friend Profile")
@@ -1627,6 +3635,7 @@ def friend_profile_page(friend_username, current_username):
                     st.markdown(f"**{friend['firstname']} {friend['lastname']}**")
                     st.caption(f"@{friend['username']}")
 
+@profiled
 def create_watchlist_page(username):
     st.set_page_config(page_title="Create Watchlist - StreamSync", page_icon="📋", layout="centered")
     
@@ -1663,6 +3672,7 @@ def create_watchlist_page(username):
                     set_page('User')
                     st.rerun()
 
+@profiled
 def friend_requests(username):
     st.set_page_config(page_title="Friend Requests - StreamSync", page_icon="📬", layout="wide")
     
@@ -1677,7 +3687,14 @@ def friend_requests(username):
 
     st.markdown("---")
 
-    requests = get_friend_requests(username)
+    friend_requests_panel(username)
+
+@page_panel
+def friend_requests_panel(username):
+    """Pending friend requests a page at a time, with accept and decline"""
+    requests = paged_rows("friend_requests",
+                          lambda loaded, limit: get_friend_requests(username, limit, loaded[-1] if loaded else None),
+                          count_friend_requests(username), reset_on=username)
     if requests:
         for req in requests:
             with st.container(border=True):
@@ -1689,14 +3706,292 @@ def friend_requests(username):
                     if st.button("✅ Accept", key=f"accept_{req['username']}", width='stretch'):
                         if accept_friend_request(username, req['username']):
                             st.success("Friend request accepted!")
-                            st.rerun()
+                            rerun_panel()
                 with col3:
                     if st.button("❌ Decline", key=f"decline_{req['username']}", width='stretch'):
                         st.info("Decline functionality can be added")
+        load_more_button("friend_requests", noun="requests")
     else:
         st.info("No pending friend requests")
 
+@profiled
+def bulk_import_page():
+    """Bulk import catalogue data from CSV, JSONL or Parquet files"""
+    st.markdown("# 📥 Bulk Import")
+    st.markdown("Load catalogue data in bulk. Rows are validated in batches, loaded in chunked transactions, "
+                "and existing rows with the same key are updated in the columns the file contains.")
+    st.markdown("---")
+
+    with st.container(border=True):
+        table_name = st.selectbox("Target Table", list(IMPORT_SCHEMAS.keys()), key="import_table")
+        schema = IMPORT_SCHEMAS[table_name]
+        required = [c for c, (_, _, req) in schema['columns'].items() if req]
+        st.caption(f"Columns: {', '.join(schema['columns'])} • Required: {', '.join(required)}")
+        uploaded = st.file_uploader("Data File", type=["csv", "jsonl", "parquet"], key="import_file")
+
+        if uploaded and st.button("📥 Start Import", width='stretch', type="primary"):
+            if get_db_connection():
+                file_format = os.path.splitext(uploaded.name)[1].lstrip('.').lower()
+                progress = st.empty()
+
+                def report_progress(rows_read, rows_loaded, elapsed):
+                    rate = rows_loaded / elapsed if elapsed else 0
+                    progress.info(f"Read {rows_read:,} rows • loaded {rows_loaded:,} • {rate:,.0f} rows/sec")
+
+                try:
+                    result = bulk_import(table_name, uploaded, file_format, progress_callback=report_progress)
+                except (Error, ValueError, pa.ArrowException) as e:
+                    st.error(f"Import failed: {e}")
+                else:
+                    log_activity(
+                        table_name,
+                        "INSERT",
+                        f"bulk:{uploaded.name}",
+                        f"Bulk imported {result['loaded']} rows into {table_name} "
+                        f"({result['rejected']} rejected) from {uploaded.name}",
+                        st.session_state.get('username')
+                    )
+                    st.session_state.last_import = result
+
+    result = st.session_state.get('last_import')
+    if result:
+        st.markdown("---")
+        st.markdown(f"### 📊 Last Import: {result['table']}")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Rows Read", f"{result['rows']:,}")
+        with col2:
+            st.metric("Loaded", f"{result['loaded']:,}")
+        with col3:
+            st.metric("Rejected", f"{result['rejected']:,}")
+        with col4:
+            st.metric("Rows/sec", f"{result['rows_per_sec']:,.0f}")
+        st.caption(f"Finished in {result['seconds']:.1f}s")
+
+        if result['rejects']:
+            rejects_df = pd.DataFrame(result['rejects'])
+            st.dataframe(rejects_df.head(100), width='stretch', hide_index=True)
+            if result['rejected'] > len(result['rejects']):
+                st.caption(f"Only the first {len(result['rejects']):,} rejects are kept.")
+            st.download_button(
+                "⬇️ Download Rejects",
+                data=rejects_df.to_csv(index=False),
+                file_name=f"{result['table']}_rejects.csv",
+                mime="text/csv",
+                width='stretch'
+            )
+
+def finish_export_download():
+    """Delete the last export once its download has been served"""
+    last_export = st.session_state.get('last_export')
+    if last_export:
+        remove_export_file(last_export['path'])
+        st.session_state.last_export = None
+
+@profiled
+def table_export_page(key_prefix):
+    """Export any database table to CSV or Parquet"""
+    st.markdown("# 📤 Export")
+    st.markdown("Export a full table to CSV or Parquet. Rows are streamed in chunks, so large tables are safe to export.")
+    st.markdown("---")
+
+    with st.container(border=True):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            table_name = st.selectbox("Table", DATABASE_TABLES, key=f"{key_prefix}_export_table")
+        with col2:
+            file_format = st.radio("Format", ["CSV", "Parquet"], horizontal=True, key=f"{key_prefix}_export_format")
+
+        if st.button("📤 Start Export", width='stretch', type="primary", key=f"{key_prefix}_export_start"):
+            if get_db_connection():
+                progress = st.progress(0.0, text="Starting export...")
+
+                def report_progress(rows_written, total_estimate):
+                    fraction = min(rows_written / total_estimate, 1.0) if total_estimate else 0.0
+                    progress.progress(fraction, text=f"Exported {rows_written:,} rows...")
+
+                try:
+                    path, rows_written = export_table(
+                        table_name,
+                        file_format.lower(),
+                        progress_callback=report_progress
+                    )
+                except (Error, OSError, ValueError, pa.ArrowException) as e:
+                    st.error(f"Export failed: {e}")
+                else:
+                    progress.progress(1.0, text=f"Exported {rows_written:,} rows")
+                    if st.session_state.get('last_export'):
+                        remove_export_file(st.session_state.last_export['path'])
+                    st.session_state.last_export = {
+                        'table': table_name,
+                        'path': path,
+                        'rows': rows_written,
+                        'format': file_format
+                    }
+
+    last_export = st.session_state.get('last_export')
+    if last_export and os.path.exists(last_export['path']):
+        st.markdown("---")
+        with st.container(border=True):
+            size = os.path.getsize(last_export['path'])
+            st.markdown(f"### ✅ {last_export['table']} ({last_export['format']})")
+            st.caption(f"{last_export['rows']:,} rows • {size / (1024 * 1024):.1f} MB • saved to `{last_export['path']}`")
+            if size <= EXPORT_DOWNLOAD_LIMIT:
+                mime = "text/csv" if last_export['format'] == "CSV" else "application/octet-stream"
+                with open(last_export['path'], 'rb') as f:
+                    st.download_button(
+                        "⬇️ Download",
+                        data=f,
+                        file_name=os.path.basename(last_export['path']),
+                        mime=mime,
+                        width='stretch',
+                        key=f"{key_prefix}_export_download",
+                        on_click=finish_export_download
+                    )
+            else:
+                st.info("File is too large to download through the browser. Copy it from the path above.")
+
+
+@profiled
+def performance_page():
+    """Query latency histograms and slow-query log collected by execute_query"""
+    stats = get_query_stats()
+    st.markdown("# ⚡ Performance")
+    st.markdown(f"Query timings for this app process since {stats['since'].strftime('%Y-%m-%d %H:%M:%S')}.")
+    st.markdown("---")
+
+    with stats['lock']:
+        entries = {key: dict(entry, buckets=list(entry['buckets'])) for key, entry in stats['entries'].items()}
+        slow_log = list(stats['slow_log'])
+
+    with st.container(border=True):
+        st.markdown("### ⚙️ Slow-Query Log Settings")
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col1:
+            slow_ms = st.number_input("Threshold (ms)", min_value=1, value=int(stats['settings']['slow_ms']), step=50)
+        with col2:
+            sample_rate = st.slider("Sample rate", 0.0, 1.0, float(stats['settings']['sample_rate']), 0.05)
+        with col3:
+            st.write("")
+            if st.button("🧹 Reset", width='stretch'):
+                reset_query_stats()
+                st.rerun()
+        profile_reruns = st.toggle("⏱️ Profile every rerun (all sessions)",
+                                   value=bool(stats['settings'].get('profile_reruns')),
+                                   help="Records script time, time per page function, DB queries and cache hits for "
+                                        "each rerun. Any session can also add ?profile=1 to its URL.")
+        stats['settings'].update(slow_ms=slow_ms, sample_rate=sample_rate, profile_reruns=profile_reruns)
+
+    total_calls = sum(e['calls'] for e in entries.values())
+    total_ms = sum(e['total_ms'] for e in entries.values())
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Queries", f"{total_calls:,}")
+    with col2:
+        st.metric("Errors", f"{sum(e['errors'] for e in entries.values()):,}")
+    with col3:
+        st.metric("Total DB Time", f"{total_ms / 1000:,.1f} s")
+    with col4:
+        st.metric("Slow Queries Logged", len(slow_log))
+
+    st.markdown("### 📊 By Call Site")
+    group_by = st.radio("Group by", ["Call site + SQL", "Call site", "SQL fingerprint"], horizontal=True)
+    grouped = {}
+    for (call_site, fingerprint), entry in entries.items():
+        key = {"Call site + SQL": (call_site, fingerprint), "Call site": (call_site, ""),
+               "SQL fingerprint": ("", fingerprint)}[group_by]
+        merged = grouped.setdefault(key, {'calls': 0, 'errors': 0, 'rows': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                                          'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1)})
+        for field in ('calls', 'errors', 'rows', 'total_ms'):
+            merged[field] += entry[field]
+        merged['max_ms'] = max(merged['max_ms'], entry['max_ms'])
+        merged['buckets'] = [a + b for a, b in zip(merged['buckets'], entry['buckets'])]
+
+    if grouped:
+        rows = []
+        for (call_site, fingerprint), e in grouped.items():
+            rows.append({
+                'call_site': call_site,
+                'sql': fingerprint,
+                'calls': e['calls'],
+                'errors': e['errors'],
+                'total_ms': round(e['total_ms'], 1),
+                'avg_ms': round(e['total_ms'] / e['calls'], 2),
+                'p50_ms ≤': histogram_percentile(e['buckets'], 50),
+                'p95_ms ≤': histogram_percentile(e['buckets'], 95),
+                'p99_ms ≤': histogram_percentile(e['buckets'], 99),
+                'max_ms': round(e['max_ms'], 1),
+                'avg_rows': round(e['rows'] / e['calls'], 1),
+            })
+        df = pd.DataFrame(rows).sort_values('total_ms', ascending=False)
+        if group_by == "Call site":
+            df = df.drop(columns=['sql'])
+        elif group_by == "SQL fingerprint":
+            df = df.drop(columns=['call_site'])
+        st.dataframe(df, width='stretch', hide_index=True)
+        st.caption("Percentiles are histogram bucket upper bounds.")
+    else:
+        st.info("No queries recorded yet")
+
+    st.markdown("### 🐢 Slow-Query Log")
+    if slow_log:
+        st.dataframe(pd.DataFrame(reversed(slow_log)).astype({'params': str}), width='stretch', hide_index=True)
+    else:
+        st.info(f"No queries slower than {stats['settings']['slow_ms']} ms")
+
+    st.markdown("### 🗂️ Catalogue Cache")
+    cache = get_catalogue_cache()
+    with cache['lock']:
+        sizes = {}
+        for key in cache['entries']:
+            sizes[key[0]] = sizes.get(key[0], 0) + 1
+        cache_stats = {kind: dict(counts) for kind, counts in cache['stats'].items()}
+    if cache_stats:
+        rows = []
+        for kind, counts in sorted(cache_stats.items()):
+            lookups = counts['hits'] + counts['misses']
+            rows.append(dict(kind=kind, entries=sizes.get(kind, 0), **counts,
+                             hit_rate=f"{counts['hits'] / lookups:.0%}" if lookups else "-"))
+        st.dataframe(pd.DataFrame(rows), width='stretch', hide_index=True)
+    else:
+        st.info("Catalogue cache is empty")
+    st.caption(f"{sum(sizes.values()):,} of {CATALOGUE_CACHE_SIZE:,} entries • TTL {CATALOGUE_CACHE_TTL}s")
+    if st.button("🧹 Clear Catalogue Cache"):
+        clear_catalogue_cache()
+        st.rerun()
+
+    st.markdown("### 🧭 Recent Reruns")
+    history = get_rerun_profiles()
+    with history['lock']:
+        runs = list(history['runs'])
+    if runs:
+        df = pd.DataFrame([{
+            'page': r['page'], 'total_ms': r['total_ms'], 'queries': r['queries'], 'query_ms': r['query_ms'],
+            'cache_hits': r['cache_hits'], 'cache_misses': r['cache_misses']
+        } for r in runs])
+        by_page = df.groupby('page').agg(
+            reruns=('total_ms', 'size'),
+            avg_ms=('total_ms', 'mean'),
+            p95_ms=('total_ms', lambda v: v.quantile(0.95)),
+            avg_queries=('queries', 'mean'),
+            avg_query_ms=('query_ms', 'mean'),
+            cache_hits=('cache_hits', 'sum'),
+            cache_misses=('cache_misses', 'sum'),
+        ).round(1).sort_values('avg_ms', ascending=False)
+        st.dataframe(by_page, width='stretch')
+        for run in reversed(runs[-10:]):
+            with st.expander(f"{run['at'].strftime('%H:%M:%S')} • {run['page']} • {run['user'] or 'anonymous'} • "
+                             f"{run['total_ms']:.0f} ms • {run['queries']} queries"):
+                if run['sections']:
+                    sections = pd.DataFrame(run['sections'])
+                    sections['function'] = ['↳ ' * d + f for d, f in zip(sections['depth'], sections['function'])]
+                    st.dataframe(sections.drop(columns=['depth']), width='stretch', hide_index=True)
+                if 'n_plus_one' in run:
+                    render_query_diagnostics(run['page'], run['queries'], run['n_plus_one'])
+    else:
+        st.info("No reruns profiled yet. Turn on profiling above.")
 
+@profiled
 def admin_page():
     st.set_page_config(page_title="StreamSync - Admin Dashboard", page_icon="🎛️", layout="wide")
     
@@ -1714,7 +4009,10 @@ def admin_page():
         nav_options = {
             "🏠 Home": "Home",
             "🔄 Changes": "Changes",
-            "👥 Database Handlers": "Database Handlers"
+            "👥 Database Handlers": "Database Handlers",
+            "📥 Import": "Import",
+            "📤 Export": "Export",
+            "⚡ Performance": "Performance"
         }
         
         selected = None
@@ -1767,10 +4065,7 @@ def admin_page():
         st.markdown("Track all recent database changes and operations performed by handlers.")
         st.markdown("---")
 
-        table_filter = st.selectbox("Filter by Table", ["All Tables", "Users", "Media", "genres", "Episodes", 
-                                                         "Watchlists_item", "playlist", "Playlist_item", 
-                                                         "Media_Genres", "Series_Progress_Table", "Reviews_Table", 
-                                                         "Friends", "People", "Media_Cast", "Media_Crew", "Activity_Log"])
+        table_filter = st.selectbox("Filter by Table", ["All Tables"] + DATABASE_TABLES)
         
         if table_filter == "All Tables":
             logs = get_activity_logs(100)
@@ -1859,6 +4154,16 @@ def admin_page():
         st.markdown("---")
         st.info("💡 Handlers ensure data integrity and perform maintenance tasks.")
 
+    elif selected == "Import":
+        bulk_import_page()
+
+    elif selected == "Export":
+        table_export_page("admin")
+
+    elif selected == "Performance":
+        performance_page()
+
+@profiled
 def database_handler_page():
     st.set_page_config(page_title="StreamSync - Database Handler", page_icon="🗄️", layout="wide")
     
@@ -1877,7 +4182,9 @@ def database_handler_page():
             "🏠 Home": "Home",
             "🔄 Changes": "Changes",
             "🗃️ Database": "Database",
-            "👥 Database Handlers": "Database Handlers"
+            "👥 Database Handlers": "Database Handlers",
+            "📥 Import": "Import",
+            "📤 Export": "Export"
         }
         
         selected = None
@@ -1990,10 +4297,7 @@ def database_handler_page():
         st.markdown("Track all recent database changes and operations performed by handlers.")
         st.markdown("---")
 
-        table_filter = st.selectbox("Filter by Table", ["All Tables", "Users", "Media", "genres", "Episodes", 
-                                                         "Watchlists_item", "playlist", "Playlist_item", 
-                                                         "Media_Genres", "Series_Progress_Table", "Reviews_Table", 
-                                                         "Friends", "People", "Media_Cast", "Media_Crew", "Activity_Log"])
+        table_filter = st.selectbox("Filter by Table", ["All Tables"] + DATABASE_TABLES)
         
         if table_filter == "All Tables":
             logs = get_activity_logs(100)
@@ -2015,9 +4319,7 @@ def database_handler_page():
         st.markdown("---")
 
         st.markdown("### Available Tables")
-        tables = ["Users", "Media", "genres", "Episodes", "Watchlists_item", "playlist", "Playlist_item", 
-                  "Media_Genres", "Series_Progress_Table", "Reviews_Table", "Friends", "People", 
-                  "Media_Cast", "Media_Crew", "Activity_Log"]
+        tables = DATABASE_TABLES
 
         cols = st.columns(3)
         for i, table in enumerate(tables):
@@ -2094,6 +4396,185 @@ def database_handler_page():
         st.markdown("---")
         st.info("💡 Handlers ensure data integrity and perform maintenance tasks.")
 
+    elif selected == "Import":
+        bulk_import_page()
+
+    elif selected == "Export":
+        table_export_page("db")
+
+def schema_input(col, table_schema, key, value=None):
+    """Render a form input matching a column's type"""
+    field = col['Field']
+    data_type = col['data_type']
+    help_text = col['Type']
+    if field in table_schema['foreign_keys']:
+        ref_table, ref_column = table_schema['foreign_keys'][field]
+        help_text += f" • references {ref_table}.{ref_column}"
+    if data_type in ('enum', 'set'):
+        options = [""] + col['enum_values']
+        index = options.index(value) if value in options else 0
+        return st.selectbox(field, options, index=index, key=key, help=help_text)
+    if data_type == 'bigint':
+        # number_input goes through JavaScript numbers and would round values above 2**53
+        return st.text_input(field, value="" if value is None else str(value), key=key, help=help_text)
+    if data_type in INTEGER_TYPES:
+        return st.number_input(field, value=int(value) if value is not None else None, step=1, key=key, help=help_text)
+    if data_type in DECIMAL_TYPES:
+        return st.number_input(field, value=float(value) if value is not None else None, step=0.1,
+                               format="%.1f", key=key, help=help_text)
+    if data_type == 'date':
+        return st.date_input(field, value=value, min_value=date(1900, 1, 1), key=key, help=help_text)
+    return st.text_input(field, value="" if value is None else str(value), max_chars=col['max_length'],
+                         key=key, help=help_text)
+
+@page_panel
+def table_update_panel(table_name, data, table_schema, id_col, editable_columns):
+    """Pick a record and edit it; data is the page's snapshot, so picking issues no queries"""
+    with st.container(border=True):
+        st.markdown("### ✏️ Update Existing Record")
+        if not data:
+            st.info("No data available to update")
+        else:
+            record_options = {}
+            for record in data:
+                record_id_value = record.get(id_col)
+                if record_id_value is None:
+                    continue
+                display_val = str(record_id_value)
+                if len(display_val) > 60:
+                    display_val = display_val[:60] + "..."
+                display_key = f"{id_col}: {display_val}"
+                if display_key not in record_options:
+                    record_options[display_key] = record
+
+            if not record_options:
+                st.warning("Could not determine records for updating.")
+            else:
+                selected_label = st.selectbox("Select record to update", list(record_options.keys()), key=f"select_update_{table_name}")
+                selected_record = record_options[selected_label]
+                record_id_value = selected_record.get(id_col)
+
+                with st.form(f"update_{table_name}"):
+                    st.markdown(f"**Updating record with {id_col} = {record_id_value}**")
+                    update_inputs = {}
+                    for col in editable_columns:
+                        if col['Field'] == id_col:
+                            continue
+                        update_inputs[col['Field']] = schema_input(
+                            col,
+                            table_schema,
+                            key=f"update_{table_name}_{col['Field']}_{record_id_value}",
+                            value=selected_record.get(col['Field'])
+                        )
+
+                    if st.form_submit_button("💾 Update Record", width='stretch', type="primary"):
+                        changes = {
+                            field: value for field, value in update_inputs.items()
+                            if value not in (None, '') and str(selected_record.get(field, '')) != str(value)
+                        }
+                        if changes:
+                            if update_table_record(table_name, id_col, record_id_value, changes):
+                                log_activity(
+                                    table_name,
+                                    "UPDATE",
+                                    record_id_value,
+                                    f"Updated fields {list(changes.keys())} in {table_name}",
+                                    st.session_state.get('username')
+                                )
+                                st.success("Record updated successfully! 🎉")
+                                st.rerun()
+                            else:
+                                st.error("Failed to update record")
+                        else:
+                            st.warning("No changes detected. Please modify at least one field.")
+
+@page_panel
+def table_delete_panel(table_name, data, id_col):
+    """Pick a record and delete it"""
+    with st.container(border=True):
+        st.markdown("### 🗑️ Delete Record")
+        if not data:
+            st.info("No data available to delete")
+        else:
+            delete_options = {}
+            for record in data:
+                record_id_value = record.get(id_col)
+                if record_id_value is None:
+                    continue
+                display_val = str(record_id_value)
+                if len(display_val) > 60:
+                    display_val = display_val[:60] + "..."
+                display_key = f"{id_col}: {display_val}"
+                if display_key not in delete_options:
+                    delete_options[display_key] = record_id_value
+
+            if not delete_options:
+                st.warning("Could not determine records for deletion.")
+            else:
+                col_select, col_button = st.columns([3, 1])
+                with col_select:
+                    selected_delete_label = st.selectbox(
+                        "Select record to delete",
+                        list(delete_options.keys()),
+                        key=f"select_delete_{table_name}"
+                    )
+                with col_button:
+                    if st.button("🗑️ Delete", width='stretch', type="primary"):
+                        record_id_value = delete_options[selected_delete_label]
+                        if delete_table_record(table_name, id_col, record_id_value):
+                            log_activity(
+                                table_name,
+                                "DELETE",
+                                record_id_value,
+                                f"Deleted record from {table_name}",
+                                st.session_state.get('username')
+                            )
+                            st.success("Record deleted successfully!")
+                            st.rerun()
+                        else:
+                            st.error("Failed to delete record")
+
+@page_panel
+def table_batch_panel(table_name, data, table_schema, id_col, editable_columns):
+    """Edit and delete many rows, applied in one transaction"""
+    with st.container(border=True):
+        st.markdown("### 🧮 Batch Edit")
+        if not data:
+            st.info("No data available to edit")
+        else:
+            key_columns = table_schema['primary_key'] or [id_col]
+            st.caption("Edit cells and tick 🗑️ to delete rows, then apply everything in a single transaction.")
+            editor_df = pd.DataFrame(data)
+            editor_df.insert(0, "🗑️", False)
+            editable_fields = {col['Field'] for col in editable_columns}
+            locked = [c for c in editor_df.columns if c != "🗑️" and (c in key_columns or c not in editable_fields)]
+            editor_key = f"batch_{table_name}"
+            st.data_editor(editor_df, disabled=locked, hide_index=True, width='stretch', key=editor_key)
+
+            if st.button("💾 Apply Changes", width='stretch', type="primary", key=f"batch_apply_{table_name}"):
+                edited_rows = st.session_state.get(editor_key, {}).get('edited_rows', {})
+                updates = []
+                deletes = []
+                for position, changes in edited_rows.items():
+                    record = data[int(position)]
+                    key_values = [record.get(c) for c in key_columns]
+                    if changes.get("🗑️"):
+                        deletes.append(key_values)
+                        continue
+                    field_changes = {k: v for k, v in changes.items() if k != "🗑️"}
+                    if field_changes:
+                        updates.append((key_values, field_changes))
+                if updates or deletes:
+                    if apply_table_batch(table_name, key_columns, updates, deletes, st.session_state.get('username')):
+                        st.success(f"Applied {len(updates)} updates and {len(deletes)} deletes! 🎉")
+                        del st.session_state[editor_key]
+                        st.rerun()
+                    else:
+                        st.error("Failed to apply changes. Nothing was saved.")
+                else:
+                    st.warning("No changes detected.")
+
+@profiled
 def table_data_page():
     st.set_page_config(page_title="Table Data - StreamSync", page_icon="📊", layout="wide")
     
@@ -2119,15 +4600,20 @@ def table_data_page():
 
     st.markdown("---")
     
-    columns = get_table_columns(table_name)
-    if not columns:
+    if st.button("🔄 Refresh Schema", key=f"refresh_schema_{table_name}"):
+        invalidate_schema_cache()
+        st.rerun()
+
+    table_schema = get_table_schema(table_name)
+    if not table_schema:
         st.warning("Unable to load table metadata.")
         return
+    columns = table_schema['columns']
 
-    def detect_id_column(cols):
-        primary = next((c['Field'] for c in cols if c.get('Key') == 'PRI'), None)
-        if primary:
-            return primary
+    def detect_id_column(schema):
+        if schema['primary_key']:
+            return schema['primary_key'][0]
+        cols = schema['columns']
         fallback = next(
             (
                 c['Field'] for c in cols
@@ -2137,13 +4623,13 @@ def table_data_page():
         )
         return fallback or cols[0]['Field']
 
-    id_col = detect_id_column(columns)
+    id_col = detect_id_column(table_schema)
     editable_columns = [
         col for col in columns
         if col['Field'] not in ['created_at', 'updated_at', 'changed_at'] and col['Extra'] != 'auto_increment'
     ]
 
-    tab1, tab2, tab3 = st.tabs(["➕ Insert New Record", "✏️ Update Existing Record", "🗑️ Delete Record"])
+    tab1, tab2, tab3, tab4 = st.tabs(["➕ Insert New Record", "✏️ Update Existing Record", "🗑️ Delete Record", "🧮 Batch Edit"])
     
     with tab1:
         with st.container(border=True):
@@ -2151,10 +4637,10 @@ def table_data_page():
             with st.form(f"insert_{table_name}"):
                 form_data = {}
                 for col in editable_columns:
-                    form_data[col['Field']] = st.text_input(col['Field'], key=f"insert_{table_name}_{col['Field']}")
+                    form_data[col['Field']] = schema_input(col, table_schema, key=f"insert_{table_name}_{col['Field']}")
                 
                 if st.form_submit_button("✨ Insert", width='stretch', type="primary"):
-                    filtered_data = {k: v for k, v in form_data.items() if v}
+                    filtered_data = {k: v for k, v in form_data.items() if v not in (None, '')}
                     if filtered_data:
                         if insert_table_record(table_name, filtered_data):
                             record_identifier = filtered_data.get(id_col, 'N/A')
@@ -2173,110 +4659,13 @@ def table_data_page():
                         st.warning("Please fill in at least one field")
     
     with tab2:
-        with st.container(border=True):
-            st.markdown("### ✏️ Update Existing Record")
-            if not data:
-                st.info("No data available to update")
-            else:
-                record_options = {}
-                for record in data:
-                    record_id_value = record.get(id_col)
-                    if record_id_value is None:
-                        continue
-                    display_val = str(record_id_value)
-                    if len(display_val) > 60:
-                        display_val = display_val[:60] + "..."
-                    display_key = f"{id_col}: {display_val}"
-                    if display_key not in record_options:
-                        record_options[display_key] = record
-
-                if not record_options:
-                    st.warning("Could not determine records for updating.")
-                else:
-                    selected_label = st.selectbox("Select record to update", list(record_options.keys()), key=f"select_update_{table_name}")
-                    selected_record = record_options[selected_label]
-                    record_id_value = selected_record.get(id_col)
-
-                    with st.form(f"update_{table_name}"):
-                        st.markdown(f"**Updating record with {id_col} = {record_id_value}**")
-                        update_inputs = {}
-                        for col in editable_columns:
-                            if col['Field'] == id_col:
-                                continue
-                            current_val = selected_record.get(col['Field'], '')
-                            if current_val is None:
-                                current_val = ''
-                            update_inputs[col['Field']] = st.text_input(
-                                col['Field'],
-                                value=str(current_val),
-                                key=f"update_{table_name}_{col['Field']}_{record_id_value}"
-                            )
-
-                        if st.form_submit_button("💾 Update Record", width='stretch', type="primary"):
-                            changes = {
-                                field: value for field, value in update_inputs.items()
-                                if str(selected_record.get(field, '')) != value and value != ''
-                            }
-                            if changes:
-                                if update_table_record(table_name, id_col, record_id_value, changes):
-                                    log_activity(
-                                        table_name,
-                                        "UPDATE",
-                                        record_id_value,
-                                        f"Updated fields {list(changes.keys())} in {table_name}",
-                                        st.session_state.get('username')
-                                    )
-                                    st.success("Record updated successfully! 🎉")
-                                    st.rerun()
-                                else:
-                                    st.error("Failed to update record")
-                            else:
-                                st.warning("No changes detected. Please modify at least one field.")
-
+        table_update_panel(table_name, data, table_schema, id_col, editable_columns)
     with tab3:
-        with st.container(border=True):
-            st.markdown("### 🗑️ Delete Record")
-            if not data:
-                st.info("No data available to delete")
-            else:
-                delete_options = {}
-                for record in data:
-                    record_id_value = record.get(id_col)
-                    if record_id_value is None:
-                        continue
-                    display_val = str(record_id_value)
-                    if len(display_val) > 60:
-                        display_val = display_val[:60] + "..."
-                    display_key = f"{id_col}: {display_val}"
-                    if display_key not in delete_options:
-                        delete_options[display_key] = record_id_value
-
-                if not delete_options:
-                    st.warning("Could not determine records for deletion.")
-                else:
-                    col_select, col_button = st.columns([3, 1])
-                    with col_select:
-                        selected_delete_label = st.selectbox(
-                            "Select record to delete",
-                            list(delete_options.keys()),
-                            key=f"select_delete_{table_name}"
-                        )
-                    with col_button:
-                        if st.button("🗑️ Delete", width='stretch', type="primary"):
-                            record_id_value = delete_options[selected_delete_label]
-                            if delete_table_record(table_name, id_col, record_id_value):
-                                log_activity(
-                                    table_name,
-                                    "DELETE",
-                                    record_id_value,
-                                    f"Deleted record from {table_name}",
-                                    st.session_state.get('username')
-                                )
-                                st.success("Record deleted successfully!")
-                                st.rerun()
-                            else:
-                                st.error("Failed to delete record")
+        table_delete_panel(table_name, data, id_col)
+    with tab4:
+        table_batch_panel(table_name, data, table_schema, id_col, editable_columns)
 
+@profiled
 def add_handler_page():
     st.set_page_config(page_title="Add Handler - StreamSync", page_icon="➕", layout="centered")
     
@@ -2326,38 +4715,60 @@ def add_handler_page():
                     set_page('Admin')
                     st.rerun()
 
-# Main application routing
-page = st.session_state.get('page', 'Landing')
-
-if page == 'Landing':
-    landing_page()
-elif page == 'Login':
-    login_page()
-elif page == 'Register':
-    register_page()
-elif page == 'User':
-    if st.session_state.get('username'):
-        user_page(st.session_state.username)
-    else:
-        set_page('Landing')
-        st.rerun()
-elif page == 'Admin':
-    if st.session_state.get('username') and st.session_state.get('user_role') == 'admin':
-        admin_page()
-    else:
-        set_page('Landing')
-        st.rerun()
-elif page == 'Database Handler':
-    if st.session_state.get('username') and st.session_state.get('user_role') == 'moderator':
-        database_handler_page()
-    else:
-        set_page('Landing')
-        st.rerun()
-elif page == 'Add Handler':
-    if st.session_state.get('username') and st.session_state.get('user_role') == 'admin':
-        add_handler_page()
+def route_page():
+    """Render the page selected in session state"""
+    page = st.session_state.get('page', 'Landing')
+
+    if page == 'Landing':
+        landing_page()
+    elif page == 'Login':
+        login_page()
+    elif page == 'Register':
+        register_page()
+    elif page == 'User':
+        if st.session_state.get('username'):
+            user_page(st.session_state.username)
+        else:
+            set_page('Landing')
+            st.rerun()
+    elif page == 'Admin':
+        if st.session_state.get('username') and st.session_state.get('user_role') == 'admin':
+            admin_page()
+        else:
+            set_page('Landing')
+            st.rerun()
+    elif page == 'Database Handler':
+        if st.session_state.get('username') and st.session_state.get('user_role') == 'moderator':
+            database_handler_page()
+        else:
+            set_page('Landing')
+            st.rerun()
+    elif page == 'Table Data':
+        if st.session_state.get('username') and st.session_state.get('user_role') == 'moderator':
+            table_data_page()
+        else:
+            set_page('Landing')
+            st.rerun()
+    elif page == 'Add Handler':
+        if st.session_state.get('username') and st.session_state.get('user_role') == 'admin':
+            add_handler_page()
+        else:
+            set_page('Landing')
+            st.rerun()
     else:
-        set_page('Landing')
-        st.rerun()
-else:
-    landing_page()
+        landing_page()
+
+def main():
+    """Main application routing, profiled per rerun when enabled"""
+    start_rerun_profile()
+    try:
+        route_page()
+        render_rerun_profile()
+        enforce_query_budget()
+    finally:
+        # st.rerun() raises out of route_page; the aborted run is still recorded
+        finish_rerun_profile()
+
+# Importing the module (benchmarks, load tests) must not render a page
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+Database benchmark suite for the data-access functions in app.py.
+
+Seeds the database with reset_database.py's synthetic generator at each scale
+factor, then calls every read function with parameters drawn from the seeded
+data and records latency percentiles, rows examined (session Handler_read_*
+counters) and statements per call. Results are written as JSON so runs from
+different commits can be compared with --compare.
+
+WARNING: seeding drops and recreates the Streamsync database, exactly like
+reset_database.py. Use --skip-seed to benchmark the data already loaded.
+
+    python benchmark.py --scales 0.1,1 --iterations 200
+    python benchmark.py --skip-seed --output after.json --compare before.json
+    python benchmark.py --skip-seed --rtt-ms 20 --functions get_media_full_details
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+import app
+import reset_database
+
+DEFAULT_OUTPUT = 'benchmark_results.json'
+WARMUP_CALLS = 5
+# A change is flagged when p95 latency or rows examined grows by more than this
+REGRESSION_THRESHOLD = 0.20
+# Latency differences below this are noise on a local server
+MIN_REGRESSION_MS = 0.5
+
+class SimulatedLatencyCursor:
+    """Cursor that waits one round trip before every statement"""
+
+    def __init__(self, cursor, rtt):
+        self._cursor = cursor
+        self._rtt = rtt
+
+    def execute(self, *args, **kwargs):
+        time.sleep(self._rtt)
+        return self._cursor.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        time.sleep(self._rtt)
+        return self._cursor.executemany(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+class SimulatedLatencyConnection:
+    """Connection wrapper that adds a fixed network round trip, like a remote database server"""
+
+    def __init__(self, conn, rtt_ms):
+        self._conn = conn
+        self._rtt = rtt_ms / 1000
+
+    def cursor(self, *args, **kwargs):
+        return SimulatedLatencyCursor(self._conn.cursor(*args, **kwargs), self._rtt)
+
+    def commit(self):
+        time.sleep(self._rtt)
+        return self._conn.commit()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+STATUS_QUERY = "SHOW SESSION STATUS WHERE Variable_name LIKE 'Handler_read%' OR Variable_name = 'Questions'"
+
+# ==================== PARAMETER SAMPLING ====================
+
+def _column(cursor, query, params=()):
+    """First column of a query as a list"""
+    cursor.execute(query, params)
+    return [row[0] for row in cursor.fetchall()]
+
+def load_parameter_pools(conn, rng, pool_size=500):
+    """Sample realistic parameters from the seeded data"""
+    cursor = conn.cursor()
+    users = _column(cursor, "SELECT username FROM Users WHERE role = 'user' ORDER BY RAND(%s) LIMIT %s",
+                    (int(rng.integers(1 << 31)), pool_size))
+    # Popular titles are opened far more often: rank by review count and draw with a Zipf bias
+    media = _column(cursor, """SELECT m.media_id FROM Media m
+                               LEFT JOIN Reviews_Table r ON r.media_id = m.media_id
+                               GROUP BY m.media_id ORDER BY COUNT(r.review_id) DESC LIMIT %s""", (pool_size * 4,))
+    series = _column(cursor, "SELECT media_id FROM Media WHERE media_type = 'Series' LIMIT %s", (pool_size,))
+    titles = _column(cursor, "SELECT title FROM Media ORDER BY RAND(%s) LIMIT %s",
+                     (int(rng.integers(1 << 31)), pool_size))
+    genres = _column(cursor, "SELECT name FROM genres")
+    people = _column(cursor, "SELECT name FROM People ORDER BY RAND(%s) LIMIT %s",
+                     (int(rng.integers(1 << 31)), pool_size))
+    playlists = _column(cursor, "SELECT playlist_id FROM playlist ORDER BY RAND(%s) LIMIT %s",
+                        (int(rng.integers(1 << 31)), pool_size))
+    cursor.execute("""SELECT username_1, username_2 FROM Friends WHERE status = 'accepted'
+                      ORDER BY RAND(%s) LIMIT %s""", (int(rng.integers(1 << 31)), pool_size))
+    friend_pairs = cursor.fetchall()
+    handlers = _column(cursor, """SELECT username FROM Activity_Log GROUP BY username
+                                  ORDER BY COUNT(*) DESC LIMIT %s""", (pool_size,))
+    cursor.close()
+    return {
+        'users': users or ['user001'],
+        'media': media or ['M001'],
+        'series': series or media or ['M001'],
+        'words': sorted({w for t in titles for w in t.split() if len(w) > 3}) or ['the'],
+        'genres': genres or ['Action'],
+        'people': people or [''],
+        'playlists': playlists or ['PL0000001001'],
+        'friend_pairs': friend_pairs or [('user001', 'user002')],
+        'handlers': handlers or ['moderator'],
+    }
+
+def pick(rng, pool, zipf=False):
+    """Pick from a pool uniformly, or Zipf-biased towards the front"""
+    if zipf:
+        index = min(int(rng.zipf(1.3)) - 1, len(pool) - 1)
+    else:
+        index = int(rng.integers(len(pool)))
+    return pool[index]
+
+# ==================== BENCHMARK CASES ====================
+
+# (name, function taking (rng, pools) and calling app)
+BENCHMARKS = [
+    ('search_media:title', lambda rng, p: app.search_media(query=pick(rng, p['words']))),
+    ('search_media:cast_scope', lambda rng, p: app.search_media(
+        query=pick(rng, p['people']).split(' ')[0], scopes=['Title', 'Cast', 'Crew'])),
+    ('search_media:genre_filter', lambda rng, p: app.search_media(
+        genres=[pick(rng, p['genres'])], offset=int(rng.integers(0, 3)) * 50)),
+    ('search_media:min_rating', lambda rng, p: app.search_media(min_rating=float(rng.choice([6, 7, 8])))),
+    ('get_media_full_details', lambda rng, p: app.get_media_full_details(pick(rng, p['media'], zipf=True))),
+    ('get_reviews_for_media', lambda rng, p: app.get_reviews_for_media(pick(rng, p['media'], zipf=True))),
+    ('get_season_index', lambda rng, p: app.get_season_index(pick(rng, p['series'], zipf=True))),
+    ('get_season_episodes', lambda rng, p: app.get_season_episodes(pick(rng, p['series'], zipf=True), 1)),
+    ('get_user_watchlists', lambda rng, p: app.get_user_watchlists(pick(rng, p['users']))),
+    ('get_watchlist_items', lambda rng, p: app.get_watchlist_items(pick(rng, p['playlists']))),
+    ('get_series_progress', lambda rng, p: app.get_series_progress(pick(rng, p['users']))),
+    ('get_user_stats', lambda rng, p: app.get_user_stats(pick(rng, p['users']))),
+    ('get_recommendations', lambda rng, p: app.get_recommendations(pick(rng, p['users']))),
+    ('get_top_rated_media', lambda rng, p: app.get_top_rated_media(10)),
+    ('get_friends', lambda rng, p: app.get_friends(pick(rng, p['users']))),
+    ('get_friend_requests', lambda rng, p: app.get_friend_requests(pick(rng, p['users']))),
+    ('get_mutual_friends', lambda rng, p: app.get_mutual_friends(*pick(rng, p['friend_pairs']))),
+    ('search_users', lambda rng, p: app.search_users(pick(rng, p['users'])[:5])),
+    ('get_user_profile', lambda rng, p: app.get_user_profile(pick(rng, p['users']))),
+    ('get_handler_activity', lambda rng, p: app.get_handler_activity(pick(rng, p['handlers']))),
+    ('get_activity_logs', lambda rng, p: app.get_activity_logs(50)),
+    ('get_all_genres', lambda rng, p: app.get_all_genres()),
+    ('get_all_people', lambda rng, p: app.get_all_people()),
+]
+
+# ==================== MEASUREMENT ====================
+
+def session_counters(cursor):
+    """Snapshot of this session's handler and statement counters"""
+    cursor.execute(STATUS_QUERY)
+    return {name: int(value) for name, value in cursor.fetchall()}
+
+def counter_delta(before, after, baseline):
+    """Rows examined and statements issued between two snapshots, minus the snapshot's own cost"""
+    rows = sum(after[k] - before.get(k, 0) for k in after if k.startswith('Handler_read'))
+    queries = after['Questions'] - before['Questions']
+    return rows - baseline['rows'], queries - baseline['queries']
+
+def calibrate(cursor):
+    """Measure what a back-to-back pair of status snapshots costs by itself"""
+    before = session_counters(cursor)
+    after = session_counters(cursor)
+    zero = {'rows': 0, 'queries': 0}
+    rows, queries = counter_delta(before, after, zero)
+    return {'rows': rows, 'queries': queries}
+
+def percentile(values, q):
+    """Percentile rounded for JSON output"""
+    return round(float(np.percentile(values, q)), 3) if values else None
+
+def run_benchmark(conn, fn, rng, pools, iterations, use_cache=False):
+    """Call one benchmark case repeatedly and summarize it"""
+    cursor = conn.cursor()
+    baseline = calibrate(cursor)
+    for _ in range(WARMUP_CALLS):
+        fn(rng, pools)
+    latencies, examined, queries, returned = [], [], [], []
+    for _ in range(iterations):
+        if not use_cache:
+            # Measure the database path, not the process-wide catalogue cache
+            app.clear_catalogue_cache()
+        before = session_counters(cursor)
+        started = time.perf_counter()
+        result = fn(rng, pools)
+        latencies.append((time.perf_counter() - started) * 1000)
+        rows, statements = counter_delta(before, session_counters(cursor), baseline)
+        examined.append(max(rows, 0))
+        queries.append(max(statements, 0))
+        if isinstance(result, list):
+            returned.append(len(result))
+        elif result is not None:
+            returned.append(1)
+    cursor.close()
+    return {
+        'calls': iterations,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'mean_ms': round(float(np.mean(latencies)), 3),
+        'max_ms': round(float(np.max(latencies)), 3),
+        'rows_examined_p50': percentile(examined, 50),
+        'rows_examined_p95': percentile(examined, 95),
+        'rows_examined_mean': round(float(np.mean(examined)), 1),
+        'queries_per_call': round(float(np.mean(queries)), 2),
+        'rows_returned_mean': round(float(np.mean(returned)), 1) if returned else 0,
+    }
+
+def table_counts(conn):
+    """Row counts of the seeded tables"""
+    cursor = conn.cursor()
+    counts = {}
+    for table, *_ in reset_database.SYNTHETIC_TABLES:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        counts[table] = cursor.fetchone()[0]
+    cursor.close()
+    return counts
+
+def benchmark_scale(conn, seed, iterations, only=None, rtt_ms=0, use_cache=False):
+    """Run every benchmark case against the currently loaded dataset"""
+    rng = np.random.default_rng(seed)
+    pools = load_parameter_pools(conn, rng)
+    results = {}
+    # Counters are read on the raw connection so the simulated delay only affects app queries
+    app.bind_connection(SimulatedLatencyConnection(conn, rtt_ms) if rtt_ms else conn)
+    try:
+        for name, fn in BENCHMARKS:
+            if only and not any(name.startswith(o) for o in only):
+                continue
+            results[name] = run_benchmark(conn, fn, rng, pools, iterations, use_cache)
+            r = results[name]
+            print(f"  {name:<28} p50 {r['p50_ms']:>8.2f}ms  p95 {r['p95_ms']:>8.2f}ms  "
+                  f"p99 {r['p99_ms']:>8.2f}ms  examined {r['rows_examined_mean']:>10,.0f}  "
+                  f"queries {r['queries_per_call']:.1f}")
+    finally:
+        app.bind_connection(None)
+    return results
+
+# ==================== REPORTING ====================
+
+def git_commit():
+    """Current commit hash, if run inside the repository"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_results(old, new):
+    """Print p95/rows-examined changes between two result files; returns the regressions"""
+    regressions = []
+    print("\n📊 Comparison with baseline")
+    for scale, scale_results in new['scales'].items():
+        previous = old.get('scales', {}).get(scale)
+        if not previous:
+            continue
+        for name, r in scale_results['functions'].items():
+            p = previous['functions'].get(name)
+            if not p:
+                continue
+            for metric in ('p95_ms', 'rows_examined_mean', 'queries_per_call'):
+                before, after = p[metric] or 0, r[metric] or 0
+                change = (after - before) / before if before else (1.0 if after else 0.0)
+                if metric == 'p95_ms' and after - before < MIN_REGRESSION_MS:
+                    continue
+                if change > REGRESSION_THRESHOLD:
+                    regressions.append((scale, name, metric, before, after))
+                    print(f"  ❌ scale {scale} {name} {metric}: {before} → {after} (+{change:.0%})")
+                elif change < -REGRESSION_THRESHOLD:
+                    print(f"  ✅ scale {scale} {name} {metric}: {before} → {after} ({change:.0%})")
+    if not regressions:
+        print("  No regressions above threshold")
+    return regressions
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark the StreamSync data-access functions")
+    parser.add_argument('--scales', default='0.1,1',
+                        help="comma-separated synthetic scale factors to seed and benchmark")
+    parser.add_argument('--iterations', type=int, default=200, help="measured calls per function")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--functions', help="comma-separated name prefixes to run (default: all)")
+    parser.add_argument('--skip-seed', action='store_true', help="benchmark the data already loaded")
+    parser.add_argument('--workers', type=int, default=1, help="loader processes used when seeding")
+    parser.add_argument('--rtt-ms', type=float, default=0,
+                        help="simulated network round trip added to every app query (remote database)")
+    parser.add_argument('--with-cache', action='store_true',
+                        help="leave the catalogue cache on instead of measuring every call against the database")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--compare', help="previous results file; exit 1 on regressions")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main execution function"""
+    args = parse_args(argv)
+    scales = ['current'] if args.skip_seed else [s.strip() for s in args.scales.split(',')]
+    only = args.functions.split(',') if args.functions else None
+    output = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'iterations': args.iterations,
+            'seed': args.seed,
+            'rtt_ms': args.rtt_ms,
+            'catalogue_cache': args.with_cache,
+        },
+        'scales': {},
+    }
+
+    for scale in scales:
+        if scale != 'current':
+            print(f"\n🌱 Seeding scale {scale}...")
+            reset_database.main(['--synthetic', '--fast-load', '--scale', scale, '--seed', str(args.seed),
+                                 '--workers', str(args.workers)])
+        conn = reset_database.get_connection(use_database=True)
+        if not conn:
+            print("❌ Failed to connect to database!")
+            return 1
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT VERSION()")
+            output['meta']['mysql'] = cursor.fetchone()[0]
+            cursor.close()
+            print(f"\n⏱️  Benchmarking scale {scale}")
+            output['scales'][scale] = {
+                'tables': table_counts(conn),
+                'functions': benchmark_scale(conn, args.seed, args.iterations, only, args.rtt_ms, args.with_cache),
+            }
+        finally:
+            conn.close()
+
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2, sort_keys=True)
+    print(f"\n💾 Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            if compare_results(json.load(f), output):
+                return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
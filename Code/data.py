@@ -1,3 +1,9 @@
+"""
+Legacy setup script with an older, smaller schema (`Genres`, no Episodes/Reviews/Friends).
+Use reset_database.py for a fresh database and migrate.py to upgrade an existing one;
+migration 0001 renames `Genres` and adds the missing tables.
+"""
+
 import mysql.connector
 from mysql.connector import Error
 
@@ -1,3 +1,6 @@
+-- Legacy schema snapshot. The authoritative schema is reset_database.py (baseline)
+-- plus the numbered files in Code/migrations; apply changes with `python migrate.py`.
+
 CREATE DATABASE Streamsync;
 
 use Streamsync ;
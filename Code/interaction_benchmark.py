@@ -0,0 +1,229 @@
+"""
+Queries-per-interaction benchmark for the page panels that run as st.fragment.
+
+Each scenario opens a page with Streamlit's AppTest against the loaded
+database, performs one interaction inside a panel (pick a season, move the
+rating slider, change a sort, ...) and counts what that rerun sends on the
+session's connection (Questions and Handler_read_* counters):
+
+    before  the whole page reruns, as every click did before the panels
+            became fragments (STREAMSYNC_FRAGMENTS=0)
+    after   only the panel reruns
+
+AppTest always reruns a whole script, so "after" renders the panel function
+on its own with the same session state and arguments, which is exactly the
+code a fragment rerun executes.
+
+    python interaction_benchmark.py
+    python interaction_benchmark.py --seed 7 --output interactions.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+import app
+import reset_database
+from benchmark import calibrate, counter_delta, git_commit, load_parameter_pools, pick, session_counters
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+RUN_TIMEOUT = 60
+
+def render_panel(panel, panel_args):
+    """AppTest script that renders one page panel on its own"""
+    import app
+    getattr(app, panel)(*panel_args)
+
+# ==================== SCENARIOS ====================
+
+def _row(conn, query, params=()):
+    """First row of a query, or None"""
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    row = cursor.fetchone()
+    cursor.close()
+    return row
+
+def _slider_elsewhere(at, key):
+    """Move a slider to a value it does not have yet"""
+    slider = at.slider(key=key)
+    slider.set_value(3 if slider.value != 3 else 4)
+
+def scenario_pick_season(conn, rng, pools):
+    """Details page of a multi-season series: pick its last season"""
+    row = _row(conn, """SELECT media_id, MAX(season_number) FROM Episodes GROUP BY media_id
+                        HAVING COUNT(DISTINCT season_number) > 1 LIMIT 1""")
+    if not row:
+        return None
+    media_id, last_season = row
+    user = pick(rng, pools['users'])
+    state = {'username': user, 'selected_nav': 'Explore', 'selected_media_id': media_id}
+    return state, 'media_episodes_panel', (media_id, user), \
+        lambda at: at.selectbox(key=f"season_select_{media_id}").set_value(last_season)
+
+def scenario_rating_slider(conn, rng, pools):
+    """Details page of a popular title: move the rating slider before saving"""
+    media_id = pick(rng, pools['media'], zipf=True)
+    user = pick(rng, pools['users'])
+    state = {'username': user, 'selected_nav': 'Explore', 'selected_media_id': media_id}
+    return state, 'media_reviews_panel', (media_id, user), \
+        lambda at: _slider_elsewhere(at, f"user_rating_{media_id}")
+
+def scenario_full_cast(conn, rng, pools):
+    """Details page of a title with a long cast: show the full cast"""
+    row = _row(conn, "SELECT media_id FROM Media_Cast GROUP BY media_id HAVING COUNT(*) > %s LIMIT 1",
+               (app.CAST_PREVIEW_SIZE,))
+    if not row:
+        return None
+    media_id = row[0]
+    user = pick(rng, pools['users'])
+    state = {'username': user, 'selected_nav': 'Explore', 'selected_media_id': media_id}
+    return state, 'media_cast_crew_panel', (app.get_media_full_details(media_id),), \
+        lambda at: at.toggle(key=f"show_all_cast_{media_id}").set_value(True)
+
+def scenario_watchlist_sort(conn, rng, pools):
+    """Watchlist details: sort the items by title"""
+    playlist_id = pick(rng, pools['playlists'])
+    row = _row(conn, """SELECT username, (SELECT COUNT(*) FROM Playlist_item WHERE playlist_id = %s)
+                        FROM playlist WHERE playlist_id = %s""", (playlist_id, playlist_id))
+    if not row:
+        return None
+    owner, item_count = row
+    state = {'username': owner, 'selected_nav': 'Watchlist', 'selected_playlist_id': playlist_id}
+    return state, 'watchlist_items_panel', (playlist_id, item_count), \
+        lambda at: at.selectbox(key=f"watchlist_sort_{playlist_id}").set_value('Title')
+
+def scenario_status_filter(conn, rng, pools):
+    """Watchlists tab: filter My Titles to completed"""
+    user = pick(rng, pools['users'])
+    state = {'username': user, 'selected_nav': 'Watchlist'}
+    return state, 'watch_status_panel', (user,), \
+        lambda at: at.radio(key='watch_status_filter').set_value('completed')
+
+def scenario_friend_search(conn, rng, pools):
+    """Friends tab: type a name into the user search"""
+    user = pick(rng, pools['users'])
+    state = {'username': user, 'selected_nav': 'Friends'}
+    return state, 'find_friends_panel', (user,), \
+        lambda at: at.text_input(key='friend_search').input(pick(rng, pools['users']))
+
+def scenario_table_record(conn, rng, pools):
+    """Moderator table page: pick another record to delete"""
+    table_name = 'Media'
+    schema = app.get_table_schema(table_name)
+    data = app.get_table_data(table_name) or []
+    if not schema or len(data) < 2:
+        return None
+    state = {'username': pick(rng, pools['handlers']), 'user_role': 'moderator', 'page': 'Table Data',
+             'selected_table': table_name}
+    return state, 'table_delete_panel', (table_name, data, schema['primary_key'][0]), \
+        lambda at: at.selectbox(key=f"select_delete_{table_name}").select_index(1)
+
+# (name, builder returning (session state, panel function, panel args, interaction) or None to skip)
+SCENARIOS = [
+    ('details: pick season', scenario_pick_season),
+    ('details: move rating slider', scenario_rating_slider),
+    ('details: show full cast', scenario_full_cast),
+    ('watchlist: sort items', scenario_watchlist_sort),
+    ('watchlists: filter my titles', scenario_status_filter),
+    ('friends: search users', scenario_friend_search),
+    ('table data: pick record', scenario_table_record),
+]
+
+# ==================== MEASUREMENT ====================
+
+def measure_interaction(conn, at, state, interact, baseline):
+    """Render once to settle the page, then count what one interaction's rerun issues"""
+    for key, value in {'db_password': '', 'db_conn': conn, 'page': 'User', **state}.items():
+        at.session_state[key] = value
+    at.run(timeout=RUN_TIMEOUT)
+    interact(at)
+    cursor = conn.cursor()
+    before = session_counters(cursor)
+    started = time.perf_counter()
+    at.run(timeout=RUN_TIMEOUT)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    rows, queries = counter_delta(before, session_counters(cursor), baseline)
+    cursor.close()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return {'queries': max(queries, 0), 'rows_examined': max(rows, 0), 'ms': round(elapsed_ms, 1)}
+
+def run_scenario(conn, builder, rng, pools, baseline):
+    """Measure one interaction with whole-page reruns and with a panel-only rerun"""
+    app.bind_connection(conn)
+    try:
+        scenario = builder(conn, rng, pools)
+    finally:
+        app.bind_connection(None)
+    if scenario is None:
+        return None
+    state, panel, panel_args, interact = scenario
+
+    os.environ['STREAMSYNC_FRAGMENTS'] = '0'
+    try:
+        before = measure_interaction(conn, AppTest.from_file(APP_SCRIPT), state, interact, baseline)
+    finally:
+        os.environ.pop('STREAMSYNC_FRAGMENTS', None)
+    at = AppTest.from_function(render_panel, args=(panel, panel_args))
+    after = measure_interaction(conn, at, state, interact, baseline)
+    return {'panel': panel, 'before': before, 'after': after}
+
+def print_results(results):
+    """Table of queries and rows examined per interaction"""
+    print(f"\n{'Interaction':<32} {'Panel':<24} {'Queries':>15} {'Rows examined':>21}")
+    for name, r in results.items():
+        b, a = r['before'], r['after']
+        print(f"{name:<32} {r['panel']:<24} {b['queries']:>6} → {a['queries']:<6} "
+              f"{b['rows_examined']:>10,} → {a['rows_examined']:<8,}")
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Count queries per interaction with and without page fragments")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="write the results as JSON")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main execution function"""
+    args = parse_args(argv)
+    conn = reset_database.get_connection(use_database=True)
+    if not conn:
+        print("❌ Failed to connect to database!")
+        return 1
+    rng = np.random.default_rng(args.seed)
+    results = {}
+    try:
+        pools = load_parameter_pools(conn, rng)
+        cursor = conn.cursor()
+        baseline = calibrate(cursor)
+        cursor.close()
+        print("⏱️  Measuring queries per interaction (before: whole page, after: panel only)")
+        for name, builder in SCENARIOS:
+            result = run_scenario(conn, builder, rng, pools, baseline)
+            if result is None:
+                print(f"  ⏭️  {name}: no suitable data loaded")
+                continue
+            results[name] = result
+    finally:
+        conn.close()
+
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'meta': {'commit': git_commit(), 'timestamp': datetime.now().isoformat(timespec='seconds'),
+                         'seed': args.seed},
+                'interactions': results,
+            }, f, indent=2)
+        print(f"\n💾 Results written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
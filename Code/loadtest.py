@@ -0,0 +1,389 @@
+"""
+Concurrent-session load test for the StreamSync data-access layer.
+
+Each virtual user runs in its own thread with its own MySQL connection, just
+as every Streamlit session holds its own st.session_state.db_conn, and
+repeats the journey a user_page visitor takes:
+
+    login -> Home -> Explore search -> media details -> add to watchlist -> review -> friends
+
+Every step calls the same app.py functions the page does, so the queries match
+what the app issues on each click. The write steps (watchlist, review) change
+data; use --read-only to skip them.
+
+    python loadtest.py --users 50 --duration 60
+    python loadtest.py --users 200 --ramp-up 20 --think-ms 500 --output run.json
+
+--playlist-ids N instead creates N playlists through app.create_watchlist from
+--users threads, checks that every call succeeded with a distinct ID, and
+deletes them again:
+
+    python loadtest.py --playlist-ids 10000 --users 64
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+import app
+import reset_database
+from benchmark import load_parameter_pools, percentile, pick
+
+CONNECTION_SAMPLE_SECONDS = 1.0
+ID_CHECK_PLAYLIST_NAME = 'ID check'
+ID_CHECK_CHUNK = 1000
+
+# ==================== JOURNEY STEPS ====================
+
+def step_login(vu, rng, pools):
+    """Login page: authenticate with the seeded password"""
+    # Seeded users are userNNN with password passwordNNN
+    return app.authenticate_user(vu['username'], 'password' + vu['username'][4:]) is not None
+
+def step_home(vu, rng, pools):
+    """Home tab: the five panels user_page renders"""
+    username = vu['username']
+    app.get_user_stats(username)
+    app.get_recommendations(username, 5)
+    app.get_series_progress(username)
+    app.get_top_rated_media()
+    vu['watchlists'] = app.get_user_watchlists(username) or []
+    return True
+
+def step_explore(vu, rng, pools):
+    """Explore tab: filter options plus a title search"""
+    app.get_all_genres()
+    app.get_all_people()
+    results = app.search_media(query=pick(rng, pools['words']), scopes=['Title'])
+    vu['results'] = results or []
+    return results is not None
+
+def step_media_details(vu, rng, pools):
+    """Open a search result (or a popular title) on the details page"""
+    media_id = vu['results'][int(rng.integers(len(vu['results'])))]['media_id'] if vu['results'] \
+        else pick(rng, pools['media'], zipf=True)
+    media = app.get_media_full_details(media_id)
+    if not media:
+        return False
+    vu['media_id'] = media_id
+    if media['media_type'] == 'Series':
+        seasons = app.get_season_index(media_id)
+        if seasons:
+            app.get_season_episodes(media_id, seasons[0]['season_number'])
+    app.get_reviews_for_media(media_id)
+    app.get_user_watchlists(vu['username'])
+    return True
+
+def step_add_to_watchlist(vu, rng, pools):
+    """Add the opened title to one of the user's watchlists"""
+    if not vu['watchlists']:
+        if not app.create_watchlist(vu['username'], 'Load Test'):
+            return False
+        vu['watchlists'] = app.get_user_watchlists(vu['username']) or []
+        if not vu['watchlists']:
+            return False
+    playlist = vu['watchlists'][int(rng.integers(len(vu['watchlists'])))]
+    return bool(app.add_to_watchlist(playlist['playlist_id'], vu['media_id'], vu['username']))
+
+def step_review(vu, rng, pools):
+    """Write or update a review of the opened title"""
+    rating = int(rng.integers(1, 11))
+    return bool(app.save_user_review(vu['username'], vu['media_id'], rating, f"Load test review ({rating}/10)"))
+
+def step_friends(vu, rng, pools):
+    """Friends tab: friends, requests and suggested users with mutual counts"""
+    username = vu['username']
+    friends = app.get_friends(username) or []
+    app.get_friend_requests(username)
+    suggested = app.execute_query("SELECT username, firstname, lastname FROM Users WHERE username != %s LIMIT 10",
+                                  (username,)) or []
+    friend_names = {f['username'] for f in friends}
+    for user in suggested[:5]:
+        if user['username'] not in friend_names:
+            app.get_mutual_friends(username, user['username'])
+    return True
+
+# (step name, function, writes data)
+JOURNEY = [
+    ('login', step_login, False),
+    ('home', step_home, False),
+    ('explore_search', step_explore, False),
+    ('media_details', step_media_details, False),
+    ('add_to_watchlist', step_add_to_watchlist, True),
+    ('review', step_review, True),
+    ('friends', step_friends, False),
+]
+
+# ==================== RUNNER ====================
+
+def virtual_user(index, args, pools, deadline, results, lock):
+    """Run journeys until the deadline on a dedicated connection"""
+    rng = np.random.default_rng([args.seed, index])
+    conn = reset_database.get_connection(use_database=True)
+    if not conn:
+        with lock:
+            results['connect_failures'] += 1
+        return
+    app.bind_connection(conn)
+    latencies = {name: [] for name, _, _ in JOURNEY}
+    errors = {name: 0 for name, _, _ in JOURNEY}
+    journeys = 0
+    try:
+        while time.monotonic() < deadline and (not args.journeys or journeys < args.journeys):
+            vu = {'username': pick(rng, pools['users']), 'watchlists': [], 'results': [], 'media_id': None}
+            for name, step, writes in JOURNEY:
+                if writes and args.read_only:
+                    continue
+                started = time.perf_counter()
+                try:
+                    ok = step(vu, rng, pools)
+                except Exception:
+                    ok = False
+                latencies[name].append((time.perf_counter() - started) * 1000)
+                if not ok:
+                    errors[name] += 1
+                    if name in ('login', 'media_details'):
+                        break
+                if args.think_ms:
+                    time.sleep(rng.exponential(args.think_ms) / 1000)
+            journeys += 1
+    finally:
+        app.bind_connection(None)
+        conn.close()
+        with lock:
+            results['journeys'] += journeys
+            for name in latencies:
+                results['latencies'][name].extend(latencies[name])
+                results['errors'][name] += errors[name]
+
+def monitor_connections(stop, samples):
+    """Sample server-wide connection and running-thread counts"""
+    conn = reset_database.get_connection(use_database=True)
+    if not conn:
+        return
+    cursor = conn.cursor()
+    try:
+        while not stop.is_set():
+            cursor.execute("SHOW GLOBAL STATUS WHERE Variable_name IN ('Threads_connected', 'Threads_running')")
+            samples.append(dict((name, int(value)) for name, value in cursor.fetchall()))
+            stop.wait(CONNECTION_SAMPLE_SECONDS)
+        cursor.execute("SHOW GLOBAL STATUS LIKE 'Max_used_connections'")
+        samples.append({'Max_used_connections': int(cursor.fetchone()[1])})
+    finally:
+        cursor.close()
+        conn.close()
+
+def run_load_test(args):
+    """Start the virtual users and collect their measurements"""
+    conn = reset_database.get_connection(use_database=True)
+    if not conn:
+        print("❌ Failed to connect to database!")
+        return None
+    pools = load_parameter_pools(conn, np.random.default_rng(args.seed))
+    conn.close()
+
+    results = {
+        'journeys': 0,
+        'connect_failures': 0,
+        'latencies': {name: [] for name, _, _ in JOURNEY},
+        'errors': {name: 0 for name, _, _ in JOURNEY},
+    }
+    lock = threading.Lock()
+    samples = []
+    stop = threading.Event()
+    monitor = threading.Thread(target=monitor_connections, args=(stop, samples), daemon=True)
+    monitor.start()
+
+    print(f"\n🚦 {args.users} virtual users for {args.duration}s (ramp-up {args.ramp_up}s)...")
+    started = time.monotonic()
+    deadline = started + args.duration
+    threads = []
+    for index in range(args.users):
+        thread = threading.Thread(target=virtual_user, args=(index, args, pools, deadline, results, lock))
+        thread.start()
+        threads.append(thread)
+        if args.ramp_up:
+            time.sleep(args.ramp_up / args.users)
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    stop.set()
+    monitor.join()
+
+    results['elapsed'] = elapsed
+    results['connections'] = samples
+    return results
+
+# ==================== PLAYLIST ID CHECK ====================
+
+def playlist_id_worker(index, count, args, pools, created, lock):
+    """Create playlists on a dedicated connection and collect the returned IDs"""
+    rng = np.random.default_rng([args.seed, index])
+    conn = reset_database.get_connection(use_database=True)
+    ids, failures = [], 0
+    if conn:
+        app.bind_connection(conn)
+        try:
+            for _ in range(count):
+                playlist_id = app.create_watchlist(pick(rng, pools['users']), ID_CHECK_PLAYLIST_NAME)
+                if playlist_id:
+                    ids.append(playlist_id)
+                else:
+                    failures += 1
+        finally:
+            app.bind_connection(None)
+            conn.close()
+    else:
+        failures = count
+    with lock:
+        created['ids'].extend(ids)
+        created['failures'] += failures
+
+def run_playlist_id_check(args):
+    """Create playlists from many threads at once and verify every ID is unique and stored"""
+    conn = reset_database.get_connection(use_database=True)
+    if not conn:
+        print("❌ Failed to connect to database!")
+        return 1
+    pools = load_parameter_pools(conn, np.random.default_rng(args.seed))
+    created = {'ids': [], 'failures': 0}
+    lock = threading.Lock()
+    per_thread = [args.playlist_ids // args.users + (i < args.playlist_ids % args.users) for i in range(args.users)]
+
+    print(f"\n🆔 Creating {args.playlist_ids:,} playlists from {args.users} threads...")
+    started = time.monotonic()
+    threads = [threading.Thread(target=playlist_id_worker, args=(i, count, args, pools, created, lock))
+               for i, count in enumerate(per_thread)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    ids = created['ids']
+    duplicates = len(ids) - len(set(ids))
+    cursor = conn.cursor()
+    stored = 0
+    for i in range(0, len(ids), ID_CHECK_CHUNK):
+        chunk = ids[i:i + ID_CHECK_CHUNK]
+        placeholders = ', '.join(['%s'] * len(chunk))
+        cursor.execute(f"SELECT COUNT(*) FROM playlist WHERE playlist_id IN ({placeholders})", chunk)
+        stored += cursor.fetchone()[0]
+        cursor.execute(f"DELETE FROM playlist WHERE playlist_id IN ({placeholders})", chunk)
+        # create_watchlist logged each one; keep the audit log free of test entries
+        cursor.execute(f"""DELETE FROM Activity_Log
+                           WHERE table_name = 'playlist' AND operation = 'INSERT' AND record_id IN ({placeholders})""",
+                       chunk)
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+    print(f"  {len(ids):,} created in {elapsed:.1f}s ({len(ids) / elapsed:,.0f}/s), "
+          f"{created['failures']} failed, {duplicates} duplicate IDs, {stored:,} found in the table")
+    ok = created['failures'] == 0 and duplicates == 0 and stored == args.playlist_ids
+    print("  ✅ All playlist IDs unique" if ok else "  ❌ Playlist ID allocation failed")
+    print("  🧹 Removed the test playlists and their Activity_Log entries")
+    return 0 if ok else 1
+
+def summarize(args, results):
+    """Throughput, per-step percentiles and connection counts"""
+    elapsed = results['elapsed']
+    steps = {}
+    for name, values in results['latencies'].items():
+        if not values:
+            continue
+        steps[name] = {
+            'calls': len(values),
+            'errors': results['errors'][name],
+            'p50_ms': percentile(values, 50),
+            'p95_ms': percentile(values, 95),
+            'p99_ms': percentile(values, 99),
+            'max_ms': round(max(values), 3),
+        }
+    connected = [s['Threads_connected'] for s in results['connections'] if 'Threads_connected' in s]
+    running = [s['Threads_running'] for s in results['connections'] if 'Threads_running' in s]
+    max_used = next((s['Max_used_connections'] for s in results['connections'] if 'Max_used_connections' in s), None)
+    total_steps = sum(s['calls'] for s in steps.values())
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'users': args.users,
+            'duration': args.duration,
+            'ramp_up': args.ramp_up,
+            'think_ms': args.think_ms,
+            'read_only': args.read_only,
+            'seed': args.seed,
+        },
+        'elapsed_s': round(elapsed, 2),
+        'journeys': results['journeys'],
+        'journeys_per_s': round(results['journeys'] / elapsed, 2) if elapsed else 0,
+        'steps_per_s': round(total_steps / elapsed, 2) if elapsed else 0,
+        'connect_failures': results['connect_failures'],
+        'connections': {
+            'threads_connected_max': max(connected) if connected else None,
+            'threads_connected_avg': round(float(np.mean(connected)), 1) if connected else None,
+            'threads_running_max': max(running) if running else None,
+            'max_used_connections': max_used,
+        },
+        'steps': steps,
+    }
+
+def print_summary(summary):
+    """Print the load test report"""
+    print("\n" + "=" * 78)
+    print(f"  📈 {summary['journeys']:,} journeys in {summary['elapsed_s']}s — "
+          f"{summary['journeys_per_s']} journeys/s, {summary['steps_per_s']} steps/s")
+    print("=" * 78)
+    print(f"  {'step':<18}{'calls':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, s in summary['steps'].items():
+        print(f"  {name:<18}{s['calls']:>8}{s['errors']:>8}{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}"
+              f"{s['p99_ms']:>10.1f}{s['max_ms']:>10.1f}")
+    c = summary['connections']
+    print(f"\n  🔌 Threads_connected max {c['threads_connected_max']} (avg {c['threads_connected_avg']}), "
+          f"Threads_running max {c['threads_running_max']}, Max_used_connections {c['max_used_connections']}")
+    if summary['connect_failures']:
+        print(f"  ❌ {summary['connect_failures']} virtual users could not connect")
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Concurrent user-journey load test for StreamSync")
+    parser.add_argument('--users', type=int, default=20, help="concurrent virtual users (threads)")
+    parser.add_argument('--duration', type=float, default=60, help="seconds to run")
+    parser.add_argument('--journeys', type=int, default=0, help="stop each user after this many journeys")
+    parser.add_argument('--ramp-up', type=float, default=0, help="seconds over which users start")
+    parser.add_argument('--think-ms', type=float, default=0, help="mean pause between steps")
+    parser.add_argument('--read-only', action='store_true', help="skip the watchlist and review writes")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="write the summary as JSON")
+    parser.add_argument('--playlist-ids', type=int, default=0,
+                        help="instead of journeys, create this many playlists concurrently and check their IDs")
+    args = parser.parse_args(argv)
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+    return args
+
+def main(argv=None):
+    """Main execution function"""
+    args = parse_args(argv)
+    # Prompt for the password once, before the threads need it
+    reset_database.load_secrets()
+    if args.playlist_ids:
+        return run_playlist_id_check(args)
+    results = run_load_test(args)
+    if results is None:
+        return 1
+    summary = summarize(args, results)
+    print_summary(summary)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"\n💾 Summary written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
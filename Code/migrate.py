@@ -0,0 +1,272 @@
+"""
+Versioned schema migrations for the StreamSync database.
+
+Migrations live in Code/migrations as NNNN_description.py files. Each defines
+operations() returning a list built from the helpers below. Every operation
+checks information_schema first and is skipped when already satisfied, so a
+migration that failed halfway (MySQL DDL auto-commits) can simply be re-run.
+
+    python migrate.py              # apply pending migrations
+    python migrate.py --dry-run    # show statements and estimated timings
+    python migrate.py --status     # list applied and pending versions
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import os
+import re
+import time
+
+from mysql.connector import Error
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+MIGRATION_FILE = re.compile(r'^(\d{4})_(\w+)\.py$')
+MIGRATION_LOCK = 'streamsync_schema_migrations'
+
+# Rough online build rates used for dry-run estimates
+INDEX_BUILD_ROWS_PER_SEC = 400000
+TABLE_REBUILD_ROWS_PER_SEC = 150000
+
+# Index builds and column changes must not block reads or writes
+ONLINE_DDL = "ALGORITHM=INPLACE, LOCK=NONE"
+
+# ==================== OPERATIONS ====================
+
+def create_table(table, ddl):
+    """Create a table if it does not exist yet"""
+    return {'kind': 'create_table', 'table': table, 'ddl': ddl}
+
+def rename_table(old_name, new_name):
+    """Rename a table if only the old name exists"""
+    return {'kind': 'rename_table', 'table': old_name, 'new_name': new_name}
+
+def create_index(table, name, columns, unique=False):
+    """Build a secondary index online"""
+    return {'kind': 'create_index', 'table': table, 'name': name, 'columns': tuple(columns), 'unique': unique}
+
+def drop_index(table, name):
+    """Drop a secondary index online"""
+    return {'kind': 'drop_index', 'table': table, 'name': name}
+
+def add_column(table, column, definition):
+    """Add a column online"""
+    return {'kind': 'add_column', 'table': table, 'column': column, 'definition': definition}
+
+def run_sql(statement, table=None):
+    """Run a raw statement; table is only used for the dry-run estimate"""
+    return {'kind': 'sql', 'table': table, 'statement': statement}
+
+# ==================== INTROSPECTION ====================
+
+def table_exists(cursor, table):
+    """Check for a table by exact (case-sensitive) name"""
+    cursor.execute("""SELECT TABLE_NAME FROM information_schema.TABLES
+                      WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s""", (table,))
+    return any(row[0] == table for row in cursor.fetchall())
+
+def index_exists(cursor, table, name):
+    """Check whether a table already has an index with this name"""
+    cursor.execute("""SELECT COUNT(*) FROM information_schema.STATISTICS
+                      WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s""", (table, name))
+    return cursor.fetchone()[0] > 0
+
+def column_exists(cursor, table, column):
+    """Check whether a table already has a column"""
+    cursor.execute("""SELECT COUNT(*) FROM information_schema.COLUMNS
+                      WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s""", (table, column))
+    return cursor.fetchone()[0] > 0
+
+def estimated_rows(cursor, table):
+    """Row estimate from table statistics (no scan)"""
+    if not table:
+        return 0
+    cursor.execute("""SELECT TABLE_ROWS FROM information_schema.TABLES
+                      WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s""", (table,))
+    row = cursor.fetchone()
+    return int(row[0] or 0) if row else 0
+
+def operation_statements(cursor, op):
+    """SQL an operation still needs to run; empty when it is already applied"""
+    kind, table = op['kind'], op['table']
+    if kind == 'create_table':
+        return [] if table_exists(cursor, table) else [op['ddl']]
+    if kind == 'rename_table':
+        if not table_exists(cursor, table) or table_exists(cursor, op['new_name']):
+            return []
+        return [f"RENAME TABLE {table} TO {op['new_name']}"]
+    if kind == 'create_index':
+        if index_exists(cursor, table, op['name']):
+            return []
+        unique = 'UNIQUE ' if op['unique'] else ''
+        return [f"ALTER TABLE {table} ADD {unique}INDEX {op['name']} ({', '.join(op['columns'])}), {ONLINE_DDL}"]
+    if kind == 'drop_index':
+        if not index_exists(cursor, table, op['name']):
+            return []
+        return [f"ALTER TABLE {table} DROP INDEX {op['name']}, {ONLINE_DDL}"]
+    if kind == 'add_column':
+        if column_exists(cursor, table, op['column']):
+            return []
+        return [f"ALTER TABLE {table} ADD COLUMN {op['column']} {op['definition']}, {ONLINE_DDL}"]
+    return [op['statement']]
+
+def estimate_seconds(cursor, op):
+    """Estimate how long an operation takes from the table's row count"""
+    rows = estimated_rows(cursor, op['table'])
+    if op['kind'] == 'create_index':
+        return rows / INDEX_BUILD_ROWS_PER_SEC
+    if op['kind'] in ('add_column', 'sql'):
+        return rows / TABLE_REBUILD_ROWS_PER_SEC
+    return 0.0
+
+# ==================== MIGRATION FILES ====================
+
+def load_migrations():
+    """Load every migration file in version order"""
+    migrations = []
+    for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+        match = MIGRATION_FILE.match(filename)
+        if not match:
+            continue
+        path = os.path.join(MIGRATIONS_DIR, filename)
+        with open(path, 'rb') as f:
+            checksum = hashlib.sha256(f.read()).hexdigest()
+        spec = importlib.util.spec_from_file_location(f"migration_{match.group(1)}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        migrations.append({
+            'version': int(match.group(1)),
+            'name': match.group(2),
+            'checksum': checksum,
+            'description': (module.__doc__ or '').strip().split('\n')[0],
+            'operations': module.operations,
+        })
+    versions = [m['version'] for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError("Duplicate migration version numbers in migrations/")
+    return migrations
+
+def ensure_version_table(cursor):
+    """Create the schema_version bookkeeping table"""
+    cursor.execute("""CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            checksum CHAR(64) NOT NULL,
+            execution_ms INT,
+            applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )""")
+
+def applied_versions(cursor):
+    """Map of applied version -> checksum"""
+    if not table_exists(cursor, 'schema_version'):
+        return {}
+    cursor.execute("SELECT version, checksum FROM schema_version")
+    return {version: checksum for version, checksum in cursor.fetchall()}
+
+# ==================== RUNNER ====================
+
+def apply_migrations(conn, target=None, dry_run=False):
+    """Apply pending migrations up to target; returns the versions applied (or planned)"""
+    cursor = conn.cursor()
+    migrations = load_migrations()
+    applied = applied_versions(cursor)
+    for m in migrations:
+        if m['version'] in applied and applied[m['version']] != m['checksum']:
+            print(f"  ⚠️  Migration {m['version']:04d}_{m['name']} changed after it was applied")
+    pending = [m for m in migrations
+               if m['version'] not in applied and (target is None or m['version'] <= target)]
+    if not pending:
+        print("✅ Schema is up to date")
+        cursor.close()
+        return []
+
+    if not dry_run:
+        cursor.execute("SELECT GET_LOCK(%s, 0)", (MIGRATION_LOCK,))
+        if cursor.fetchone()[0] != 1:
+            cursor.close()
+            raise RuntimeError("Another migration run holds the migration lock")
+        ensure_version_table(cursor)
+
+    done = []
+    total_estimate = 0.0
+    try:
+        for m in pending:
+            print(f"\n🧱 {m['version']:04d}_{m['name']}: {m['description']}")
+            started = time.perf_counter()
+            for op in m['operations']():
+                statements = operation_statements(cursor, op)
+                if not statements:
+                    print(f"  ⏭️  {op['kind']} on {op['table']} already applied")
+                    continue
+                if dry_run:
+                    estimate = estimate_seconds(cursor, op)
+                    total_estimate += estimate
+                    for statement in statements:
+                        print(f"  📝 {' '.join(statement.split())}")
+                    if estimate:
+                        print(f"     ~{estimated_rows(cursor, op['table']):,} rows, est. {estimate:.1f}s")
+                    continue
+                for statement in statements:
+                    op_started = time.perf_counter()
+                    cursor.execute(statement)
+                    print(f"  ✅ {' '.join(statement.split())[:90]} ({time.perf_counter() - op_started:.1f}s)")
+            if not dry_run:
+                elapsed_ms = int((time.perf_counter() - started) * 1000)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, name, checksum, execution_ms) VALUES (%s, %s, %s, %s)",
+                    (m['version'], m['name'], m['checksum'], elapsed_ms)
+                )
+                conn.commit()
+            done.append(m['version'])
+    finally:
+        if not dry_run:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (MIGRATION_LOCK,))
+            cursor.fetchone()
+        cursor.close()
+
+    if dry_run:
+        print(f"\n🔍 Dry run: {len(done)} pending migration(s), estimated {total_estimate:.1f}s total")
+    else:
+        print(f"\n✅ Applied {len(done)} migration(s); schema is at version {done[-1]}")
+    return done
+
+def print_status(conn):
+    """List applied and pending migrations"""
+    cursor = conn.cursor()
+    applied = applied_versions(cursor)
+    cursor.close()
+    print("\n📋 Schema migrations")
+    for m in load_migrations():
+        state = '✅ applied' if m['version'] in applied else '⏳ pending'
+        print(f"  {m['version']:04d}_{m['name']:<40} {state}")
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Apply versioned StreamSync schema migrations")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="print pending statements with estimated timings without running them")
+    parser.add_argument('--target', type=int, help="stop after this migration version")
+    parser.add_argument('--status', action='store_true', help="list applied and pending migrations")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main execution function"""
+    from reset_database import get_connection
+
+    args = parse_args(argv)
+    conn = get_connection(use_database=True)
+    if not conn:
+        print("❌ Failed to connect to database!")
+        return
+    try:
+        if args.status:
+            print_status(conn)
+        else:
+            apply_migrations(conn, target=args.target, dry_run=args.dry_run)
+    except (Error, RuntimeError) as e:
+        print(f"\n❌ Migration failed: {e}")
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Baseline schema from reset_database.py, reconciling databases built by data.py or dbs_proj.sql"""
+
+from migrate import create_index, create_table, rename_table
+
+# Frozen copy of reset_database.TABLE_DEFINITIONS / INDEX_DEFINITIONS at version 1. Later schema changes
+# belong in new migrations; editing reset_database must not change what version 1 creates.
+TABLES = [
+    ('Users', """CREATE TABLE Users (
+            username varchar(50) unique primary key,
+            firstname varchar(50) not null,
+            lastname varchar(50),
+            DOB date not null,
+            email VARCHAR(255) NOT NULL UNIQUE,
+            CHECK (email REGEXP '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$'),
+            password char(64) NOT NULL,
+            role ENUM('user', 'admin', 'moderator') DEFAULT 'user',
+            created_at datetime DEFAULT CURRENT_TIMESTAMP
+        )"""),
+    ('Media', """CREATE TABLE Media (
+            media_id varchar(10) primary key,
+            title varchar(100) NOT NULL,
+            description TEXT,
+            release_year YEAR,
+            media_type varchar(20),
+            check (media_type IN ('Movie', 'Series')),
+            age_rating ENUM('G','PG','PG-13','NC-17','U','U/A 7+','U/A 13+','U/A 16+','A') DEFAULT 'U',
+            poster_image_url varchar(2083),
+            average_rating DECIMAL(3, 1)
+        )"""),
+    ('genres', """CREATE TABLE genres (
+            genre_id varchar(50) PRIMARY KEY,
+            name varchar(50) NOT NULL
+        )"""),
+    ('People', """CREATE TABLE People (
+            person_id varchar(20) primary key,
+            name varchar(40),
+            birthdate date,
+            photo_url varchar(2083)
+        )"""),
+    ('Episodes', """CREATE TABLE Episodes (
+            episode_id VARCHAR(50) PRIMARY KEY,
+            media_id varchar(10) NOT NULL,
+            season_number INT,
+            episode_number INT,
+            title VARCHAR(100),
+            air_date DATE,
+            UNIQUE (media_id, season_number, episode_number),
+            FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ('Watchlists_item', """CREATE TABLE Watchlists_item (
+            username varchar(50) NOT NULL,
+            media_id varchar(10) NOT NULL,
+            status VARCHAR(20) CHECK (status IN ('watching', 'completed', 'planned', 'dropped')),
+            user_rating INT CHECK (user_rating BETWEEN 1 AND 10),
+            PRIMARY KEY (username, media_id),
+            FOREIGN KEY (username) REFERENCES Users (username) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ('playlist', """CREATE TABLE playlist (
+            playlist_id varchar(20) PRIMARY KEY,
+            username varchar(50) NOT NULL,
+            name varchar(30),
+            created_at datetime DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (username) REFERENCES Users (username) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ('Playlist_item', """CREATE TABLE Playlist_item (
+            playlist_id varchar(20) NOT NULL,
+            media_id varchar(10) NOT NULL,
+            PRIMARY KEY (playlist_id, media_id),
+            FOREIGN KEY (playlist_id) REFERENCES playlist (playlist_id) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ('Media_Genres', """CREATE TABLE Media_Genres (
+            media_id varchar(10) NOT NULL,
+            genre_id varchar(50) NOT NULL,
+            PRIMARY KEY (media_id, genre_id),
+            FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (genre_id) REFERENCES genres (genre_id) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ('Series_Progress_Table', """CREATE TABLE Series_Progress_Table (
+            username varchar(50) NOT NULL,
+            media_id varchar(10) NOT NULL,
+            last_watched_episode_id VARCHAR(50),
+            last_watched_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (username, media_id),
+            FOREIGN KEY (username) REFERENCES Users (username) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (last_watched_episode_id) REFERENCES Episodes (episode_id)
+        )"""),
+    ('Reviews_Table', """CREATE TABLE Reviews_Table (
+            review_id varchar(10) PRIMARY KEY,
+            username varchar(50) NOT NULL,
+            media_id varchar(10) NOT NULL,
+            review_text TEXT,
+            rating INT CHECK (rating BETWEEN 1 AND 10),
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            FOREIGN KEY (username) REFERENCES Users (username) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ('Friends', """CREATE TABLE Friends (
+            username_1 varchar(50) NOT NULL,
+            username_2 varchar(50) NOT NULL,
+            status varchar(15),
+            check (status IN ('pending', 'accepted', 'blocked')),
+            created_at datetime DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (username_1, username_2),
+            FOREIGN KEY (username_1) REFERENCES Users (username) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (username_2) REFERENCES Users (username) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ('Media_Cast', """CREATE TABLE Media_Cast (
+            media_id varchar(10) NOT NULL,
+            person_id varchar(20) NOT NULL,
+            character_name VARCHAR(100),
+            PRIMARY KEY (media_id, person_id),
+            FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (person_id) REFERENCES People (person_id) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ('Media_Crew', """CREATE TABLE Media_Crew (
+            media_id varchar(10) NOT NULL,
+            person_id varchar(20) NOT NULL,
+            role VARCHAR(50),
+            PRIMARY KEY (media_id, person_id, role),
+            FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (person_id) REFERENCES People (person_id) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ('Activity_Log', """CREATE TABLE Activity_Log (
+            log_id INT AUTO_INCREMENT PRIMARY KEY,
+            username VARCHAR(50),
+            table_name VARCHAR(50),
+            operation ENUM('INSERT', 'UPDATE', 'DELETE'),
+            record_id VARCHAR(100),
+            change_details TEXT,
+            changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )"""),
+]
+
+INDEXES = [
+    ('Episodes', 'idx_media_id', ['media_id']),
+    ('Watchlists_item', 'idx_username', ['username']),
+    ('Media_Genres', 'idx_media_genre', ['media_id', 'genre_id']),
+    ('Series_Progress_Table', 'idx_user_media', ['username', 'media_id']),
+    ('Media_Genres', 'idx_genre_id', ['genre_id']),
+    ('Media', 'idx_media_title', ['title']),
+    ('People', 'idx_people_name', ['name']),
+]
+
+
+def operations():
+    # data.py created the genre table as `Genres`; the app and reset_database use `genres`
+    ops = [rename_table('Genres', 'genres')]
+    # Tables data.py never created (Episodes, Reviews_Table, Friends, ...) are added here
+    ops += [create_table(table, ddl) for table, ddl in TABLES]
+    ops += [create_index(table, name, columns) for table, name, columns in INDEXES]
+    return ops
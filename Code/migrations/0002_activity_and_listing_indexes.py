@@ -0,0 +1,15 @@
+"""Indexes for the activity log filters, top-rated listings and role lookups"""
+
+from migrate import create_index
+
+
+def operations():
+    return [
+        # Recent changes, 7-day stats and per-table filters all order by changed_at
+        create_index('Activity_Log', 'idx_activity_changed_at', ['changed_at']),
+        create_index('Activity_Log', 'idx_activity_table_changed', ['table_name', 'changed_at']),
+        create_index('Activity_Log', 'idx_activity_user_changed', ['username', 'changed_at']),
+        # Trending/top-rated pages sort the whole catalogue by rating then title
+        create_index('Media', 'idx_media_rating_title', ['average_rating', 'title']),
+        create_index('Users', 'idx_users_role', ['role']),
+    ]
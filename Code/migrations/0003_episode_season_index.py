@@ -0,0 +1,13 @@
+"""Covering index for season-at-a-time episode lists"""
+
+from migrate import create_index, drop_index
+
+
+def operations():
+    return [
+        # Season pages read episode_id (the primary key), title and air_date straight from the index
+        create_index('Episodes', 'idx_episodes_season',
+                     ['media_id', 'season_number', 'episode_number', 'title', 'air_date']),
+        # media_id lookups are served by the leftmost column of the unique key and the index above
+        drop_index('Episodes', 'idx_media_id'),
+    ]
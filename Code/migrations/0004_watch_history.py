@@ -0,0 +1,19 @@
+"""Per-episode watch history stored as one bitmap per user and series"""
+
+from migrate import create_table
+
+
+def operations():
+    return [
+        # Bit n of watched_bitmap is the n-th episode of the series in (season_number, episode_number)
+        # order, least significant bit first; BLOB leaves room for series of any length
+        create_table('Watch_History', """CREATE TABLE Watch_History (
+            username varchar(50) NOT NULL,
+            media_id varchar(10) NOT NULL,
+            watched_bitmap BLOB NOT NULL,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (username, media_id),
+            FOREIGN KEY (username) REFERENCES Users (username) ON DELETE CASCADE ON UPDATE CASCADE,
+            FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE
+        )"""),
+    ]
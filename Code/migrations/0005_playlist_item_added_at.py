@@ -0,0 +1,11 @@
+"""Record when items were added to a playlist, for the watchlist page's added-order sort"""
+
+from migrate import add_column, create_index
+
+
+def operations():
+    return [
+        # Existing rows take the migration time; media_id breaks the ties
+        add_column('Playlist_item', 'added_at', 'DATETIME DEFAULT CURRENT_TIMESTAMP'),
+        create_index('Playlist_item', 'idx_playlist_item_added', ['playlist_id', 'added_at']),
+    ]
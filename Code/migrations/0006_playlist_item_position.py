@@ -0,0 +1,23 @@
+"""Manual ordering for playlists: gap-numbered position per item"""
+
+from migrate import add_column, create_index, run_sql
+
+# Must match PLAYLIST_POSITION_GAP in app.py
+POSITION_GAP = 1024
+
+
+def operations():
+    return [
+        # Rows written without a position (table editor, imports, seeding) sort first until renumbered
+        add_column('Playlist_item', 'position', 'BIGINT NOT NULL DEFAULT 0'),
+        # Number existing items in added order, leaving room to move items between neighbours
+        run_sql(f"""UPDATE Playlist_item pi
+                    JOIN (SELECT playlist_id, media_id,
+                                 ROW_NUMBER() OVER (PARTITION BY playlist_id ORDER BY added_at, media_id) * {POSITION_GAP}
+                                     as new_position
+                          FROM Playlist_item) ordered
+                      ON pi.playlist_id = ordered.playlist_id AND pi.media_id = ordered.media_id
+                    SET pi.position = ordered.new_position
+                    WHERE pi.position = 0""", table='Playlist_item'),
+        create_index('Playlist_item', 'idx_playlist_item_position', ['playlist_id', 'position']),
+    ]
@@ -0,0 +1,13 @@
+"""Sequence table for allocating application IDs in blocks"""
+
+from migrate import create_table, run_sql
+
+
+def operations():
+    return [
+        create_table('id_sequence', """CREATE TABLE id_sequence (
+            name VARCHAR(50) PRIMARY KEY,
+            next_value BIGINT NOT NULL
+        )"""),
+        run_sql("INSERT IGNORE INTO id_sequence (name, next_value) VALUES ('playlist', 1)"),
+    ]
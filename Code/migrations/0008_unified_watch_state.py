@@ -0,0 +1,32 @@
+"""Make Watchlists_item the single per-user watch state behind playlists and series progress"""
+
+from migrate import create_index, drop_index, run_sql
+
+
+def operations():
+    return [
+        # Status filters read (username, status) and get media_id from the primary key in the same entry
+        create_index('Watchlists_item', 'idx_watch_state_status', ['username', 'status']),
+        # (username, media_id) lookups use the primary key; the old username index is its prefix
+        drop_index('Watchlists_item', 'idx_username'),
+        # Everything already in a playlist is planned unless a state exists
+        run_sql("""INSERT INTO Watchlists_item (username, media_id, status)
+                   SELECT DISTINCT p.username, pi.media_id, 'planned'
+                   FROM Playlist_item pi
+                   JOIN playlist p ON pi.playlist_id = p.playlist_id
+                   WHERE NOT EXISTS (SELECT 1 FROM Watchlists_item wi
+                                     WHERE wi.username = p.username AND wi.media_id = pi.media_id)""",
+                table='Playlist_item'),
+        # Series with progress are being watched
+        run_sql("""INSERT INTO Watchlists_item (username, media_id, status)
+                   SELECT sp.username, sp.media_id, 'watching'
+                   FROM Series_Progress_Table sp
+                   WHERE NOT EXISTS (SELECT 1 FROM Watchlists_item wi
+                                     WHERE wi.username = sp.username AND wi.media_id = sp.media_id)""",
+                table='Series_Progress_Table'),
+        run_sql("""UPDATE Watchlists_item wi
+                   JOIN Series_Progress_Table sp ON sp.username = wi.username AND sp.media_id = wi.media_id
+                   SET wi.status = 'watching'
+                   WHERE wi.status IS NULL OR wi.status = 'planned'""",
+                table='Watchlists_item'),
+    ]
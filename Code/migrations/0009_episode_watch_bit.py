@@ -0,0 +1,31 @@
+"""Stable watch-history bit per episode, so adding an episode mid-series does not shift later bits"""
+
+from migrate import add_column, create_index, drop_index, run_sql
+
+
+def operations():
+    return [
+        add_column('Episodes', 'watch_bit', 'INT NULL'),
+        # Existing episodes keep the ordinal Watch_History bitmaps were written with (0004), so no bitmap changes
+        run_sql("""UPDATE Episodes e
+                   JOIN (SELECT episode_id,
+                                ROW_NUMBER() OVER (PARTITION BY media_id
+                                                   ORDER BY season_number, episode_number, episode_id) - 1 as bit
+                         FROM Episodes) ordered
+                     ON e.episode_id = ordered.episode_id
+                   SET e.watch_bit = ordered.bit
+                   WHERE e.watch_bit IS NULL""", table='Episodes'),
+        # MAX(watch_bit) per series for the trigger below
+        create_index('Episodes', 'idx_episodes_watch_bit', ['media_id', 'watch_bit']),
+        # New episodes take the next unused bit of their series, wherever they fall in season order;
+        # bits are never renumbered, so a deleted episode's bit is simply left unused
+        run_sql("DROP TRIGGER IF EXISTS episodes_watch_bit", table='Episodes'),
+        run_sql("""CREATE TRIGGER episodes_watch_bit BEFORE INSERT ON Episodes FOR EACH ROW
+                   SET NEW.watch_bit = COALESCE(NEW.watch_bit,
+                       (SELECT COALESCE(MAX(watch_bit) + 1, 0) FROM Episodes WHERE media_id = NEW.media_id))""",
+                table='Episodes'),
+        # Season pages also read watch_bit, so it joins the covering index from 0003
+        create_index('Episodes', 'idx_episodes_season_bits',
+                     ['media_id', 'season_number', 'episode_number', 'title', 'air_date', 'watch_bit']),
+        drop_index('Episodes', 'idx_episodes_season'),
+    ]
@@ -0,0 +1,26 @@
+"""One episode per watch bit: concurrent inserts for a series could both take MAX(watch_bit) + 1 and share a bit"""
+
+from migrate import create_index, drop_index, run_sql
+
+
+def operations():
+    return [
+        # A duplicate bit now fails the insert instead of merging two episodes' watch history
+        create_index('Episodes', 'idx_episodes_watch_bit_unique', ['media_id', 'watch_bit'], unique=True),
+        drop_index('Episodes', 'idx_episodes_watch_bit'),
+        # Inserts for one series take their bit one at a time: the parent Media row is locked first, and
+        # MAX is a locking read so it sees bits committed after the transaction's snapshot
+        run_sql("DROP TRIGGER IF EXISTS episodes_watch_bit", table='Episodes'),
+        run_sql("""CREATE TRIGGER episodes_watch_bit BEFORE INSERT ON Episodes FOR EACH ROW
+                   BEGIN
+                       DECLARE parent VARCHAR(10);
+                       DECLARE next_bit INT;
+                       IF NEW.watch_bit IS NULL THEN
+                           SELECT media_id INTO parent FROM Media WHERE media_id = NEW.media_id FOR UPDATE;
+                           SELECT COALESCE(MAX(watch_bit) + 1, 0) INTO next_bit
+                           FROM Episodes WHERE media_id = NEW.media_id FOR UPDATE;
+                           SET NEW.watch_bit = next_bit;
+                       END IF;
+                   END""",
+                table='Episodes'),
+    ]
@@ -1,7 +1,43 @@
 import mysql.connector
 from mysql.connector import Error
-from datetime import date
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import hashlib
+import math
+import os
 import random
+import re
+import tempfile
+import time
+import numpy as np
+from migrate import apply_migrations
+
+GENRES = [
+    ('G001', 'Action'), ('G002', 'Comedy'), ('G003', 'Drama'), ('G004', 'Thriller'),
+    ('G005', 'Romance'), ('G006', 'Musical'), ('G007', 'Crime'), ('G008', 'Fantasy'),
+    ('G009', 'Biography'), ('G010', 'Family'), ('G011', 'Documentary'), ('G012', 'Adventure'),
+    ('G013', 'Horror'), ('G014', 'Mystery'), ('G015', 'War'), ('G016', 'Sci-Fi')
+]
+
+REVIEW_TEXTS = [
+    'Masterpiece! One of the best films ever made.',
+    'Brilliant performances by the entire cast.',
+    'Engaging storyline with great direction.',
+    'A must-watch for all cinema lovers.',
+    'Good movie but could have been better.',
+    'Average film with some good moments.',
+    'Disappointing compared to expectations.',
+    'Waste of time. Would not recommend.',
+    'Fantastic direction and cinematography!',
+    'Loved every moment of it. Highly recommended!',
+    'The music and visuals are stunning.',
+    'A rollercoaster of emotions. Superb!',
+    'Not my cup of tea but well executed.',
+    'Outstanding performances all around.',
+    'An emotional journey worth experiencing.'
+]
 
 def load_secrets():
     """Load database credentials"""
@@ -22,14 +58,15 @@ def load_secrets():
     }
     return _cached_db_config
 
-def get_connection(use_database=False):
-    """Get database connection"""
-    db_config = load_secrets()
+def get_connection(use_database=False, allow_local_infile=False, db_config=None):
+    """Get database connection; db_config defaults to the prompted credentials"""
+    db_config = db_config or load_secrets()
     try:
         conn = mysql.connector.connect(
             host=db_config['host'],
             user=db_config['user'],
-            password=db_config['password']
+            password=db_config['password'],
+            allow_local_infile=allow_local_infile
         )
         if use_database:
             cursor = conn.cursor()
@@ -64,12 +101,9 @@ def reset_database():
     finally:
         cursor.close()
 
-def create_tables(conn):
-    """Create all tables"""
-    cursor = conn.cursor()
-    
-    tables = [
-        """CREATE TABLE Users (
+# Baseline schema (frozen as migrations/0001_baseline.py); later changes go in Code/migrations rather than here
+TABLE_DEFINITIONS = [
+    """CREATE TABLE Users (
             username varchar(50) unique primary key,
             firstname varchar(50) not null,
             lastname varchar(50),
@@ -81,7 +115,7 @@ def create_tables(conn):
             created_at datetime DEFAULT CURRENT_TIMESTAMP
         )""",
         
-        """CREATE TABLE Media (
+    """CREATE TABLE Media (
             media_id varchar(10) primary key,
             title varchar(100) NOT NULL,
             description TEXT,
@@ -93,19 +127,19 @@ def create_tables(conn):
             average_rating DECIMAL(3, 1)
         )""",
         
-        """CREATE TABLE genres (
+    """CREATE TABLE genres (
             genre_id varchar(50) PRIMARY KEY,
             name varchar(50) NOT NULL
         )""",
         
-        """CREATE TABLE People (
+    """CREATE TABLE People (
             person_id varchar(20) primary key,
             name varchar(40),
             birthdate date,
             photo_url varchar(2083)
         )""",
         
-        """CREATE TABLE Episodes (
+    """CREATE TABLE Episodes (
             episode_id VARCHAR(50) PRIMARY KEY,
             media_id varchar(10) NOT NULL,
             season_number INT,
@@ -116,7 +150,7 @@ def create_tables(conn):
             FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE
         )""",
         
-        """CREATE TABLE Watchlists_item (
+    """CREATE TABLE Watchlists_item (
             username varchar(50) NOT NULL,
             media_id varchar(10) NOT NULL,
             status VARCHAR(20) CHECK (status IN ('watching', 'completed', 'planned', 'dropped')),
@@ -126,7 +160,7 @@ def create_tables(conn):
             FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE
         )""",
         
-        """CREATE TABLE playlist (
+    """CREATE TABLE playlist (
             playlist_id varchar(20) PRIMARY KEY,
             username varchar(50) NOT NULL,
             name varchar(30),
@@ -134,7 +168,7 @@ def create_tables(conn):
             FOREIGN KEY (username) REFERENCES Users (username) ON DELETE CASCADE ON UPDATE CASCADE
         )""",
         
-        """CREATE TABLE Playlist_item (
+    """CREATE TABLE Playlist_item (
             playlist_id varchar(20) NOT NULL,
             media_id varchar(10) NOT NULL,
             PRIMARY KEY (playlist_id, media_id),
@@ -142,7 +176,7 @@ def create_tables(conn):
             FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE
         )""",
         
-        """CREATE TABLE Media_Genres (
+    """CREATE TABLE Media_Genres (
             media_id varchar(10) NOT NULL,
             genre_id varchar(50) NOT NULL,
             PRIMARY KEY (media_id, genre_id),
@@ -150,7 +184,7 @@ def create_tables(conn):
             FOREIGN KEY (genre_id) REFERENCES genres (genre_id) ON DELETE CASCADE ON UPDATE CASCADE
         )""",
         
-        """CREATE TABLE Series_Progress_Table (
+    """CREATE TABLE Series_Progress_Table (
             username varchar(50) NOT NULL,
             media_id varchar(10) NOT NULL,
             last_watched_episode_id VARCHAR(50),
@@ -161,7 +195,7 @@ def create_tables(conn):
             FOREIGN KEY (last_watched_episode_id) REFERENCES Episodes (episode_id)
         )""",
         
-        """CREATE TABLE Reviews_Table (
+    """CREATE TABLE Reviews_Table (
             review_id varchar(10) PRIMARY KEY,
             username varchar(50) NOT NULL,
             media_id varchar(10) NOT NULL,
@@ -173,7 +207,7 @@ def create_tables(conn):
             FOREIGN KEY (media_id) REFERENCES Media (media_id) ON DELETE CASCADE ON UPDATE CASCADE
         )""",
         
-        """CREATE TABLE Friends (
+    """CREATE TABLE Friends (
             username_1 varchar(50) NOT NULL,
             username_2 varchar(50) NOT NULL,
             status varchar(15),
@@ -184,7 +218,7 @@ def create_tables(conn):
             FOREIGN KEY (username_2) REFERENCES Users (username) ON DELETE CASCADE ON UPDATE CASCADE
         )""",
         
-        """CREATE TABLE Media_Cast (
+    """CREATE TABLE Media_Cast (
             media_id varchar(10) NOT NULL,
             person_id varchar(20) NOT NULL,
             character_name VARCHAR(100),
@@ -193,7 +227,7 @@ def create_tables(conn):
             FOREIGN KEY (person_id) REFERENCES People (person_id) ON DELETE CASCADE ON UPDATE CASCADE
         )""",
         
-        """CREATE TABLE Media_Crew (
+    """CREATE TABLE Media_Crew (
             media_id varchar(10) NOT NULL,
             person_id varchar(20) NOT NULL,
             role VARCHAR(50),
@@ -202,7 +236,7 @@ def create_tables(conn):
             FOREIGN KEY (person_id) REFERENCES People (person_id) ON DELETE CASCADE ON UPDATE CASCADE
         )""",
         
-        """CREATE TABLE Activity_Log (
+    """CREATE TABLE Activity_Log (
             log_id INT AUTO_INCREMENT PRIMARY KEY,
             username VARCHAR(50),
             table_name VARCHAR(50),
@@ -211,8 +245,47 @@ def create_tables(conn):
             change_details TEXT,
             changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
         )"""
-    ]
+]
+
+INDEX_DEFINITIONS = [
+    "CREATE INDEX idx_media_id ON Episodes (media_id)",
+    "CREATE INDEX idx_username ON Watchlists_item (username)",
+    "CREATE INDEX idx_media_genre ON Media_Genres (media_id, genre_id)",
+    "CREATE INDEX idx_user_media ON Series_Progress_Table (username, media_id)",
+    "CREATE INDEX idx_genre_id ON Media_Genres (genre_id)",
+    "CREATE INDEX idx_media_title ON Media (title)",
+    "CREATE INDEX idx_people_name ON People (name)"
+]
+
+def split_foreign_keys(ddl):
+    """Split a CREATE TABLE statement into its bare form and an ALTER TABLE adding its foreign keys"""
+    lines = ddl.split('\n')
+    kept = [line for line in lines if not line.strip().startswith('FOREIGN KEY')]
+    foreign_keys = [line.strip().rstrip(',') for line in lines if line.strip().startswith('FOREIGN KEY')]
+    if not foreign_keys:
+        return ddl, None
+    # The column list must not end with a dangling comma once the FK lines are gone
+    kept[-2] = kept[-2].rstrip().rstrip(',')
+    table = re.search(r'CREATE TABLE (\w+)', ddl).group(1)
+    alter = f"ALTER TABLE {table} " + ", ".join(f"ADD {fk}" for fk in foreign_keys)
+    return '\n'.join(kept), alter
+
+def create_tables(conn, defer_constraints=False):
+    """Create all tables; with defer_constraints, return the index/FK statements to run after loading"""
+    cursor = conn.cursor()
     
+    tables = TABLE_DEFINITIONS
+
+    deferred = []
+    if defer_constraints:
+        bare_tables = []
+        for table in tables:
+            bare, alter = split_foreign_keys(table)
+            bare_tables.append(bare)
+            if alter:
+                deferred.append(alter)
+        tables = bare_tables
+
     print("\n📊 Creating tables...")
     for table in tables:
         try:
@@ -220,16 +293,15 @@ def create_tables(conn):
         except Error as e:
             print(f"  ❌ Error: {e}")
     
-    indexes = [
-        "CREATE INDEX idx_media_id ON Episodes (media_id)",
-        "CREATE INDEX idx_username ON Watchlists_item (username)",
-        "CREATE INDEX idx_media_genre ON Media_Genres (media_id, genre_id)",
-        "CREATE INDEX idx_user_media ON Series_Progress_Table (username, media_id)",
-        "CREATE INDEX idx_genre_id ON Media_Genres (genre_id)",
-        "CREATE INDEX idx_media_title ON Media (title)",
-        "CREATE INDEX idx_people_name ON People (name)"
-    ]
+    indexes = list(INDEX_DEFINITIONS)
     
+    if defer_constraints:
+        conn.commit()
+        cursor.close()
+        print("✅ Tables created without secondary indexes and foreign keys (deferred until after loading)")
+        # Indexes first so the foreign keys can reuse them
+        return indexes + deferred
+
     for idx in indexes:
         try:
             cursor.execute(idx)
@@ -239,6 +311,25 @@ def create_tables(conn):
     conn.commit()
     cursor.close()
     print("✅ Tables created!")
+    return []
+
+def build_deferred_constraints(conn, statements):
+    """Build secondary indexes and foreign keys after a fast load"""
+    cursor = conn.cursor()
+    print("\n🏗️  Building indexes and foreign keys...")
+    # The generator guarantees referential integrity, so skip re-validating every row;
+    # with checks off MySQL can also add the foreign keys in place without a table copy
+    cursor.execute("SET SESSION foreign_key_checks = 0")
+    for statement in statements:
+        started = time.perf_counter()
+        try:
+            cursor.execute(statement)
+            print(f"  ✅ {statement[:70]:<70} {time.perf_counter() - started:6.1f}s")
+        except Error as e:
+            print(f"  ❌ {statement[:70]}: {e}")
+    cursor.execute("SET SESSION foreign_key_checks = 1")
+    conn.commit()
+    cursor.close()
 
 def get_comprehensive_data():
     """Return comprehensive Bollywood/Indian entertainment data"""
@@ -552,12 +643,7 @@ def insert_comprehensive_data(conn):
     
     # --- Genres ---
     print("\n🎭 Creating genres...")
-    genres = [
-        ('G001', 'Action'), ('G002', 'Comedy'), ('G003', 'Drama'), ('G004', 'Thriller'),
-        ('G005', 'Romance'), ('G006', 'Musical'), ('G007', 'Crime'), ('G008', 'Fantasy'),
-        ('G009', 'Biography'), ('G010', 'Family'), ('G011', 'Documentary'), ('G012', 'Adventure'),
-        ('G013', 'Horror'), ('G014', 'Mystery'), ('G015', 'War'), ('G016', 'Sci-Fi')
-    ]
+    genres = GENRES
     cursor.executemany("INSERT INTO genres (genre_id, name) VALUES (%s, %s)", genres)
     print(f"  ✅ {len(genres)} genres created")
     
@@ -708,23 +794,7 @@ def insert_comprehensive_data(conn):
     print("  ⭐ Creating reviews...")
     reviews = []
     rid = 1
-    review_texts = [
-        'Masterpiece! One of the best films ever made.',
-        'Brilliant performances by the entire cast.',
-        'Engaging storyline with great direction.',
-        'A must-watch for all cinema lovers.',
-        'Good movie but could have been better.',
-        'Average film with some good moments.',
-        'Disappointing compared to expectations.',
-        'Waste of time. Would not recommend.',
-        'Fantastic direction and cinematography!',
-        'Loved every moment of it. Highly recommended!',
-        'The music and visuals are stunning.',
-        'A rollercoaster of emotions. Superb!',
-        'Not my cup of tea but well executed.',
-        'Outstanding performances all around.',
-        'An emotional journey worth experiencing.'
-    ]
+    review_texts = REVIEW_TEXTS
     
     for user in random.sample(users_list, k=min(200, len(users_list))):
         for m in random.sample(media_ids, k=random.randint(2, 12)):
@@ -776,18 +846,579 @@ def insert_comprehensive_data(conn):
             rating = random.randint(6, 10) if status == 'completed' and random.random() > 0.3 else None
             watchlist_items.append((user, m, status, rating))
     
-    for item in watchlist_items:
-        if item[3] is not None:
-            cursor.execute("INSERT INTO Watchlists_item (username, media_id, status, user_rating) VALUES (%s, %s, %s, %s)", item)
-        else:
-            cursor.execute("INSERT INTO Watchlists_item (username, media_id, status) VALUES (%s, %s, %s)", (item[0], item[1], item[2]))
-    
+    cursor.executemany("INSERT INTO Watchlists_item (username, media_id, status, user_rating) VALUES (%s, %s, %s, %s)", watchlist_items)
     print(f"    ✅ {len(watchlist_items)} watchlist items")
     
     conn.commit()
     cursor.close()
     print("\n✅ All data inserted successfully!")
 
+# --- Synthetic data generation for load testing ---
+
+SCALE_DEFAULTS = {
+    'seed': 42,
+    'users': 10000,
+    'media': 5000,
+    'people': 5000,
+    'series_fraction': 0.25,
+    'episodes_per_series': 24,
+    'reviews_per_user': 8,
+    'friends_per_user': 12,
+    'playlists_per_user': 2,
+    'items_per_playlist': 12,
+    'watchlist_per_user': 10,
+    'series_per_user': 3,
+    'activity_rows': 100000,
+    'zipf_exponent': 1.1,
+    'chunk_size': 10000
+}
+
+# Counts multiplied by --scale
+SCALED_KEYS = ('users', 'media', 'people', 'activity_rows')
+
+FIRST_NAMES = ['Aarav', 'Vivaan', 'Aditya', 'Arjun', 'Sai', 'Reyansh', 'Ishaan', 'Kabir', 'Rohan', 'Vikram',
+               'Ananya', 'Diya', 'Isha', 'Kavya', 'Meera', 'Priya', 'Riya', 'Saanvi', 'Tara', 'Zoya']
+LAST_NAMES = ['Sharma', 'Verma', 'Gupta', 'Iyer', 'Nair', 'Reddy', 'Patel', 'Shah', 'Mehta', 'Kapoor',
+              'Khan', 'Singh', 'Das', 'Bose', 'Menon', 'Pillai', 'Joshi', 'Kulkarni', 'Chopra', 'Malhotra']
+TITLE_WORDS = ['Silent', 'Broken', 'Golden', 'Last', 'Hidden', 'Crimson', 'Midnight', 'Lost', 'Eternal', 'Wild',
+               'City', 'River', 'Monsoon', 'Empire', 'Promise', 'Shadow', 'Journey', 'Kingdom', 'Letters', 'Dreams']
+AGE_RATINGS = ['G', 'PG', 'PG-13', 'U', 'U/A 7+', 'U/A 13+', 'U/A 16+', 'A']
+CHARACTER_ROLES = ['Lead Role', 'Supporting Role', 'Special Appearance', 'Cameo', 'Antagonist', 'Protagonist']
+CREW_ROLES = ['Director', 'Writer', 'Producer', 'Music Director']
+PLAYLIST_NAMES = ['Favorites', 'Watch Later', 'Top Bollywood', 'Family Movies', 'Thriller Collection', 'Weekend Binge']
+WATCH_STATUSES = ['watching', 'completed', 'planned', 'dropped']
+LOGGED_TABLES = ['Media', 'Episodes', 'People', 'Reviews_Table', 'playlist', 'Playlist_item', 'Users']
+
+# Fixed tags keep every table's random stream independent of the others
+TABLE_TAGS = {
+    'Users': 1, 'genres': 2, 'Media': 3, 'People': 4, 'Episodes': 5, 'Media_Genres': 6,
+    'Media_Cast': 7, 'Media_Crew': 8, 'playlist': 9, 'Playlist_item': 10, 'Reviews_Table': 11,
+    'Series_Progress_Table': 12, 'Friends': 13, 'Watchlists_item': 14, 'Activity_Log': 15,
+    'series_type': 16, 'playlist_count': 17, 'user_rank': 18
+}
+
+MASK64 = (1 << 64) - 1
+
+def build_scale_config(scale=1.0, **overrides):
+    """Build a synthetic data config from defaults, a scale factor and explicit overrides"""
+    cfg = dict(SCALE_DEFAULTS)
+    for key in SCALED_KEYS:
+        cfg[key] = max(1, int(cfg[key] * scale))
+    cfg.update({k: v for k, v in overrides.items() if v is not None})
+    movies, series, people = _curated_data()
+    cfg['media'] = max(cfg['media'], len(movies) + len(series))
+    cfg['people'] = max(cfg['people'], len(people))
+    return cfg
+
+@lru_cache(maxsize=1)
+def _curated_data():
+    return get_comprehensive_data()
+
+def _hash_units(seed, tag, idx):
+    """Deterministic uniform [0, 1) values per index (splitmix64), usable from any process"""
+    x = np.asarray(idx, dtype=np.uint64)
+    salt = np.uint64(((seed * 0x9E3779B97F4A7C15) ^ (tag * 0xC2B2AE3D27D4EB4F)) & MASK64)
+    with np.errstate(over='ignore'):
+        z = x + salt + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+@lru_cache(maxsize=8)
+def _zipf_cdf(n, exponent):
+    weights = 1.0 / np.arange(1, n + 1, dtype=np.float64) ** exponent
+    cdf = np.cumsum(weights)
+    return cdf / cdf[-1]
+
+def _zipf_draw(rng, n, exponent, size):
+    """Draw 1-based ranks where rank 1 is the most popular"""
+    return np.searchsorted(_zipf_cdf(n, exponent), rng.random(size), side='right') + 1
+
+def _distinct(values, limit):
+    return list(dict.fromkeys(int(v) for v in values))[:limit]
+
+def _block_rng(cfg, table, lo):
+    return np.random.default_rng([cfg['seed'], TABLE_TAGS[table], lo])
+
+def _media_id(idx):
+    return f'M{idx:04d}'
+
+def _person_id(idx):
+    return f'P{idx:04d}'
+
+def _username(idx):
+    return f'user{idx:03d}'
+
+def _to_base36(number):
+    digits = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    out = ''
+    while True:
+        number, rem = divmod(number, 36)
+        out = digits[rem] + out
+        if number == 0:
+            return out
+
+def _is_series(cfg, idx):
+    """Vectorised media type lookup: curated titles keep their type, the rest are hashed"""
+    movies, series, _ = _curated_data()
+    idx = np.asarray(idx)
+    synthetic = _hash_units(cfg['seed'], TABLE_TAGS['series_type'], idx) < cfg['series_fraction']
+    curated_series = (idx > len(movies)) & (idx <= len(movies) + len(series))
+    return np.where(idx <= len(movies) + len(series), curated_series, synthetic)
+
+@lru_cache(maxsize=4)
+def _series_indices(seed, media, series_fraction):
+    cfg = {'seed': seed, 'series_fraction': series_fraction}
+    idx = np.arange(1, media + 1)
+    return idx[_is_series(cfg, idx)]
+
+def _series_list(cfg):
+    return _series_indices(cfg['seed'], cfg['media'], cfg['series_fraction'])
+
+def series_layout(cfg, idx):
+    """Episodes per season for a series, identical wherever it is computed"""
+    movies, series, _ = _curated_data()
+    if len(movies) < idx <= len(movies) + len(series):
+        return list(series[idx - len(movies) - 1][7])
+    rng = random.Random(f"{cfg['seed']}:layout:{idx}")
+    total = max(1, int(rng.expovariate(1 / cfg['episodes_per_series'])))
+    seasons = max(1, min(total, round(total / rng.choice([6, 8, 10, 13, 22]))))
+    per_season = [total // seasons + (1 if s < total % seasons else 0) for s in range(seasons)]
+    return per_season
+
+def _episode_id(media_idx, season, episode):
+    return f'{_media_id(media_idx)}S{season:02d}E{episode:04d}'
+
+def _playlist_counts(cfg, user_idx):
+    u = _hash_units(cfg['seed'], TABLE_TAGS['playlist_count'], user_idx)
+    return np.floor(-cfg['playlists_per_user'] * np.log1p(-u)).astype(int)
+
+def _user_permutation(cfg):
+    """Multiplier mapping popularity rank to user index so popular users are spread out"""
+    n = cfg['users']
+    step = 2654435761 % n or 1
+    while math.gcd(step, n) != 1:
+        step += 1
+    return step
+
+def _gen_users(cfg, rng, lo, hi):
+    rows = []
+    if lo == 1:
+        rows.append(('admin', 'Admin', 'User', date(1990, 1, 1), 'admin@streamsync.com',
+                     hashlib.sha256(b'admin123').hexdigest(), 'admin'))
+        rows.append(('moderator', 'Mod', 'User', date(1992, 5, 15), 'mod@streamsync.com',
+                     hashlib.sha256(b'mod123').hexdigest(), 'moderator'))
+    first = rng.integers(0, len(FIRST_NAMES), hi - lo)
+    last = rng.integers(0, len(LAST_NAMES), hi - lo)
+    days = rng.integers(0, 365 * 40, hi - lo)
+    for k, i in enumerate(range(lo, hi)):
+        rows.append((
+            _username(i), FIRST_NAMES[first[k]], LAST_NAMES[last[k]],
+            date(1965, 1, 1) + timedelta(days=int(days[k])),
+            f'{_username(i)}@example.com',
+            hashlib.sha256(f'password{i:03d}'.encode()).hexdigest(), 'user'
+        ))
+    return rows
+
+def _gen_genres(cfg, rng, lo, hi):
+    return list(GENRES)
+
+def _gen_media(cfg, rng, lo, hi):
+    movies, series, _ = _curated_data()
+    is_series = _is_series(cfg, np.arange(lo, hi))
+    words = rng.integers(0, len(TITLE_WORDS), (hi - lo, 2))
+    years = rng.integers(1950, 2026, hi - lo)
+    ratings = np.clip(rng.normal(6.8, 1.2, hi - lo), 1.0, 10.0).round(1)
+    ages = rng.integers(0, len(AGE_RATINGS), hi - lo)
+    rows = []
+    for k, i in enumerate(range(lo, hi)):
+        if i <= len(movies):
+            title, year, desc, rating, age_rating, _ = movies[i - 1]
+            rows.append((_media_id(i), title, desc, year, 'Movie', age_rating, None, rating))
+        elif i <= len(movies) + len(series):
+            title, year, desc, rating, age_rating = series[i - len(movies) - 1][:5]
+            rows.append((_media_id(i), title, desc, year, 'Series', age_rating, None, rating))
+        else:
+            title = f'{TITLE_WORDS[words[k][0]]} {TITLE_WORDS[words[k][1]]} {i}'
+            media_type = 'Series' if is_series[k] else 'Movie'
+            rows.append((_media_id(i), title, f'Synthetic {media_type.lower()} #{i}.', int(years[k]),
+                         media_type, AGE_RATINGS[ages[k]], None, float(ratings[k])))
+    return rows
+
+def _gen_people(cfg, rng, lo, hi):
+    _, _, people = _curated_data()
+    first = rng.integers(0, len(FIRST_NAMES), hi - lo)
+    last = rng.integers(0, len(LAST_NAMES), hi - lo)
+    days = rng.integers(0, 365 * 60, hi - lo)
+    rows = []
+    for k, i in enumerate(range(lo, hi)):
+        if i <= len(people):
+            name, birthdate = people[i - 1]
+        else:
+            name = f'{FIRST_NAMES[first[k]]} {LAST_NAMES[last[k]]} {i}'
+            birthdate = date(1940, 1, 1) + timedelta(days=int(days[k]))
+        rows.append((_person_id(i), name, birthdate, None))
+    return rows
+
+def _gen_episodes(cfg, rng, lo, hi):
+    movies, series, _ = _curated_data()
+    rows = []
+    for i in np.arange(lo, hi)[_is_series(cfg, np.arange(lo, hi))]:
+        i = int(i)
+        if i <= len(movies) + len(series):
+            title, year = series[i - len(movies) - 1][:2]
+        else:
+            title, year = f'Series {i}', 1990 + i % 35
+        for season, count in enumerate(series_layout(cfg, i), 1):
+            for ep in range(1, count + 1):
+                air_date = date(min(year + season - 1, 2155), (ep % 12) + 1, min((ep * 3) % 28 + 1, 28))
+                rows.append((_episode_id(i, season, ep), _media_id(i), season, ep, f'{title} S{season}E{ep}'[:100], air_date))
+    return rows
+
+def _gen_media_genres(cfg, rng, lo, hi):
+    movies, series, _ = _curated_data()
+    genre_map = {name: gid for gid, name in GENRES}
+    rows = []
+    for i in range(lo, hi):
+        if i <= len(movies):
+            names = movies[i - 1][5]
+        elif i <= len(movies) + len(series):
+            names = series[i - len(movies) - 1][5]
+        else:
+            picks = _distinct(_zipf_draw(rng, len(GENRES), 0.8, 3), int(rng.integers(1, 4)))
+            names = [GENRES[p - 1][1] for p in picks]
+        rows.extend((_media_id(i), genre_map[n]) for n in dict.fromkeys(names) if n in genre_map)
+    return rows
+
+def _gen_media_cast(cfg, rng, lo, hi):
+    rows = []
+    for i in range(lo, hi):
+        count = int(rng.integers(3, 9))
+        for p in _distinct(_zipf_draw(rng, cfg['people'], cfg['zipf_exponent'], count * 2), count):
+            rows.append((_media_id(i), _person_id(p), CHARACTER_ROLES[int(rng.integers(0, len(CHARACTER_ROLES)))]))
+    return rows
+
+def _gen_media_crew(cfg, rng, lo, hi):
+    rows = []
+    for i in range(lo, hi):
+        count = int(rng.integers(1, 4))
+        for k, p in enumerate(_distinct(_zipf_draw(rng, cfg['people'], cfg['zipf_exponent'], count * 2), count)):
+            rows.append((_media_id(i), _person_id(p), CREW_ROLES[k % len(CREW_ROLES)]))
+    return rows
+
+def _gen_playlists(cfg, rng, lo, hi):
+    rows = []
+    for i, count in zip(range(lo, hi), _playlist_counts(cfg, np.arange(lo, hi))):
+        for k in range(count):
+            rows.append((f'PL{i:07d}{k:03d}', _username(i), PLAYLIST_NAMES[int(rng.integers(0, len(PLAYLIST_NAMES)))]))
+    return rows
+
+def _gen_playlist_items(cfg, rng, lo, hi):
+    rows = []
+    for i, count in zip(range(lo, hi), _playlist_counts(cfg, np.arange(lo, hi))):
+        for k in range(count):
+            size = max(1, int(rng.geometric(1 / cfg['items_per_playlist'])))
+            for m in _distinct(_zipf_draw(rng, cfg['media'], cfg['zipf_exponent'], size * 2), size):
+                rows.append((f'PL{i:07d}{k:03d}', _media_id(m)))
+    return rows
+
+def _gen_reviews(cfg, rng, lo, hi):
+    rows = []
+    for i in range(lo, hi):
+        count = int(rng.geometric(1 / (cfg['reviews_per_user'] + 1))) - 1
+        for k, m in enumerate(_distinct(_zipf_draw(rng, cfg['media'], cfg['zipf_exponent'], count * 2), min(count, 999))):
+            review_id = f'R{_to_base36(i * 1000 + k):0>9}'
+            rows.append((review_id, _username(i), _media_id(m),
+                         REVIEW_TEXTS[int(rng.integers(0, len(REVIEW_TEXTS)))], int(rng.integers(4, 11))))
+    return rows
+
+def _gen_series_progress(cfg, rng, lo, hi):
+    series_idx = _series_list(cfg)
+    if len(series_idx) == 0:
+        return []
+    rows = []
+    for i in range(lo, hi):
+        count = int(rng.poisson(cfg['series_per_user']))
+        for rank in _distinct(_zipf_draw(rng, len(series_idx), cfg['zipf_exponent'], count * 2), count):
+            m = int(series_idx[rank - 1])
+            layout = series_layout(cfg, m)
+            season = int(rng.integers(1, len(layout) + 1))
+            episode = int(rng.integers(1, layout[season - 1] + 1))
+            rows.append((_username(i), _media_id(m), _episode_id(m, season, episode)))
+    return rows
+
+def _gen_friends(cfg, rng, lo, hi):
+    n = cfg['users']
+    step = _user_permutation(cfg)
+    # Pareto degrees give the power-law tail; mean degree is friends_per_user
+    degrees = np.minimum((rng.pareto(2.0, hi - lo) + 1) * cfg['friends_per_user'] / 2, n - 1).astype(int)
+    rows = []
+    for i, degree in zip(range(lo, hi), degrees):
+        ranks = _zipf_draw(rng, n, cfg['zipf_exponent'], int(degree))
+        targets = ((ranks - 1) * step) % n + 1
+        # Emit each pair only from its lower-index side so (a, b) and (b, a) never both appear
+        for j in dict.fromkeys(int(t) for t in targets if t > i):
+            status = 'pending' if rng.random() < 0.25 else 'accepted'
+            rows.append((_username(i), _username(j), status))
+    return rows
+
+def _gen_watchlist_items(cfg, rng, lo, hi):
+    rows = []
+    for i in range(lo, hi):
+        count = int(rng.geometric(1 / (cfg['watchlist_per_user'] + 1))) - 1
+        for m in _distinct(_zipf_draw(rng, cfg['media'], cfg['zipf_exponent'], count * 2), count):
+            status = WATCH_STATUSES[int(rng.integers(0, len(WATCH_STATUSES)))]
+            rating = int(rng.integers(6, 11)) if status == 'completed' and rng.random() > 0.3 else None
+            rows.append((_username(i), _media_id(m), status, rating))
+    return rows
+
+def _gen_activity_log(cfg, rng, lo, hi):
+    users = _zipf_draw(rng, cfg['users'], cfg['zipf_exponent'], hi - lo)
+    tables = rng.integers(0, len(LOGGED_TABLES), hi - lo)
+    ops = rng.choice(['INSERT', 'UPDATE', 'DELETE'], hi - lo, p=[0.6, 0.3, 0.1])
+    seconds = rng.integers(0, 365 * 24 * 3600, hi - lo)
+    now = datetime(2025, 1, 1)
+    rows = []
+    for k, i in enumerate(range(lo, hi)):
+        table = LOGGED_TABLES[tables[k]]
+        rows.append((_username(int(users[k])), table, str(ops[k]), f'SYN{i}',
+                     f'Synthetic {ops[k].lower()} on {table}', now - timedelta(seconds=int(seconds[k]))))
+    return rows
+
+# Tables in foreign key order: (table, columns, entity count key, rows per entity, generator)
+SYNTHETIC_TABLES = [
+    ('Users', ('username', 'firstname', 'lastname', 'DOB', 'email', 'password', 'role'),
+     'users', lambda cfg: 1, _gen_users),
+    ('genres', ('genre_id', 'name'), None, lambda cfg: len(GENRES), _gen_genres),
+    ('Media', ('media_id', 'title', 'description', 'release_year', 'media_type', 'age_rating',
+               'poster_image_url', 'average_rating'), 'media', lambda cfg: 1, _gen_media),
+    ('People', ('person_id', 'name', 'birthdate', 'photo_url'), 'people', lambda cfg: 1, _gen_people),
+    ('Episodes', ('episode_id', 'media_id', 'season_number', 'episode_number', 'title', 'air_date'),
+     'media', lambda cfg: cfg['series_fraction'] * cfg['episodes_per_series'], _gen_episodes),
+    ('Media_Genres', ('media_id', 'genre_id'), 'media', lambda cfg: 2, _gen_media_genres),
+    ('Media_Cast', ('media_id', 'person_id', 'character_name'), 'media', lambda cfg: 5.5, _gen_media_cast),
+    ('Media_Crew', ('media_id', 'person_id', 'role'), 'media', lambda cfg: 2, _gen_media_crew),
+    ('playlist', ('playlist_id', 'username', 'name'), 'users', lambda cfg: cfg['playlists_per_user'], _gen_playlists),
+    ('Playlist_item', ('playlist_id', 'media_id'), 'users',
+     lambda cfg: cfg['playlists_per_user'] * cfg['items_per_playlist'], _gen_playlist_items),
+    ('Reviews_Table', ('review_id', 'username', 'media_id', 'review_text', 'rating'), 'users',
+     lambda cfg: cfg['reviews_per_user'], _gen_reviews),
+    ('Series_Progress_Table', ('username', 'media_id', 'last_watched_episode_id'), 'users',
+     lambda cfg: cfg['series_per_user'], _gen_series_progress),
+    ('Friends', ('username_1', 'username_2', 'status'), 'users', lambda cfg: cfg['friends_per_user'] / 2, _gen_friends),
+    ('Watchlists_item', ('username', 'media_id', 'status', 'user_rating'), 'users',
+     lambda cfg: cfg['watchlist_per_user'], _gen_watchlist_items),
+    ('Activity_Log', ('username', 'table_name', 'operation', 'record_id', 'change_details', 'changed_at'),
+     'activity_rows', lambda cfg: 1, _gen_activity_log),
+]
+
+# Foreign key parents of each synthetic table; tables in the same level load concurrently
+SYNTHETIC_PARENTS = {
+    'Episodes': ('Media',),
+    'Media_Genres': ('Media', 'genres'),
+    'Media_Cast': ('Media', 'People'),
+    'Media_Crew': ('Media', 'People'),
+    'playlist': ('Users',),
+    'Playlist_item': ('playlist', 'Media'),
+    'Reviews_Table': ('Users', 'Media'),
+    'Series_Progress_Table': ('Users', 'Media', 'Episodes'),
+    'Friends': ('Users',),
+    'Watchlists_item': ('Users', 'Media'),
+}
+
+def synthetic_levels():
+    """Group synthetic tables into FK levels: every parent sits in an earlier level"""
+    level_of = {}
+    for table, *_ in SYNTHETIC_TABLES:
+        level_of[table] = 1 + max((level_of[p] for p in SYNTHETIC_PARENTS.get(table, ())), default=-1)
+    levels = [[] for _ in range(max(level_of.values()) + 1)]
+    for table, *_ in SYNTHETIC_TABLES:
+        levels[level_of[table]].append(table)
+    return levels
+
+def synthetic_blocks(cfg, table):
+    """Split a table's entities into (lo, hi) blocks of roughly chunk_size rows"""
+    _, _, count_key, per_entity, _ = next(t for t in SYNTHETIC_TABLES if t[0] == table)
+    if count_key is None:
+        return [(1, 2)]
+    count = cfg[count_key]
+    step = max(1, int(cfg['chunk_size'] / max(per_entity(cfg), 1e-9)))
+    return [(lo, min(lo + step, count + 1)) for lo in range(1, count + 1, step)]
+
+def generate_block(cfg, table, lo, hi):
+    """Generate the rows of one block; the same (table, lo) always yields the same rows"""
+    generator = next(t for t in SYNTHETIC_TABLES if t[0] == table)[4]
+    return generator(cfg, _block_rng(cfg, table, lo), lo, hi)
+
+def iter_synthetic_chunks(cfg, table):
+    """Stream a synthetic table as row chunks so memory stays bounded"""
+    for lo, hi in synthetic_blocks(cfg, table):
+        rows = generate_block(cfg, table, lo, hi)
+        if rows:
+            yield rows
+
+# LOAD DATA LOCAL INFILE disabled on the client or server
+LOAD_DATA_REFUSED = (1148, 2068, 3948)
+
+def _tsv_value(value):
+    """Format a value for LOAD DATA's default tab-separated, backslash-escaped format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    text = str(value)
+    return text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+def load_rows_infile(cursor, table, columns, rows):
+    """Load rows through a temporary file with LOAD DATA LOCAL INFILE"""
+    with tempfile.NamedTemporaryFile('w', suffix='.tsv', delete=False, encoding='utf-8', newline='\n') as f:
+        for row in rows:
+            f.write('\t'.join(_tsv_value(v) for v in row) + '\n')
+        path = f.name
+    try:
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 ({', '.join(columns)})",
+            (path,)
+        )
+    finally:
+        os.remove(path)
+
+def load_rows_insert(cursor, table, columns, rows):
+    """Load rows with executemany, which the connector batches into multi-row INSERTs"""
+    query = (f"INSERT INTO {table} ({', '.join(columns)}) "
+             f"VALUES ({', '.join(['%s'] * len(columns))})")
+    cursor.executemany(query, rows)
+
+def load_synthetic_table(conn, cfg, table, columns, method='insert'):
+    """Generate and load one table chunk by chunk, returning (rows, method actually used)"""
+    cursor = conn.cursor()
+    total = 0
+    for rows in iter_synthetic_chunks(cfg, table):
+        if method == 'infile':
+            try:
+                load_rows_infile(cursor, table, columns, rows)
+            except Error as e:
+                if e.errno not in LOAD_DATA_REFUSED:
+                    raise
+                print("  ⚠️  LOAD DATA LOCAL INFILE is disabled; falling back to multi-row INSERT")
+                method = 'insert'
+                load_rows_insert(cursor, table, columns, rows)
+        else:
+            load_rows_insert(cursor, table, columns, rows)
+        conn.commit()
+        total += len(rows)
+    cursor.close()
+    return total, method
+
+def insert_synthetic_data(conn, cfg, fast_load=False):
+    """Generate and insert synthetic data chunk by chunk"""
+    print(f"\n🧪 Generating synthetic data (seed {cfg['seed']}, {cfg['users']:,} users, {cfg['media']:,} media)...")
+    method = 'insert'
+    if fast_load:
+        method = 'infile'
+        cursor = conn.cursor()
+        cursor.execute("SET SESSION unique_checks = 0")
+        cursor.execute("SET SESSION foreign_key_checks = 0")
+        cursor.close()
+    grand_total = 0
+    started = time.perf_counter()
+    for table, columns, _, _, _ in SYNTHETIC_TABLES:
+        table_started = time.perf_counter()
+        total, method = load_synthetic_table(conn, cfg, table, columns, method)
+        elapsed = time.perf_counter() - table_started
+        grand_total += total
+        print(f"  ✅ {table:<22} {total:>12,} rows  ({total / elapsed if elapsed else 0:,.0f} rows/sec)")
+    if fast_load:
+        cursor = conn.cursor()
+        cursor.execute("SET SESSION unique_checks = 1")
+        cursor.execute("SET SESSION foreign_key_checks = 1")
+        cursor.close()
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ {grand_total:,} synthetic rows inserted in {elapsed:.1f}s")
+
+# Per-process state of a parallel load worker
+_worker = {}
+
+# Deadlock / lock wait timeout from concurrent inserts into the same table
+RETRYABLE_ERRORS = (1205, 1213)
+
+def _init_load_worker(cfg, fast_load, db_config):
+    """Open the worker's own connection once per process"""
+    # db_config comes in initargs: under spawn/forkserver the worker has no cached password and no terminal to prompt on
+    conn = get_connection(use_database=True, allow_local_infile=fast_load, db_config=db_config)
+    if conn and fast_load:
+        cursor = conn.cursor()
+        cursor.execute("SET SESSION unique_checks = 0")
+        cursor.execute("SET SESSION foreign_key_checks = 0")
+        cursor.close()
+    _worker.update(conn=conn, cfg=cfg, method='infile' if fast_load else 'insert')
+
+def _load_block(table, lo, hi):
+    """Generate and load one block inside a worker, returning (table, rows)"""
+    conn, cfg = _worker['conn'], _worker['cfg']
+    if conn is None:
+        raise RuntimeError("worker could not connect to the database")
+    columns = next(t for t in SYNTHETIC_TABLES if t[0] == table)[1]
+    rows = generate_block(cfg, table, lo, hi)
+    if not rows:
+        return table, 0
+    cursor = conn.cursor()
+    for attempt in range(3):
+        try:
+            if _worker['method'] == 'infile':
+                try:
+                    load_rows_infile(cursor, table, columns, rows)
+                except Error as e:
+                    if e.errno not in LOAD_DATA_REFUSED:
+                        raise
+                    _worker['method'] = 'insert'
+                    load_rows_insert(cursor, table, columns, rows)
+            else:
+                load_rows_insert(cursor, table, columns, rows)
+            conn.commit()
+            break
+        except Error as e:
+            conn.rollback()
+            if e.errno not in RETRYABLE_ERRORS or attempt == 2:
+                raise
+    cursor.close()
+    return table, len(rows)
+
+def insert_synthetic_data_parallel(cfg, workers, fast_load=False):
+    """Load synthetic data with a process pool, one FK level at a time"""
+    print(f"\n🧪 Generating synthetic data with {workers} workers "
+          f"(seed {cfg['seed']}, {cfg['users']:,} users, {cfg['media']:,} media)...")
+    grand_total = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_load_worker,
+                             initargs=(cfg, fast_load, load_secrets())) as pool:
+        for depth, tables in enumerate(synthetic_levels()):
+            print(f"  📚 Level {depth}: {', '.join(tables)}")
+            level_started = time.perf_counter()
+            totals = {table: 0 for table in tables}
+            finished = {}
+            pending = {table: 0 for table in tables}
+            futures = []
+            for table in tables:
+                for lo, hi in synthetic_blocks(cfg, table):
+                    futures.append(pool.submit(_load_block, table, lo, hi))
+                    pending[table] += 1
+            # Children only start once every block of this level is committed
+            for future in as_completed(futures):
+                table, rows = future.result()
+                totals[table] += rows
+                pending[table] -= 1
+                if pending[table] == 0:
+                    finished[table] = time.perf_counter() - level_started
+            for table in tables:
+                elapsed = finished.get(table, 0)
+                total = totals[table]
+                grand_total += total
+                print(f"    ✅ {table:<22} {total:>12,} rows  ({total / elapsed if elapsed else 0:,.0f} rows/sec)")
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ {grand_total:,} synthetic rows inserted in {elapsed:.1f}s")
+
 def display_statistics(conn):
     """Display database statistics"""
     cursor = conn.cursor()
@@ -840,8 +1471,50 @@ def display_statistics(conn):
     
     cursor.close()
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Reset and seed the StreamSync database")
+    parser.add_argument('--synthetic', action='store_true',
+                        help="seed with the scalable synthetic generator instead of the curated dataset")
+    parser.add_argument('--fast-load', action='store_true',
+                        help="synthetic mode: load with LOAD DATA LOCAL INFILE and build indexes/FKs afterwards")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="synthetic mode: number of loader processes (one connection each)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="multiplier for users, media, people and activity rows (synthetic mode)")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--users', type=int)
+    parser.add_argument('--media', type=int)
+    parser.add_argument('--people', type=int)
+    parser.add_argument('--series-fraction', type=float)
+    parser.add_argument('--episodes-per-series', type=int)
+    parser.add_argument('--reviews-per-user', type=float)
+    parser.add_argument('--friends-per-user', type=float)
+    parser.add_argument('--playlists-per-user', type=float)
+    parser.add_argument('--items-per-playlist', type=float)
+    parser.add_argument('--watchlist-per-user', type=float)
+    parser.add_argument('--series-per-user', type=float)
+    parser.add_argument('--activity-rows', type=int)
+    parser.add_argument('--zipf-exponent', type=float)
+    parser.add_argument('--chunk-size', type=int)
+    args = parser.parse_args(argv)
+    if args.fast_load and not args.synthetic:
+        parser.error("--fast-load requires --synthetic")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and not args.synthetic:
+        parser.error("--workers requires --synthetic")
+    return args
+
+def scale_config_from_args(args):
+    """Build a synthetic data config from parsed arguments"""
+    overrides = {key: getattr(args, key) for key in SCALE_DEFAULTS}
+    return build_scale_config(args.scale, **overrides)
+
+def main(argv=None):
     """Main execution function"""
+    args = parse_args(argv)
+    scale_cfg = scale_config_from_args(args) if args.synthetic else None
     print("\n" + "="*60)
     print("  🎬 STREAMSYNC DATABASE SETUP UTILITY 🎬")
     print("="*60)
@@ -860,17 +1533,28 @@ def main():
     conn.close()
     
     # Reconnect with database selected
-    conn = get_connection(use_database=True)
+    conn = get_connection(use_database=True, allow_local_infile=args.fast_load)
     if not conn:
         print("❌ Failed to reconnect to database!")
         return
     
     try:
         # Create tables
-        create_tables(conn)
+        deferred = create_tables(conn, defer_constraints=args.fast_load)
         
         # Insert data
-        insert_comprehensive_data(conn)
+        if scale_cfg:
+            if args.workers > 1:
+                insert_synthetic_data_parallel(scale_cfg, args.workers, fast_load=args.fast_load)
+            else:
+                insert_synthetic_data(conn, scale_cfg, fast_load=args.fast_load)
+            if deferred:
+                build_deferred_constraints(conn, deferred)
+        else:
+            insert_comprehensive_data(conn)
+        
+        # Bring the fresh baseline up to the latest migration and stamp schema_version
+        apply_migrations(conn)
         
         # Display statistics
         display_statistics(conn)
@@ -879,7 +1563,11 @@ def main():
         print("\n💡 You can now use the database with:")
         print("   - Username: admin, Password: admin123 (Admin)")
         print("   - Username: moderator, Password: mod123 (Moderator)")
-        print("   - Username: user001-user150, Password: password001-password150 (Users)")
+        if scale_cfg:
+            last_user = scale_cfg['users']
+            print(f"   - Username: user001-user{last_user:03d}, Password: password001-password{last_user:03d} (Users)")
+        else:
+            print("   - Username: user001-user150, Password: password001-password150 (Users)")
         
     except Error as e:
         print(f"\n❌ Error during setup: {e}")